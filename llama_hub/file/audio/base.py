@@ -3,24 +3,126 @@
 A transcriber for the audio of mp3, mp4 files.
 
 """
+import json
+import multiprocessing
+import weakref
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.file.model_registry import get_or_load
+
+# Sample rate of the audio decoded by whisper.
+SAMPLE_RATE = 16000
+# Length in seconds of the segments long audio is split into when
+# transcribing with several worker processes.
+DEFAULT_CHUNK_LENGTH = 600.0
+# Length in seconds of the frames the audio energy is measured on.
+FRAME_LENGTH = 0.02
+
+# The whisper model loaded once per worker process of the transcription pool.
+_worker_model: Any = None
+
+
+def _load_whisper_model(model_version: str) -> Any:
+    """Load a whisper model once per process."""
+    import whisper
+
+    return get_or_load(
+        ("whisper", model_version), lambda: whisper.load_model(model_version)
+    )
+
+
+def _init_worker(model_version: str) -> None:
+    """Load the whisper model in a worker process of the transcription pool."""
+    global _worker_model
+    _worker_model = _load_whisper_model(model_version)
+
+
+def _transcribe_in_worker(audio: Any) -> Dict[str, Any]:
+    """Transcribe a chunk of audio inside a worker process."""
+    return _worker_model.transcribe(audio)
+
+
+def _find_split_points(
+    audio: Any, chunk_length: float, search_length: Optional[float] = None
+) -> List[int]:
+    """Find sample offsets splitting audio into chunks at its quietest points.
+
+    Every chunk is at most `chunk_length` seconds long. Each split is placed
+    at the frame with the lowest smoothed energy in the last `search_length`
+    seconds (by default a tenth) of the chunk, so words are rarely cut.
+
+    Returns:
+        List[int]: Sample offsets of the chunk boundaries, starting with 0 and
+            ending with the length of the audio.
+    """
+    import numpy as np
+
+    frame_size = int(FRAME_LENGTH * SAMPLE_RATE)
+    num_frames = len(audio) // frame_size
+    if num_frames == 0:
+        # shorter than one frame, nothing to split
+        return [0, len(audio)]
+    chunk_frames = max(1, int(chunk_length / FRAME_LENGTH))
+    if search_length is None:
+        search_length = chunk_length / 10
+    search_frames = max(1, int(search_length / FRAME_LENGTH))
+
+    # mean energy of every frame, smoothed over about half a second
+    energy = np.square(audio[: num_frames * frame_size].reshape(-1, frame_size))
+    energy = energy.mean(axis=1)
+    window = max(1, int(0.5 / FRAME_LENGTH))
+    energy = np.convolve(energy, np.ones(window) / window, mode="same")
+
+    splits = [0]
+    while num_frames - splits[-1] > chunk_frames:
+        end = splits[-1] + chunk_frames
+        start = max(splits[-1] + 1, end - search_frames)
+        # latest quietest frame, so chunks without silence stay full length
+        splits.append(end - int(np.argmin(energy[start : end + 1][::-1])))
+
+    return [split * frame_size for split in splits] + [len(audio)]
+
 
 class AudioTranscriber(BaseReader):
     """Audio parser.
 
     Extract text from transcript of video/audio files using OpenAI Whisper.
 
+    Args:
+        model_version (str): Whisper model to use. Models are loaded on first
+            use, once per process, and shared between transcribers.
+            Default is "base".
+        num_workers (Optional[int]): Number of worker processes transcribing
+            chunks of the audio in parallel. Audio is transcribed in the
+            current process when None or 1. The pool is started on first use
+            and reused until `close` is called or the transcriber is garbage
+            collected.
+        chunk_length (Optional[float]): Length in seconds of the chunks long
+            audio is split into, at silences. Defaults to
+            DEFAULT_CHUNK_LENGTH when `num_workers` is set, otherwise the
+            audio is transcribed in a single call.
+        return_segments (bool): Whether to store the start, end and text of
+            every transcribed segment, as a JSON list, in the "segments"
+            metadata field. The field is excluded from the text sent to LLMs
+            and embedding models. Default is False.
     """
 
-    def __init__(self, *args: Any, model_version: str = "base", **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        model_version: str = "base",
+        num_workers: Optional[int] = None,
+        chunk_length: Optional[float] = None,
+        return_segments: bool = False,
+        **kwargs: Any,
+    ) -> None:
         """Init params."""
         try:
-            import whisper
+            import whisper  # noqa: F401
         except ImportError:
             raise ImportError(
                 "Missing required package: whisper\n"
@@ -29,10 +131,85 @@ class AudioTranscriber(BaseReader):
 
         super().__init__(*args, **kwargs)
         self._model_version = model_version
+        self._num_workers = num_workers
+        self._chunk_length = chunk_length
+        if chunk_length is None and num_workers is not None and num_workers > 1:
+            self._chunk_length = DEFAULT_CHUNK_LENGTH
+        self._return_segments = return_segments
+        self._parser_config: Optional[Dict[str, Any]] = None
+        self._pool: Any = None
+        self._pool_finalizer: Optional[weakref.finalize] = None
+
+    @property
+    def parser_config(self) -> Dict[str, Any]:
+        """Config holding the whisper model, loaded on first use."""
+        if self._parser_config is None:
+            self._parser_config = {"model": _load_whisper_model(self._model_version)}
+        return self._parser_config
+
+    @parser_config.setter
+    def parser_config(self, parser_config: Dict[str, Any]) -> None:
+        self._parser_config = parser_config
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the worker pool cannot be pickled
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_pool_finalizer"] = None
+        return state
+
+    def __enter__(self) -> "AudioTranscriber":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
 
-        model = whisper.load_model(self._model_version)
+    def _get_pool(self) -> Any:
+        """Get the worker pool, starting it on first use."""
+        if self._pool is None:
+            ctx = multiprocessing.get_context("spawn")
+            self._pool = ctx.Pool(
+                processes=self._num_workers,
+                initializer=_init_worker,
+                initargs=(self._model_version,),
+            )
+            # stop the workers if the transcriber is dropped without `close`
+            self._pool_finalizer = weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    def close(self) -> None:
+        """Stop the worker pool transcribing chunks."""
+        if self._pool is not None:
+            if self._pool_finalizer is not None:
+                self._pool_finalizer.detach()
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pool_finalizer = None
+
+    def _transcribe_chunks(self, file: Path) -> List[Tuple[float, Dict[str, Any]]]:
+        """Transcribe the audio of a file in chunks split at silences.
+
+        Returns:
+            List[Tuple[float, Dict[str, Any]]]: The offset in seconds and the
+                whisper result of every chunk, in order.
+        """
+        import whisper
+
+        audio = whisper.load_audio(str(file))
+        splits = _find_split_points(audio, cast(float, self._chunk_length))
+        chunks = [audio[start:end] for start, end in zip(splits, splits[1:])]
+        offsets = [start / SAMPLE_RATE for start in splits[:-1]]
 
-        self.parser_config = {"model": model}
+        if self._num_workers is None or self._num_workers <= 1 or len(chunks) <= 1:
+            model = cast(whisper.Whisper, self.parser_config["model"])
+            return [
+                (offset, model.transcribe(chunk))
+                for offset, chunk in zip(offsets, chunks)
+            ]
+
+        pool = self._get_pool()
+        return list(zip(offsets, pool.map(_transcribe_in_worker, chunks, 1)))
 
     def load_data(
         self, file: Path, extra_info: Optional[Dict] = None
@@ -53,9 +230,35 @@ class AudioTranscriber(BaseReader):
             # export file
             audio.export(file_str, format="mp3")
 
-        model = cast(whisper.Whisper, self.parser_config["model"])
-        result = model.transcribe(str(file))
+        if self._chunk_length is not None:
+            results = self._transcribe_chunks(file)
+        else:
+            model = cast(whisper.Whisper, self.parser_config["model"])
+            results = [(0.0, model.transcribe(str(file)))]
 
-        transcript = result["text"]
+        # stitch the chunks back together
+        transcript = "".join(result["text"] for _, result in results)
+        if not self._return_segments:
+            return [Document(text=transcript, extra_info=extra_info or {})]
 
-        return [Document(text=transcript, extra_info=extra_info or {})]
+        # shift the segments by the offset of their chunk
+        segments = [
+            {
+                "start": round(offset + segment["start"], 2),
+                "end": round(offset + segment["end"], 2),
+                "text": segment["text"],
+            }
+            for offset, result in results
+            for segment in result.get("segments", [])
+        ]
+        # a string keeps the metadata flat, as vector stores require
+        metadata = dict(extra_info or {})
+        metadata["segments"] = json.dumps(segments)
+        return [
+            Document(
+                text=transcript,
+                extra_info=metadata,
+                excluded_llm_metadata_keys=["segments"],
+                excluded_embed_metadata_keys=["segments"],
+            )
+        ]
@@ -1,8 +1,26 @@
 """Simple reader that reads files of different formats from a directory."""
 
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
+from collections import deque
+from fnmatch import fnmatch
+from itertools import islice
+from multiprocessing.pool import AsyncResult
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.download import download_loader
@@ -27,6 +45,93 @@ DEFAULT_FILE_EXTRACTOR: Dict[str, str] = {
     ".json": "JSONReader",
 }
 
+MANIFEST_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+# Per-process state used by the ``num_workers`` pool. Every worker process gets
+# its own copy of the file extractor and resolves each reader at most once.
+_worker_file_extractor: Dict[str, Union[str, BaseReader]] = {}
+_worker_readers: Dict[str, BaseReader] = {}
+
+
+def _resolve_reader(reader: Union[str, BaseReader]) -> BaseReader:
+    """Turn a reader name from the file extractor into a reader instance."""
+    if isinstance(reader, str):
+        try:
+            from llama_hub.utils import import_loader
+
+            return import_loader(reader)()
+        except ImportError:
+            return download_loader(reader)()
+    return reader
+
+
+def _get_reader(
+    suffix: str,
+    file_extractor: Dict[str, Union[str, BaseReader]],
+    readers: Dict[str, BaseReader],
+) -> Optional[BaseReader]:
+    """Get the reader for a file extension, or None to read it as plain text.
+
+    Readers given by name are instantiated once and memoized in ``readers``,
+    keyed by name, so extensions mapped to the same reader share one instance.
+    """
+    reader = file_extractor.get(suffix)
+    if not isinstance(reader, str):
+        return reader
+    if reader not in readers:
+        readers[reader] = _resolve_reader(reader)
+    return readers[reader]
+
+
+def _init_worker(file_extractor: Dict[str, Union[str, BaseReader]]) -> None:
+    """Initialize a worker process of the parsing pool."""
+    global _worker_file_extractor, _worker_readers
+    _worker_file_extractor = file_extractor
+    _worker_readers = {}
+
+
+def _load_file_in_worker(
+    task: Tuple[Path, Optional[Dict], str]
+) -> Tuple[List[Document], Optional[str]]:
+    """Parse a single file inside a worker process.
+
+    Exceptions are caught and returned as a string so that one bad file does
+    not take down the whole pool.
+    """
+    input_file, metadata, errors = task
+    try:
+        reader = _get_reader(input_file.suffix, _worker_file_extractor, _worker_readers)
+        return _load_file(input_file, reader, metadata, errors), None
+    except Exception as e:
+        return [], f"{type(e).__name__}: {e}"
+
+
+def _hash_file(input_file: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the sha256 digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(input_file, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_file(
+    input_file: Path,
+    reader: Optional[BaseReader],
+    metadata: Optional[Dict],
+    errors: str,
+) -> List[Document]:
+    """Load a single file with the given reader, or as plain text."""
+    if reader is not None:
+        return reader.load_data(file=input_file, extra_info=metadata)
+
+    # do standard read
+    with open(input_file, "r", errors=errors) as f:
+        data = f.read()
+    return [Document(text=data, extra_info=metadata or {})]
+
 
 class SimpleDirectoryReader(BaseReader):
     """Simple directory reader.
@@ -51,6 +156,24 @@ class SimpleDirectoryReader(BaseReader):
         file_metadata (Optional[Callable[str, Dict]]): A function that takes
             in a filename and returns a Dict of metadata for the Document.
             Default is None.
+        num_workers (Optional[int]): Number of worker processes used to parse
+            files in parallel. Files are parsed serially when None or 1.
+            Default is None.
+        manifest_path (Optional[str]): Path of a JSON manifest recording the
+            size and mtime of every file that was loaded. When set, `load_data`
+            only parses files that are new or modified since the previous run,
+            and the paths that disappeared are reported in `deleted_files`.
+            Default is None.
+        manifest_hash (bool): Whether to also record a sha256 content hash in
+            the manifest. Files whose size or mtime changed but whose content
+            did not are then skipped. False by default.
+        include (Optional[List[str]]): Glob patterns a file must match to be
+            loaded, e.g. ["*.md", "docs/*"]. Patterns are matched against the
+            path relative to `input_dir` and against the file name.
+            Default is None.
+        exclude (Optional[List[str]]): Glob patterns of files and directories
+            to skip, matched like `include`. Excluded directories are not
+            descended into. Default is None.
     """
 
     def __init__(
@@ -63,6 +186,11 @@ class SimpleDirectoryReader(BaseReader):
         file_extractor: Optional[Dict[str, Union[str, BaseReader]]] = None,
         num_files_limit: Optional[int] = None,
         file_metadata: Optional[Callable[[str], Dict]] = None,
+        num_workers: Optional[int] = None,
+        manifest_path: Optional[str] = None,
+        manifest_hash: bool = False,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
     ) -> None:
         """Initialize with parameters."""
         super().__init__()
@@ -73,36 +201,76 @@ class SimpleDirectoryReader(BaseReader):
         self.exclude_hidden = exclude_hidden
         self.required_exts = required_exts
         self.num_files_limit = num_files_limit
+        self.include = include
+        self.exclude = exclude
 
         self.input_files = self._add_files(self.input_dir)
         self.file_extractor = file_extractor or DEFAULT_FILE_EXTRACTOR
         self.file_metadata = file_metadata
+        self.num_workers = num_workers
+        self.failed_files: Dict[str, str] = {}
+        # reader instances resolved from reader names, kept for the lifetime
+        # of this reader so models and imports are only loaded once
+        self._readers: Dict[str, BaseReader] = {}
+
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.manifest_hash = manifest_hash
+        self.deleted_files: List[str] = []
+
+    def _is_excluded(self, rel_path: str, name: str) -> bool:
+        """Check a path against the exclude glob patterns."""
+        return any(
+            fnmatch(rel_path, pattern) or fnmatch(name, pattern)
+            for pattern in self.exclude or []
+        )
+
+    def _is_included(self, rel_path: str, name: str) -> bool:
+        """Check a file against the include glob patterns."""
+        if self.include is None:
+            return True
+        return any(
+            fnmatch(rel_path, pattern) or fnmatch(name, pattern)
+            for pattern in self.include
+        )
+
+    def _walk_files(self, input_dir: Path, rel_dir: str = "") -> Iterator[Path]:
+        """Yield the files of a directory tree in sorted, depth-first order.
+
+        Uses ``os.scandir`` so the file type of each entry comes from the
+        directory listing, and prunes hidden and excluded directories before
+        descending into them.
+        """
+        with os.scandir(input_dir) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
 
-    def _add_files(self, input_dir: Path) -> List[Path]:
-        """Add files."""
-        input_files = sorted(input_dir.iterdir())
-        new_input_files = []
         dirs_to_explore = []
-        for input_file in input_files:
-            if self.exclude_hidden and input_file.stem.startswith("."):
+        for entry in entries:
+            if self.exclude_hidden and entry.name.startswith("."):
                 continue
-            elif input_file.is_dir():
+            rel_path = rel_dir + entry.name
+            if self._is_excluded(rel_path, entry.name):
+                continue
+            if entry.is_dir():
                 if self.recursive:
-                    dirs_to_explore.append(input_file)
+                    dirs_to_explore.append((entry, rel_path))
             elif (
                 self.required_exts is not None
-                and input_file.suffix not in self.required_exts
+                and os.path.splitext(entry.name)[1] not in self.required_exts
             ):
                 continue
-            else:
-                new_input_files.append(input_file)
+            elif self._is_included(rel_path, entry.name):
+                yield input_dir / entry.name
 
-        for dir_to_explore in dirs_to_explore:
-            sub_input_files = self._add_files(dir_to_explore)
-            new_input_files.extend(sub_input_files)
+        for entry, rel_path in dirs_to_explore:
+            yield from self._walk_files(input_dir / entry.name, rel_path + "/")
 
+    def _add_files(self, input_dir: Path) -> List[Path]:
+        """Add files."""
+        files = self._walk_files(input_dir)
         if self.num_files_limit is not None and self.num_files_limit > 0:
-            new_input_files = new_input_files[0 : self.num_files_limit]
+            # stop walking as soon as the limit is reached
+            files = islice(files, self.num_files_limit)
+        new_input_files = list(files)
 
         # print total number of files added
         logging.debug(
@@ -111,46 +279,205 @@ class SimpleDirectoryReader(BaseReader):
 
         return new_input_files
 
-    def load_data(self) -> List[Document]:
-        """Load data from the input directory.
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Load the file manifest, or return an empty one."""
+        if self.manifest_path is None or not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path, "r") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MANIFEST_VERSION:
+            logger.warning(
+                f"Ignoring manifest {self.manifest_path} with unknown version."
+            )
+            return {}
+        return manifest["files"]
 
-        Args:
-            concatenate (bool): whether to concatenate all files into one document.
-                If set to True, file metadata is ignored.
-                False by default.
+    def _save_manifest(self, files: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically write the file manifest."""
+        assert self.manifest_path is not None
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"version": MANIFEST_VERSION, "files": files}, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _get_changed_files(
+        self, manifest: Dict[str, Dict[str, Any]]
+    ) -> Tuple[List[Path], Dict[str, Dict[str, Any]]]:
+        """Compare the input files against the manifest.
 
         Returns:
-            List[Document]: A list of documents.
+            Tuple[List[Path], Dict[str, Dict[str, Any]]]: The files that are new
+                or modified, and the up-to-date manifest entries of all
+                input files.
+        """
+        changed_files = []
+        entries = {}
+        for input_file in self.input_files:
+            stat = input_file.stat()
+            entry: Dict[str, Any] = {"size": stat.st_size, "mtime": stat.st_mtime}
+            previous = manifest.get(str(input_file))
+            if (
+                previous is not None
+                and previous["size"] == entry["size"]
+                and previous["mtime"] == entry["mtime"]
+            ):
+                if self.manifest_hash and "hash" not in previous:
+                    previous = {**previous, "hash": _hash_file(input_file)}
+                entries[str(input_file)] = previous
+                continue
+
+            if self.manifest_hash:
+                entry["hash"] = _hash_file(input_file)
+                if previous is not None and previous.get("hash") == entry["hash"]:
+                    entries[str(input_file)] = entry
+                    continue
+
+            entries[str(input_file)] = entry
+            changed_files.append(input_file)
+        return changed_files, entries
 
+    def _iter_files_parallel(
+        self, input_files: List[Path], num_workers: int
+    ) -> Iterator[Tuple[Path, List[Document]]]:
+        """Parse the given files across a pool of worker processes.
+
+        Results are yielded in the order of ``input_files`` as soon as they are
+        available. At most two files per worker are in flight at any time, so
+        memory stays bounded even if the consumer is slower than the pool.
+        Files that fail to parse are logged, recorded in ``self.failed_files``
+        and skipped.
         """
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(
+            processes=num_workers,
+            initializer=_init_worker,
+            initargs=(dict(self.file_extractor),),
+        ) as pool:
+            pending: Deque[Tuple[Path, AsyncResult]] = deque()
+            files = iter(input_files)
+            while True:
+                while len(pending) < 2 * num_workers:
+                    input_file = next(files, None)
+                    if input_file is None:
+                        break
+                    metadata = None
+                    if self.file_metadata is not None:
+                        metadata = self.file_metadata(str(input_file))
+                    task = (input_file, metadata, self.errors)
+                    pending.append(
+                        (input_file, pool.apply_async(_load_file_in_worker, (task,)))
+                    )
+                if not pending:
+                    break
 
-        documents = []
-        for input_file in self.input_files:
+                input_file, result = pending.popleft()
+                file_documents, error = result.get()
+                if error is not None:
+                    logger.warning(f"Failed to load file {input_file}: {error}")
+                    self.failed_files[str(input_file)] = error
+                    continue
+                yield input_file, file_documents
+
+    def _iter_files(
+        self, input_files: List[Path], num_workers: Optional[int]
+    ) -> Iterator[Tuple[Path, List[Document]]]:
+        """Parse the given files one by one, serially or in a worker pool."""
+        if num_workers is not None and num_workers > 1 and len(input_files) > 1:
+            yield from self._iter_files_parallel(input_files, num_workers)
+            return
+
+        for input_file in input_files:
             metadata = None
             if self.file_metadata is not None:
                 metadata = self.file_metadata(str(input_file))
 
-            if input_file.suffix in self.file_extractor:
-                reader = self.file_extractor[input_file.suffix]
-
-                if isinstance(reader, str):
-                    try:
-                        from llama_hub.utils import import_loader
-
-                        reader = import_loader(reader)()
-                    except ImportError:
-                        reader = download_loader(reader)()
-
-                extracted_documents = reader.load_data(
-                    file=input_file, extra_info=metadata
-                )
-                documents.extend(extracted_documents)
-            else:
-                data = ""
-                # do standard read
-                with open(input_file, "r", errors=self.errors) as f:
-                    data = f.read()
-                document = Document(text=data, extra_info=metadata or {})
-                documents.append(document)
+            reader = _get_reader(input_file.suffix, self.file_extractor, self._readers)
+            yield input_file, _load_file(input_file, reader, metadata, self.errors)
+
+    def _iter_file_documents(
+        self, num_workers: Optional[int]
+    ) -> Iterator[List[Document]]:
+        """Yield the documents of each file that needs to be loaded.
+
+        If a manifest is configured, only new or modified files are parsed,
+        paths recorded in the manifest that no longer exist are stored in
+        ``self.deleted_files``, and the manifest is updated once every file
+        has been processed.
+        """
+        num_workers = num_workers or self.num_workers
+        self.failed_files = {}
+        if self.manifest_path is None:
+            for _, file_documents in self._iter_files(self.input_files, num_workers):
+                yield file_documents
+            return
+
+        manifest = self._load_manifest()
+        input_files, entries = self._get_changed_files(manifest)
+        self.deleted_files = sorted(set(manifest) - set(entries))
+
+        for _, file_documents in self._iter_files(input_files, num_workers):
+            yield file_documents
+
+        # failed files are left out so they are retried on the next run
+        for failed_file in self.failed_files:
+            entries.pop(failed_file, None)
+            if failed_file in manifest:
+                entries[failed_file] = manifest[failed_file]
+        self._save_manifest(entries)
 
+    def iter_data(
+        self, num_workers: Optional[int] = None, batch_size: Optional[int] = None
+    ) -> Iterator[List[Document]]:
+        """Lazily load data from the input directory.
+
+        Only the documents of the files being yielded are held in memory, so
+        downstream processing can start before the whole directory is parsed.
+        With a manifest configured, it is only updated once the iterator is
+        exhausted.
+
+        Args:
+            num_workers (Optional[int]): Number of worker processes to parse
+                files with. Overrides the value given at initialization.
+            batch_size (Optional[int]): Number of documents per yielded list.
+                If None, the documents of one file are yielded at a time.
+
+        Yields:
+            List[Document]: The documents of one file, or a batch of documents.
+
+        """
+        if batch_size is None:
+            yield from self._iter_file_documents(num_workers)
+            return
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        batch: List[Document] = []
+        for file_documents in self._iter_file_documents(num_workers):
+            batch.extend(file_documents)
+            while len(batch) >= batch_size:
+                yield batch[:batch_size]
+                batch = batch[batch_size:]
+        if batch:
+            yield batch
+
+    def load_data(self, num_workers: Optional[int] = None) -> List[Document]:
+        """Load data from the input directory.
+
+        If a manifest is configured, only new or modified files are parsed,
+        paths recorded in the manifest that no longer exist are stored in
+        ``self.deleted_files``, and the manifest is updated afterwards.
+
+        Args:
+            num_workers (Optional[int]): Number of worker processes to parse
+                files with. Overrides the value given at initialization.
+
+        Returns:
+            List[Document]: A list of documents.
+
+        """
+        documents = []
+        for file_documents in self._iter_file_documents(num_workers):
+            documents.extend(file_documents)
         return documents
@@ -6,6 +6,8 @@ from typing import Any, Dict, List, Optional
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.file.extraction_cache import ExtractionCache
+
 
 class CJKPDFReader(BaseReader):
     """CJK PDF reader.
@@ -16,12 +18,21 @@ class CJKPDFReader(BaseReader):
         concat_pages (bool): whether to concatenate all pages into one document.
             If set to False, a Document will be created for each page.
             True by default.
+        cache (Optional[ExtractionCache]): Cache of extracted pages, keyed by
+            file content. Default is None.
     """
 
-    def __init__(self, *args: Any, concat_pages: bool = True, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        concat_pages: bool = True,
+        cache: Optional[ExtractionCache] = None,
+        **kwargs: Any
+    ) -> None:
         """Init params."""
         super().__init__(*args, **kwargs)
         self._concat_pages = concat_pages
+        self._cache = cache
 
     # Define a function to extract text from PDF
     def _extract_text_by_page(self, pdf_path: Path) -> List[str]:
@@ -67,8 +78,20 @@ class CJKPDFReader(BaseReader):
         self, file: Path, extra_info: Optional[Dict] = None
     ) -> List[Document]:
         """Parse file."""
+        text_list = None
+        cache_key = None
+        if self._cache is not None:
+            cache_key = self._cache.make_key(file, "CJKPDFReader")
+            cached_pages = self._cache.get(cache_key)
+            if cached_pages is not None:
+                text_list = [cached_page["text"] for cached_page in cached_pages]
 
-        text_list = self._extract_text_by_page(file)
+        if text_list is None:
+            text_list = self._extract_text_by_page(file)
+            if self._cache is not None and cache_key is not None:
+                self._cache.put(
+                    cache_key, [{"text": text, "metadata": {}} for text in text_list]
+                )
 
         if self._concat_pages:
             return [Document(text="\n".join(text_list), extra_info=extra_info or {})]
@@ -0,0 +1,164 @@
+"""On-disk cache of extracted file content, shared by the file readers."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+CACHE_VERSION = 1
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+
+class ExtractionCache:
+    """Content-addressed cache of per-page extraction results.
+
+    Entries are keyed by the sha256 of the file content, the name of the
+    reader and the reader options that affect extraction, so the same file
+    found under a different path is still a cache hit. Each entry is a JSON
+    file holding a list of pages, each with its text and metadata. When the
+    total size exceeds `max_size`, the least recently used entries are evicted
+    until the cache fills 90% of it.
+
+    Args:
+        cache_dir (Union[str, Path]): Directory to store the cache entries in.
+        max_size (int): Maximum total size of the cache in bytes.
+            Default is 1 GiB.
+    """
+
+    def __init__(
+        self, cache_dir: Union[str, Path], max_size: int = DEFAULT_MAX_SIZE
+    ) -> None:
+        """Initialize with parameters."""
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        # total size of the entries, counted on first write
+        self._size: Optional[int] = None
+
+    def make_key(
+        self,
+        file: Union[IO[bytes], str, Path],
+        reader: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build the cache key of a file read by a reader with some options.
+
+        Byte streams are read to the end and rewound afterwards.
+        """
+        digest = hashlib.sha256()
+        if isinstance(file, (str, Path)):
+            with open(file, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        else:
+            position = file.tell()
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+            file.seek(position)
+
+        return self.make_digest_key(digest.hexdigest(), reader, options)
+
+    def make_digest_key(
+        self,
+        content_digest: str,
+        reader: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build the cache key of content already identified by a digest.
+
+        Saves reading content again when its reader already hashed it, e.g.
+        the sha1 python-pptx computes for every image.
+        """
+        return hashlib.sha256(
+            json.dumps(
+                [CACHE_VERSION, content_digest, reader, options or {}],
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Get the cached pages of a key, or None on a cache miss."""
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                pages = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        # mark the entry as recently used
+        try:
+            os.utime(entry_path)
+        except FileNotFoundError:
+            pass
+        return pages
+
+    def put(self, key: str, pages: List[Dict[str, Any]]) -> None:
+        """Store the pages of a key and evict old entries if needed.
+
+        Args:
+            key (str): Key from `make_key`.
+            pages (List[Dict[str, Any]]): One dict per page with a "text" and
+                a "metadata" field.
+        """
+        self.put_many([(key, pages)])
+
+    def put_many(self, entries: Iterable[Tuple[str, List[Dict[str, Any]]]]) -> None:
+        """Store the pages of many keys, evicting old entries at most once.
+
+        Args:
+            entries (Iterable[Tuple[str, List[Dict[str, Any]]]]): The key and
+                pages of every entry, as taken by `put`.
+        """
+        for key, pages in entries:
+            self._write(key, pages)
+        if self._size is not None and self._size > self.max_size:
+            self._evict()
+
+    def _write(self, key: str, pages: List[Dict[str, Any]]) -> None:
+        """Write an entry, keeping the total size up to date."""
+        entry_path = self._entry_path(key)
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(pages, f)
+
+        if self._size is None:
+            self._size = self._scan()[0]
+        try:
+            self._size -= entry_path.stat().st_size
+        except FileNotFoundError:
+            pass
+        self._size += tmp_path.stat().st_size
+        os.replace(tmp_path, entry_path)
+
+    def _scan(self) -> Tuple[int, List[Tuple[float, int, str]]]:
+        """Get the total size and the (mtime, size, path) of every entry."""
+        entries = []
+        total_size = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+        return total_size, entries
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits."""
+        total_size, entries = self._scan()
+        # leave some room, so the next writes do not evict again right away
+        target_size = self.max_size * 0.9
+        for _, size, path in sorted(entries):
+            if total_size <= target_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+        self._size = total_size
@@ -1,23 +1,193 @@
 """Simple reader that reads flatten PDFs."""
-import os
-import pathlib
+import multiprocessing
+import tempfile
 import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
+from typing import IO, Any, Deque, Dict, Iterator, Optional, Tuple, Union
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.file.image_batch import BatchImageReader
+
+# Zoom applied when rendering pages, for a resolution of 144 dpi.
+ZOOM = 2.0
+
+# The PDF opened once per worker process of the rendering pool.
+_worker_pdf: Any = None
+
+
+def _render_page(pdf: Any, page_number: int, image_format: str) -> bytes:
+    """Render a page of an open PDF to image bytes, "ppm" or "png"."""
+    import fitz
+
+    mat = fitz.Matrix(ZOOM, ZOOM)
+    return pdf[page_number].get_pixmap(matrix=mat).tobytes(image_format)
+
+
+def _init_worker(pdf_path: str) -> None:
+    """Open the PDF once in a worker process of the rendering pool."""
+    import fitz
+
+    global _worker_pdf
+    _worker_pdf = fitz.open(pdf_path)
+
+
+def _render_page_in_worker(page_number: int, image_format: str) -> bytes:
+    """Render a page inside a worker process."""
+    return _render_page(_worker_pdf, page_number, image_format)
+
 
 class FlatPdfReader(BaseReader):
+    """Flat PDF reader.
+
+    Renders every page to an image and reads it with an image loader.
+    Loaders built on `BatchImageReader`, like `ImageReader`, open images with
+    PIL and are given each page in memory. Any other loader is given the
+    `Path` of a PNG file, written to a temporary directory and removed once
+    the page is parsed.
+    """
+
     image_loader: BaseReader
 
-    def __init__(self, image_loader: BaseReader):
+    def __init__(self, image_loader: BaseReader, num_workers: Optional[int] = None):
         """
         :param self: Represent the instance of the class
         :param image_loader: BaseReader: Pass the image_loader object to the class
+        :param num_workers: Optional[int]: Number of worker processes rendering
+            pages and of threads running the image loader at the same time.
+            Pages are rendered and parsed one after the other when None or 1.
         :return: An object of the class
         """
         self.image_loader = image_loader
+        self.num_workers = num_workers
+
+    def _image_format(self) -> str:
+        """Format pages are rendered to for the image loader."""
+        # PIL reads uncompressed PPM from memory faster than PNG
+        return "ppm" if isinstance(self.image_loader, BatchImageReader) else "png"
+
+    def _parse_page(
+        self,
+        page_number: int,
+        image: bytes,
+        extra_info: Optional[Dict],
+        work_dir: str,
+    ) -> Document:
+        """
+        Run the image loader on a rendered page.
+
+        :param page_number: int: Zero-based number of the page
+        :param image: bytes: The page rendered in the format of `_image_format`
+        :param extra_info: Optional[Dict]: Metadata added to the document
+        :param work_dir: str: Directory the page is written to for loaders
+            that only read files
+        :return: The document of the page
+        """
+        file: Union[IO[bytes], Path]
+        if isinstance(self.image_loader, BatchImageReader):
+            file = BytesIO(image)
+        else:
+            file = Path(work_dir) / f"page-{page_number}.png"
+            file.write_bytes(image)
+        try:
+            documents = self.image_loader.load_data(file=file)
+        finally:
+            if isinstance(file, Path):
+                file.unlink()
+
+        metadata = {"page_label": str(page_number + 1)}
+        if extra_info is not None:
+            metadata.update(extra_info)
+        return Document(text=documents[0].text, extra_info=metadata)
+
+    def lazy_load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> Iterator[Document]:
+        """
+        Render and parse a PDF, yielding one document per page in page order.
+
+        With num_workers set, pages are rendered by a pool of processes while
+        the image loader runs in a pool of threads on pages already rendered.
+        Only a few pages per worker are kept in memory at any time.
+
+        :param file: Path: The file that we want to load
+        :param extra_info: Optional[Dict]: Metadata added to every document
+        :return: An iterator over the documents of the pages
+        """
+        import fitz
+
+        if not file.is_file() and file.suffix != ".pdf":
+            raise Exception("Invalid file")
+
+        image_format = self._image_format()
+        with tempfile.TemporaryDirectory(prefix="flat_pdf_") as work_dir:
+            if self.num_workers is None or self.num_workers <= 1:
+                with fitz.open(file) as pdf:
+                    for page_number in range(pdf.page_count):
+                        image = _render_page(pdf, page_number, image_format)
+                        yield self._parse_page(page_number, image, extra_info, work_dir)
+            else:
+                yield from self._iter_pages_parallel(
+                    file, extra_info, image_format, work_dir
+                )
+
+    def _iter_pages_parallel(
+        self,
+        file: Path,
+        extra_info: Optional[Dict],
+        image_format: str,
+        work_dir: str,
+    ) -> Iterator[Document]:
+        """Render pages in worker processes and parse them in threads."""
+        import fitz
+
+        with fitz.open(file) as pdf:
+            page_numbers = iter(range(pdf.page_count))
+
+        window = 2 * self.num_workers
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(
+            processes=self.num_workers,
+            initializer=_init_worker,
+            initargs=(str(file),),
+        ) as pool, ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            rendering: Deque[Tuple[int, Any]] = deque()
+            parsing: Deque[Future] = deque()
+
+            def render_next_page() -> None:
+                page_number = next(page_numbers, None)
+                if page_number is not None:
+                    rendering.append(
+                        (
+                            page_number,
+                            pool.apply_async(
+                                _render_page_in_worker, (page_number, image_format)
+                            ),
+                        )
+                    )
+
+            for _ in range(window):
+                render_next_page()
+
+            while rendering or parsing:
+                # hand rendered pages to the image loader in order
+                while rendering and len(parsing) < window:
+                    page_number, result = rendering.popleft()
+                    parsing.append(
+                        executor.submit(
+                            self._parse_page,
+                            page_number,
+                            result.get(),
+                            extra_info,
+                            work_dir,
+                        )
+                    )
+                    render_next_page()
+                yield parsing.popleft().result()
 
     def load_data(self, file: Path) -> Document:
         """
@@ -29,42 +199,14 @@ class FlatPdfReader(BaseReader):
         :param file: Path: The file that we want to load
         :return: A document object
         """
-        import shutil
-
         try:
-            if not file.is_file() and file.suffix != ".pdf":
-                raise Exception("Invalid file")
-
-            pdf_dir: Path = file
-            work_dir: str = str(
-                pathlib.Path().resolve()
-            ) + "/flat_pdf/{file_name}".format(
-                file_name=file.name.replace(file.suffix, "")
-            )
-            pdf_content: str = ""
-
-            shutil.rmtree(
-                str(pathlib.Path().resolve()) + "/flat_pdf", ignore_errors=True
-            )
-            os.makedirs(work_dir)
-
-            pdf_pages_count: int = self.convert_pdf_in_images(
-                pdf_dir=pdf_dir, work_dir=work_dir
+            pdf_content: str = "".join(
+                document.text for document in self.lazy_load_data(file)
             )
-
-            for page_number in range(0, pdf_pages_count):
-                document = self.image_loader.load_data(
-                    file=Path(work_dir + f"/page-{page_number}.png")
-                )
-                pdf_content += document[0].text
             return Document(text=pdf_content)
 
         except Exception as e:
             warnings.warn(f"{str(e)}")
-        finally:
-            shutil.rmtree(
-                str(pathlib.Path().resolve()) + "/flat_pdf", ignore_errors=True
-            )
 
     def convert_pdf_in_images(self, pdf_dir: Path, work_dir: str) -> int:
         """
@@ -76,8 +218,8 @@ class FlatPdfReader(BaseReader):
         """
         import fitz
 
-        zoom_x = 2.0  # horizontal zoom
-        zoom_y = 2.0  # vertical zoom
+        zoom_x = ZOOM  # horizontal zoom
+        zoom_y = ZOOM  # vertical zoom
         mat = fitz.Matrix(zoom_x, zoom_y)
         pages = fitz.open(pdf_dir)
         for page in pages:  # iterate through the pages
@@ -5,14 +5,13 @@ A parser for image files.
 """
 
 import re
-from pathlib import Path
-from typing import Dict, List, Optional, cast, Any
+from typing import Any, Dict, List, Optional, cast
 
-from llama_index.readers.base import BaseReader
-from llama_index.readers.schema.base import Document, ImageDocument
+from llama_hub.file.image_batch import BatchImageReader
+from llama_hub.file.model_registry import get_pretrained
 
 
-class ImageReader(BaseReader):
+class ImageReader(BatchImageReader):
     """Image parser.
 
     Extract text from images using DONUT.
@@ -38,11 +37,10 @@ class ImageReader(BaseReader):
             else:
                 from transformers import DonutProcessor, VisionEncoderDecoderModel
 
-                processor = DonutProcessor.from_pretrained(
-                    "naver-clova-ix/donut-base-finetuned-cord-v2"
-                )
-                model = VisionEncoderDecoderModel.from_pretrained(
-                    "naver-clova-ix/donut-base-finetuned-cord-v2"
+                processor, model = get_pretrained(
+                    DonutProcessor,
+                    VisionEncoderDecoderModel,
+                    "naver-clova-ix/donut-base-finetuned-cord-v2",
                 )
             parser_config = {"processor": processor, "model": model}
         self._parser_config = parser_config
@@ -50,73 +48,51 @@ class ImageReader(BaseReader):
         self._parse_text = parse_text
         self._model_kwargs = model_kwargs
 
-    def load_data(
-        self, file: Path, extra_info: Optional[Dict] = None
-    ) -> List[Document]:
-        """Parse file."""
-        from llama_index.img_utils import img_2_b64
-        from PIL import Image
-
-        # load document image
-        image = Image.open(file)
-        if image.mode != "RGB":
-            image = image.convert("RGB")
-
-        # Encode image into base64 string and keep in document
-        image_str: Optional[str] = None
-        if self._keep_image:
-            image_str = img_2_b64(image)
-
-        # Parse image into text
-        text_str: str = ""
-        if self._parse_text:
-            model = self._parser_config["model"]
-            processor = self._parser_config["processor"]
-
-            if processor:
-                import torch
-
-                device = "cuda" if torch.cuda.is_available() else "cpu"
-                model.to(device)
-
-                # prepare decoder inputs
-                task_prompt = "<s_cord-v2>"
-                decoder_input_ids = processor.tokenizer(
-                    task_prompt, add_special_tokens=False, return_tensors="pt"
-                ).input_ids
-
-                pixel_values = processor(image, return_tensors="pt").pixel_values
-
-                outputs = model.generate(
-                    pixel_values.to(device),
-                    decoder_input_ids=decoder_input_ids.to(device),
-                    max_length=model.decoder.config.max_position_embeddings,
-                    early_stopping=True,
-                    pad_token_id=processor.tokenizer.pad_token_id,
-                    eos_token_id=processor.tokenizer.eos_token_id,
-                    use_cache=True,
-                    num_beams=3,
-                    bad_words_ids=[[processor.tokenizer.unk_token_id]],
-                    return_dict_in_generate=True,
-                    **self._model_kwargs,
-                )
-
-                sequence = processor.batch_decode(outputs.sequences)[0]
-                sequence = sequence.replace(processor.tokenizer.eos_token, "").replace(
-                    processor.tokenizer.pad_token, ""
-                )
-                # remove first task start token
-                text_str = re.sub(r"<.*?>", "", sequence, count=1).strip()
-            else:
-                import pytesseract
-
-                model = cast(pytesseract, self._parser_config["model"])
-                text_str = model.image_to_string(image, **self._model_kwargs)
-
-        return [
-            ImageDocument(
-                text=text_str,
-                image=image_str,
-                extra_info=extra_info or {},
+    def _parse_images(self, images: List[Any]) -> List[str]:
+        """Parse a batch of images into text."""
+        model = self._parser_config["model"]
+        processor = self._parser_config["processor"]
+
+        if not processor:
+            import pytesseract
+
+            model = cast(pytesseract, model)
+            return [
+                model.image_to_string(image, **self._model_kwargs) for image in images
+            ]
+
+        import torch
+
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        model.to(device)
+
+        # prepare decoder inputs, one task prompt per image
+        task_prompt = "<s_cord-v2>"
+        decoder_input_ids = processor.tokenizer(
+            task_prompt, add_special_tokens=False, return_tensors="pt"
+        ).input_ids.repeat(len(images), 1)
+
+        pixel_values = processor(images, return_tensors="pt").pixel_values
+
+        outputs = model.generate(
+            pixel_values.to(device),
+            decoder_input_ids=decoder_input_ids.to(device),
+            max_length=model.decoder.config.max_position_embeddings,
+            early_stopping=True,
+            pad_token_id=processor.tokenizer.pad_token_id,
+            eos_token_id=processor.tokenizer.eos_token_id,
+            use_cache=True,
+            num_beams=3,
+            bad_words_ids=[[processor.tokenizer.unk_token_id]],
+            return_dict_in_generate=True,
+            **self._model_kwargs,
+        )
+
+        texts = []
+        for sequence in processor.batch_decode(outputs.sequences):
+            sequence = sequence.replace(processor.tokenizer.eos_token, "").replace(
+                processor.tokenizer.pad_token, ""
             )
-        ]
+            # remove first task start token
+            texts.append(re.sub(r"<.*?>", "", sequence, count=1).strip())
+        return texts
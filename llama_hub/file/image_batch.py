@@ -0,0 +1,86 @@
+"""Base class of the image readers that run a model on batches of images."""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from llama_index.readers.base import BaseReader
+from llama_index.readers.schema.base import Document, ImageDocument
+
+
+class BatchImageReader(BaseReader, ABC):
+    """Image parser running its model on batches of images.
+
+    Subclasses implement `_parse_images`, turning a list of RGB images into
+    one text per image, and set `_keep_image`.
+    """
+
+    _keep_image: bool = False
+    # whether to run the model at all, or only load the images
+    _parse_text: bool = True
+
+    def _load_image(self, file: Path) -> Tuple[Any, Optional[str]]:
+        """Load an image as RGB, with its base64 encoding if it is kept."""
+        from llama_index.img_utils import img_2_b64
+        from PIL import Image
+
+        # load document image
+        image = Image.open(file)
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
+        # Encode image into base64 string and keep in document
+        image_str: Optional[str] = None
+        if self._keep_image:
+            image_str = img_2_b64(image)
+
+        return image, image_str
+
+    @abstractmethod
+    def _parse_images(self, images: List[Any]) -> List[str]:
+        """Parse a batch of images into text."""
+
+    def load_data_batch(
+        self,
+        files: List[Path],
+        extra_infos: Optional[List[Optional[Dict]]] = None,
+        batch_size: int = 8,
+    ) -> List[Document]:
+        """Parse many files, running the model on batches of images.
+
+        Args:
+            files (List[Path]): Image files to parse.
+            extra_infos (Optional[List[Optional[Dict]]]): Metadata of the
+                document of each file. Default is no metadata.
+            batch_size (int): Number of images per model call. Default is 8.
+        """
+        if extra_infos is None:
+            extra_infos = [None] * len(files)
+
+        documents: List[Document] = []
+        for start in range(0, len(files), batch_size):
+            batch_files = files[start : start + batch_size]
+            loaded = [self._load_image(file) for file in batch_files]
+
+            # Parse images into text
+            texts = [""] * len(loaded)
+            if self._parse_text:
+                texts = self._parse_images([image for image, _ in loaded])
+
+            for (_, image_str), text_str, extra_info in zip(
+                loaded, texts, extra_infos[start : start + batch_size]
+            ):
+                documents.append(
+                    ImageDocument(
+                        text=text_str,
+                        image=image_str,
+                        extra_info=extra_info or {},
+                    )
+                )
+        return documents
+
+    def load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> List[Document]:
+        """Parse file."""
+        return self.load_data_batch([file], [extra_info])
@@ -1,11 +1,10 @@
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from llama_index.readers.base import BaseReader
-from llama_index.readers.schema.base import Document, ImageDocument
+from llama_hub.file.image_batch import BatchImageReader
+from llama_hub.file.model_registry import get_pretrained
 
 
-class ImageCaptionReader(BaseReader):
+class ImageCaptionReader(BatchImageReader):
     """Image parser.
 
     Caption image using Blip.
@@ -52,11 +51,11 @@ class ImageCaptionReader(BaseReader):
             device = "cuda" if torch.cuda.is_available() else "cpu"
             dtype = torch.float16 if torch.cuda.is_available() else torch.float32
 
-            processor = BlipProcessor.from_pretrained(
-                "Salesforce/blip-image-captioning-large"
-            )
-            model = BlipForConditionalGeneration.from_pretrained(
-                "Salesforce/blip-image-captioning-large", torch_dtype=dtype
+            processor, model = get_pretrained(
+                BlipProcessor,
+                BlipForConditionalGeneration,
+                "Salesforce/blip-image-captioning-large",
+                torch_dtype=dtype,
             )
 
             parser_config = {
@@ -68,24 +67,8 @@ class ImageCaptionReader(BaseReader):
 
         self._parser_config = parser_config
 
-    def load_data(
-        self, file: Path, extra_info: Optional[Dict] = None
-    ) -> List[Document]:
-        """Parse file."""
-        from llama_index.img_utils import img_2_b64
-        from PIL import Image
-
-        # load document image
-        image = Image.open(file)
-        if image.mode != "RGB":
-            image = image.convert("RGB")
-
-        # Encode image into base64 string and keep in document
-        image_str: Optional[str] = None
-        if self._keep_image:
-            image_str = img_2_b64(image)
-
-        # Parse image into text
+    def _parse_images(self, images: List[Any]) -> List[str]:
+        """Caption a batch of images."""
         model = self._parser_config["model"]
         processor = self._parser_config["processor"]
 
@@ -93,14 +76,9 @@ class ImageCaptionReader(BaseReader):
         dtype = self._parser_config["dtype"]
         model.to(device)
 
-        # unconditional image captioning
-
-        inputs = processor(image, self._prompt, return_tensors="pt").to(device, dtype)
+        # unconditional image captioning, or conditional on the prompt
+        prompts = None if self._prompt is None else [self._prompt] * len(images)
+        inputs = processor(images, prompts, return_tensors="pt").to(device, dtype)
 
         out = model.generate(**inputs)
-        text_str = processor.decode(out[0], skip_special_tokens=True)
-
-        return ImageDocument(
-            text=text_str,
-            image=image_str,
-        )
+        return processor.batch_decode(out, skip_special_tokens=True)
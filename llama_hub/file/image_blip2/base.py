@@ -1,11 +1,10 @@
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from llama_index.readers.base import BaseReader
-from llama_index.readers.schema.base import Document, ImageDocument
+from llama_hub.file.image_batch import BatchImageReader
+from llama_hub.file.model_registry import get_pretrained
 
 
-class ImageVisionLLMReader(BaseReader):
+class ImageVisionLLMReader(BatchImageReader):
     """Image parser.
 
     Caption image using Blip2 (a multimodal VisionLLM similar to GPT4).
@@ -48,9 +47,11 @@ class ImageVisionLLMReader(BaseReader):
                 )
             device = "cuda" if torch.cuda.is_available() else "cpu"
             dtype = torch.float16 if torch.cuda.is_available() else torch.float32
-            processor = Blip2Processor.from_pretrained("Salesforce/blip2-opt-2.7b")
-            model = Blip2ForConditionalGeneration.from_pretrained(
-                "Salesforce/blip2-opt-2.7b", torch_dtype=dtype
+            processor, model = get_pretrained(
+                Blip2Processor,
+                Blip2ForConditionalGeneration,
+                "Salesforce/blip2-opt-2.7b",
+                torch_dtype=dtype,
             )
             parser_config = {
                 "processor": processor,
@@ -62,24 +63,8 @@ class ImageVisionLLMReader(BaseReader):
         self._keep_image = keep_image
         self._prompt = prompt
 
-    def load_data(
-        self, file: Path, extra_info: Optional[Dict] = None
-    ) -> List[Document]:
-        """Parse file."""
-        from llama_index.img_utils import img_2_b64
-        from PIL import Image
-
-        # load document image
-        image = Image.open(file)
-        if image.mode != "RGB":
-            image = image.convert("RGB")
-
-        # Encode image into base64 string and keep in document
-        image_str: Optional[str] = None
-        if self._keep_image:
-            image_str = img_2_b64(image)
-
-        # Parse image into text
+    def _parse_images(self, images: List[Any]) -> List[str]:
+        """Caption a batch of images."""
         model = self._parser_config["model"]
         processor = self._parser_config["processor"]
 
@@ -87,14 +72,10 @@ class ImageVisionLLMReader(BaseReader):
         dtype = self._parser_config["dtype"]
         model.to(device)
 
-        # unconditional image captioning
-
-        inputs = processor(image, self._prompt, return_tensors="pt").to(device, dtype)
+        # image captioning conditional on the prompt
+        inputs = processor(
+            images, [self._prompt] * len(images), return_tensors="pt"
+        ).to(device, dtype)
 
         out = model.generate(**inputs)
-        text_str = processor.decode(out[0], skip_special_tokens=True)
-
-        return ImageDocument(
-            text=text_str,
-            image=image_str,
-        )
+        return processor.batch_decode(out, skip_special_tokens=True)
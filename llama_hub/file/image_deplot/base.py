@@ -1,11 +1,10 @@
-from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from llama_index.readers.base import BaseReader
-from llama_index.readers.schema.base import Document, ImageDocument
+from llama_hub.file.image_batch import BatchImageReader
+from llama_hub.file.model_registry import get_pretrained
 
 
-class ImageTabularChartReader(BaseReader):
+class ImageTabularChartReader(BatchImageReader):
     """Image parser.
 
     Extract tabular data from a chart or figure.
@@ -38,9 +37,11 @@ class ImageTabularChartReader(BaseReader):
 
             device = "cuda" if torch.cuda.is_available() else "cpu"
             dtype = torch.float16 if torch.cuda.is_available() else torch.float32
-            processor = Pix2StructProcessor.from_pretrained("google/deplot")
-            model = Pix2StructForConditionalGeneration.from_pretrained(
-                "google/deplot", torch_dtype=dtype
+            processor, model = get_pretrained(
+                Pix2StructProcessor,
+                Pix2StructForConditionalGeneration,
+                "google/deplot",
+                torch_dtype=dtype,
             )
             parser_config = {
                 "processor": processor,
@@ -54,24 +55,8 @@ class ImageTabularChartReader(BaseReader):
         self._max_output_tokens = max_output_tokens
         self._prompt = prompt
 
-    def load_data(
-        self, file: Path, extra_info: Optional[Dict] = None
-    ) -> List[Document]:
-        """Parse file."""
-        from llama_index.img_utils import img_2_b64
-        from PIL import Image
-
-        # load document image
-        image = Image.open(file)
-        if image.mode != "RGB":
-            image = image.convert("RGB")
-
-        # Encode image into base64 string and keep in document
-        image_str: Optional[str] = None
-        if self._keep_image:
-            image_str = img_2_b64(image)
-
-        # Parse image into text
+    def _parse_images(self, images: List[Any]) -> List[str]:
+        """Extract the data tables of a batch of images."""
         model = self._parser_config["model"]
         processor = self._parser_config["processor"]
 
@@ -79,19 +64,12 @@ class ImageTabularChartReader(BaseReader):
         dtype = self._parser_config["dtype"]
         model.to(device)
 
-        # unconditional image captioning
-
-        inputs = processor(image, self._prompt, return_tensors="pt").to(device, dtype)
+        inputs = processor(
+            images=images, text=[self._prompt] * len(images), return_tensors="pt"
+        ).to(device, dtype)
 
         out = model.generate(**inputs, max_new_tokens=self._max_output_tokens)
-        text_str = "Figure or chart with tabular data: " + processor.decode(
-            out[0], skip_special_tokens=True
-        )
-
         return [
-            ImageDocument(
-                text=text_str,
-                image=image_str,
-                extra_info=extra_info or {},
-            )
+            "Figure or chart with tabular data: " + text
+            for text in processor.batch_decode(out, skip_special_tokens=True)
         ]
@@ -3,11 +3,16 @@
 import json
 import re
 from pathlib import Path
-from typing import Dict, Generator, List, Optional
+from typing import IO, Any, Dict, Generator, Iterator, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+# whitespace allowed between JSON tokens
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset(" \t\n\r,]")
+_encode_string = json.encoder.encode_basestring_ascii  # type: ignore
+
 
 def _depth_first_yield(
     json_data: Dict, levels_back: int, path: List[str]
@@ -33,6 +38,135 @@ def _depth_first_yield(
         yield " ".join(new_path)
 
 
+def _encode_scalar(value: Any) -> str:
+    """Encode a JSON scalar exactly like ``json.dumps``."""
+    if isinstance(value, str):
+        return _encode_string(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    return json.dumps(value)
+
+
+def _encode_key(key: Any) -> str:
+    """Encode a dict key exactly like ``json.dumps``."""
+    if isinstance(key, str):
+        return _encode_string(key)
+    return _encode_string(_encode_scalar(key))
+
+
+def _append_formatted_lines(
+    json_data: Any, lines: List[str], prefix: str = "", comma: bool = False
+) -> None:
+    """Append the lines of ``json.dumps(json_data, indent=0)``, minus "},".
+
+    "}," lines are the only ones the original regex filter of the dump
+    dropped, so the output is the same without building, splitting and
+    matching the dump.
+
+    Args:
+        json_data (Any): Value to format.
+        lines (List[str]): Lines to append to.
+        prefix (str): Encoded key of the value, if it is in a dict.
+        comma (bool): Whether another item follows the value.
+    """
+    if isinstance(json_data, dict) and json_data:
+        lines.append(prefix + "{")
+        last = len(json_data) - 1
+        for i, (key, value) in enumerate(json_data.items()):
+            _append_formatted_lines(value, lines, _encode_key(key) + ": ", i < last)
+        if not comma:
+            lines.append("}")
+    elif isinstance(json_data, (list, tuple)) and json_data:
+        lines.append(prefix + "[")
+        last = len(json_data) - 1
+        for i, value in enumerate(json_data):
+            _append_formatted_lines(value, lines, "", i < last)
+        lines.append("]," if comma else "]")
+    else:
+        if isinstance(json_data, dict):
+            text = "{}"
+        elif isinstance(json_data, (list, tuple)):
+            text = "[]"
+        else:
+            text = _encode_scalar(json_data)
+        lines.append(prefix + text + "," if comma else prefix + text)
+
+
+def _iter_json_values(
+    fp: IO[str], chunk_size: int = 1024 * 1024
+) -> Generator[Any, None, None]:
+    """Incrementally parse a JSON file.
+
+    If the top-level value is an array, its items are yielded one at a time
+    while the file is read in chunks. Any other top-level value is parsed as
+    a whole: a dict is yielded once, and anything else is iterated, as
+    `JSONReader.load_data` always did.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def read_more() -> None:
+        nonlocal buffer, pos, eof
+        # read at least as much as is buffered so large values are not
+        # re-parsed from the start too often
+        chunk = fp.read(max(chunk_size, len(buffer) - pos))
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        eof = not chunk
+
+    def next_token() -> str:
+        """Skip whitespace and return the next character, or "" at the end."""
+        nonlocal pos
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore
+            if pos < len(buffer) or eof:
+                return buffer[pos : pos + 1]
+            read_more()
+
+    if next_token() != "[":
+        value = json.loads(buffer[pos:] + fp.read())
+        if isinstance(value, dict):
+            yield value
+        else:
+            yield from value
+        return
+
+    pos += 1
+    if next_token() == "]":
+        return
+
+    while True:
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                # a number cut off by the end of the buffer may continue in
+                # the file, so only accept values followed by a delimiter
+                if eof or buffer[end : end + 1] in _DELIMITERS:
+                    break
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            read_more()
+        yield value
+
+        pos = end
+        token = next_token()
+        if token == "]":
+            return
+        if token != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+        pos += 1
+        next_token()
+
+
 class JSONReader(BaseReader):
     """JSON reader.
 
@@ -63,12 +197,9 @@ class JSONReader(BaseReader):
             Document: The document.
         """
         if self.levels_back is None:
-            json_output = json.dumps(json_data_object, indent=0)
-            lines = json_output.split("\n")
-            useful_lines = [
-                line for line in lines if not re.match(r"^[{}\\[\\],]*$", line)
-            ]
-            return Document(text="\n".join(useful_lines), extra_info=extra_info or {})
+            lines: List[str] = []
+            _append_formatted_lines(json_data_object, lines)
+            return Document(text="\n".join(lines), extra_info=extra_info or {})
 
         else:
             lines = [*_depth_first_yield(json_data_object, self.levels_back, [])]
@@ -90,25 +221,38 @@ class JSONReader(BaseReader):
         Returns:
             List[Document]: List of documents.
         """
+        return list(self.lazy_load_data(file, is_jsonl, extra_info))
+
+    def lazy_load_data(
+        self,
+        file: Path,
+        is_jsonl: Optional[bool] = False,
+        extra_info: Optional[Dict] = None,
+    ) -> Iterator[Document]:
+        """Load data from the input file, one record at a time.
+
+        The items of a top-level JSON array, or the lines of a JSONL file, are
+        parsed and turned into documents one by one, so memory stays bounded
+        by the largest record rather than the whole file.
+
+        Args:
+            file (Path): Path to the input file.
+            is_jsonl (Optional[bool]): If True, indicates that the file is in JSONL format. Defaults to False.
+            extra_info (Optional[Dict]): Additional information. Default is None.
+
+        Returns:
+            Iterator[Document]: Iterator over the documents.
+        """
         if not isinstance(file, Path):
             file = Path(file)
         with open(file, "r") as f:
-            data = []
             if is_jsonl:
                 for line in f:
-                    data.append(json.loads(line.strip()))
+                    line = line.strip()
+                    if line:
+                        yield self._parse_jsonobj_to_document(
+                            json.loads(line), extra_info
+                        )
             else:
-                data = json.load(f)
-            documents = []
-
-            # For a dictionary JSON object, pass the entire data to be parsed as document
-            if isinstance(data, dict):
-                documents.append(self._parse_jsonobj_to_document(data, extra_info))
-            # For a List or Non-Dictionary JSON object loop through and pass each item
-            else:
-                for json_object in data:
-                    documents.append(
-                        self._parse_jsonobj_to_document(json_object, extra_info)
-                    )
-
-            return documents
+                for json_object in _iter_json_values(f):
+                    yield self._parse_jsonobj_to_document(json_object, extra_info)
@@ -10,6 +10,12 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 from llama_index.readers.base import BaseReader
 from llama_index.schema import Document
 
+# a header line: one or more "#" followed by whitespace other than a newline
+_HEADER_PATTERN = re.compile(r"^#+[^\S\n].*$", re.MULTILINE)
+_HTML_TAG_PATTERN = re.compile(r"<.*?>")
+_IMAGE_PATTERN = re.compile(r"!{1}\[\[(.*)\]\]")
+_HYPERLINK_PATTERN = re.compile(r"\[(.*?)\]\((.*?)\)")
+
 
 class MarkdownReader(BaseReader):
     """Markdown parser.
@@ -38,48 +44,56 @@ class MarkdownReader(BaseReader):
 
         """
         markdown_tups: List[Tuple[Optional[str], str]] = []
-        lines = markdown_text.split("\n")
 
         current_header = None
-        current_text = ""
-
-        for line in lines:
-            header_match = re.match(r"^#+\s", line)
-            if header_match:
-                if current_header is not None:
-                    if current_text == "" or None:
-                        continue
-                    markdown_tups.append((current_header, current_text))
-
-                current_header = line
-                current_text = ""
-            else:
-                current_text += line + "\n"
-        markdown_tups.append((current_header, current_text))
+        current_text: List[str] = []
+        # start of the text following the current header line
+        text_start = 0
+
+        for header_match in _HEADER_PATTERN.finditer(markdown_text):
+            if current_header is not None:
+                current_text.append(markdown_text[text_start : header_match.start()])
+                # a header directly followed by another one swallows it
+                if not any(current_text):
+                    text_start = header_match.end() + 1
+                    continue
+                markdown_tups.append((current_header, "".join(current_text)))
+
+            current_header = header_match.group(0)
+            current_text = []
+            text_start = header_match.end() + 1
+
+        # every line of the last section, including the last one, ends in "\n"
+        if text_start <= len(markdown_text):
+            current_text.append(markdown_text[text_start:] + "\n")
+        markdown_tups.append((current_header, "".join(current_text)))
 
         if current_header is not None:
             # pass linting, assert keys are defined
             markdown_tups = [
-                (re.sub(r"#", "", cast(str, key)).strip(), re.sub(r"<.*?>", "", value))
+                (
+                    cast(str, key).replace("#", "").strip(),
+                    _HTML_TAG_PATTERN.sub("", value),
+                )
                 for key, value in markdown_tups
             ]
         else:
             markdown_tups = [
-                (key, re.sub("<.*?>", "", value)) for key, value in markdown_tups
+                (key, _HTML_TAG_PATTERN.sub("", value)) for key, value in markdown_tups
             ]
 
         return markdown_tups
 
     def remove_images(self, content: str) -> str:
         """Get a dictionary of a markdown file from its path."""
-        pattern = r"!{1}\[\[(.*)\]\]"
-        content = re.sub(pattern, "", content)
+        if "![[" in content:
+            content = _IMAGE_PATTERN.sub("", content)
         return content
 
     def remove_hyperlinks(self, content: str) -> str:
         """Get a dictionary of a markdown file from its path."""
-        pattern = r"\[(.*?)\]\((.*?)\)"
-        content = re.sub(pattern, r"\1", content)
+        if "](" in content:
+            content = _HYPERLINK_PATTERN.sub(r"\1", content)
         return content
 
     def parse_tups(
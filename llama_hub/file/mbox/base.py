@@ -3,12 +3,141 @@
 Contains simple parser for mbox files.
 
 """
+import multiprocessing
+import os
+from collections import deque
+from multiprocessing.pool import AsyncResult
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+# Size of the byte ranges of the mbox file handed out to worker processes.
+DEFAULT_RANGE_SIZE = 64 * 1024 * 1024
+
+
+def _get_message_content(msg: Any, errors: str = "ignore") -> Optional[str]:
+    """Get the text of a message with whitespace normalized.
+
+    Only HTML content goes through BeautifulSoup; plain text is decoded with
+    the charset declared by the message.
+    """
+    content = None
+    part = msg
+
+    if msg.is_multipart():
+        for part in msg.walk():
+            ctype = part.get_content_type()
+            cdispo = str(part.get("Content-Disposition"))
+            if ctype == "text/plain" and "attachment" not in cdispo:
+                content = part.get_payload(decode=True)  # decode
+                break
+    # Get plain message payload for non-multipart messages
+    else:
+        content = msg.get_payload(decode=True)
+
+    if not content:
+        return None
+
+    if part.get_content_type() == "text/plain":
+        charset = part.get_content_charset() or "utf-8"
+        try:
+            text = content.decode(charset, errors=errors)
+        except LookupError:
+            text = content.decode("utf-8", errors=errors)
+        return " ".join(text.split())
+
+    # Parse message HTML content and remove unneeded whitespace
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content)
+    return " ".join(soup.get_text().split())
+
+
+def _format_message(msg: Any, message_format: str, errors: str) -> Optional[str]:
+    """Format a message, or return None if it has no content."""
+    content = _get_message_content(msg, errors)
+    if content is None:
+        return None
+
+    # Format message to include date, sender, receiver and subject
+    return message_format.format(
+        _date=msg["date"],
+        _from=msg["from"],
+        _to=msg["to"],
+        _subject=msg["subject"],
+        _content=content,
+    )
+
+
+def _split_mbox(filepath: Path, range_size: int) -> List[Tuple[int, int]]:
+    """Split an mbox file into byte ranges that start at a "From " line."""
+    file_size = os.path.getsize(filepath)
+    starts = [0]
+    with open(filepath, "rb") as f:
+        while starts[-1] + range_size < file_size:
+            f.seek(starts[-1] + range_size)
+            # skip the rest of the current line, then find the next separator
+            f.readline()
+            line_start = f.tell()
+            line = f.readline()
+            while line and not line.startswith(b"From "):
+                line_start = f.tell()
+                line = f.readline()
+            if not line:
+                break
+            starts.append(line_start)
+
+    ends = starts[1:] + [file_size]
+    return list(zip(starts, ends))
+
+
+def _iter_range_messages(filepath: Path, start: int, end: int) -> Iterator[bytes]:
+    """Yield the raw messages in a byte range of an mbox file.
+
+    Splits on "From " lines like `mailbox.mbox`, dropping the separator line
+    and the blank line before the next separator or the end of the file.
+    """
+    lines: Optional[List[bytes]] = None
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            if line.startswith(b"From "):
+                if lines is not None:
+                    if lines and lines[-1] == b"\n":
+                        lines.pop()
+                    yield b"".join(lines)
+                lines = []
+            elif lines is not None:
+                lines.append(line)
+
+    # ranges end right before a separator or at the end of the file
+    if lines is not None:
+        if lines and lines[-1] == b"\n":
+            lines.pop()
+        yield b"".join(lines)
+
+
+def _parse_range_in_worker(
+    task: Tuple[Path, int, int, str, str]
+) -> List[Optional[str]]:
+    """Parse the messages of a byte range inside a worker process."""
+    from email.parser import BytesParser
+    from email.policy import default
+
+    filepath, start, end, message_format, errors = task
+    bytes_parser = BytesParser(policy=default)
+    return [
+        _format_message(bytes_parser.parsebytes(message), message_format, errors)
+        for message in _iter_range_messages(filepath, start, end)
+    ]
+
 
 class MboxReader(BaseReader):
     """Mbox reader.
@@ -17,6 +146,14 @@ class MboxReader(BaseReader):
     Returns string including date, subject, sender, receiver and
     content for each message.
 
+    Args:
+        max_count (int): Maximum amount of messages to read. 0 reads all.
+        message_format (str): Message format overriding default.
+        id_fn (Optional[Callable[[str], str]]): Function building the
+            document id from the formatted message.
+        num_workers (Optional[int]): Number of worker processes parsing
+            byte ranges of the file in parallel. Messages are parsed serially
+            when None or 1.
     """
 
     DEFAULT_MESSAGE_FORMAT: str = (
@@ -33,6 +170,7 @@ class MboxReader(BaseReader):
         max_count: int = 0,
         message_format: str = DEFAULT_MESSAGE_FORMAT,
         id_fn: Optional[Callable[[str], str]] = None,
+        num_workers: Optional[int] = None,
         **kwargs: Any
     ) -> None:
         """Init params."""
@@ -40,65 +178,81 @@ class MboxReader(BaseReader):
         self.max_count = max_count
         self.message_format = message_format
         self.id_fn = id_fn
+        self.num_workers = num_workers
+
+    def _iter_formatted_messages(
+        self, filepath: Path, errors: str
+    ) -> Iterator[Optional[str]]:
+        """Yield each formatted message, or None for messages without content."""
+        if self.num_workers is not None and self.num_workers > 1:
+            ranges = _split_mbox(filepath, DEFAULT_RANGE_SIZE)
+            tasks = [
+                (filepath, start, end, self.message_format, errors)
+                for start, end in ranges
+            ]
+            num_workers = min(self.num_workers, len(tasks))
+            ctx = multiprocessing.get_context("spawn")
+            with ctx.Pool(processes=num_workers) as pool:
+                # at most two ranges per worker are in flight, so memory stays
+                # bounded even if the consumer is slower than the pool
+                pending: Deque[AsyncResult] = deque()
+                remaining_tasks = iter(tasks)
+                while True:
+                    while len(pending) < 2 * num_workers:
+                        task = next(remaining_tasks, None)
+                        if task is None:
+                            break
+                        pending.append(
+                            pool.apply_async(_parse_range_in_worker, (task,))
+                        )
+                    if not pending:
+                        break
+                    yield from pending.popleft().get()
+            return
 
-    def parse_file(self, filepath: Path, errors: str = "ignore") -> List[str]:
-        """Parse file into string."""
         # Import required libraries
         import mailbox
         from email.parser import BytesParser
         from email.policy import default
 
-        from bs4 import BeautifulSoup
-
-        i = 0
-        results: List[str] = []
         # Load file using mailbox
         bytes_parser = BytesParser(policy=default).parse
         mbox = mailbox.mbox(filepath, factory=bytes_parser)  # type: ignore
 
         # Iterate through all messages
-        for _, _msg in enumerate(mbox):
-            msg: mailbox.mboxMessage = _msg
-            # Parse multipart messages
-
-            content = None
-
-            if msg.is_multipart():
-                for part in msg.walk():
-                    ctype = part.get_content_type()
-                    cdispo = str(part.get("Content-Disposition"))
-                    if ctype == "text/plain" and "attachment" not in cdispo:
-                        content = part.get_payload(decode=True)  # decode
-                        break
-            # Get plain message payload for non-multipart messages
-            else:
-                content = msg.get_payload(decode=True)
+        for msg in mbox:
+            yield _format_message(msg, self.message_format, errors)
 
-            if not content:
+    def iter_file(self, filepath: Path, errors: str = "ignore") -> Iterator[str]:
+        """Parse file, yielding one formatted message at a time."""
+        i = 0
+        for msg_string in self._iter_formatted_messages(filepath, errors):
+            if msg_string is None:
                 print(
                     "WARNING llama_hub.file.mbox found messages with content that"
                     " stayed None. Skipping entry..."
                 )
                 continue
 
-            # Parse message HTML content and remove unneeded whitespace
-            soup = BeautifulSoup(content)
-            stripped_content = " ".join(soup.get_text().split())
-            # Format message to include date, sender, receiver and subject
-            msg_string = self.message_format.format(
-                _date=msg["date"],
-                _from=msg["from"],
-                _to=msg["to"],
-                _subject=msg["subject"],
-                _content=stripped_content,
-            )
-            # Add message string to results
-            results.append(msg_string)
+            yield msg_string
             # Increment counter and return if max count is met
             i += 1
             if self.max_count > 0 and i >= self.max_count:
                 break
-        return results
+
+    def parse_file(self, filepath: Path, errors: str = "ignore") -> List[str]:
+        """Parse file into string."""
+        return list(self.iter_file(filepath, errors))
+
+    def lazy_load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> Iterator[Document]:
+        """Load data from the input file, one message at a time."""
+        for msg in self.iter_file(file):
+            d = Document(text=msg, extra_info=extra_info or {})
+            if self.id_fn:
+                d.doc_id = self.id_fn(msg)
+            yield d
 
     def load_data(
         self, file: Path, extra_info: Optional[Dict] = None
@@ -109,12 +263,4 @@ class MboxReader(BaseReader):
             max_count (int): Maximum amount of messages to read.
             message_format (str): Message format overriding default.
         """
-        docs: List[Document] = []
-        content = self.parse_file(file)
-        for msg in content:
-            d = Document(text=msg, extra_info=extra_info or {})
-            if self.id_fn:
-                d.doc_id = self.id_fn(msg)
-            docs.append(d)
-
-        return docs
+        return list(self.lazy_load_data(file, extra_info))
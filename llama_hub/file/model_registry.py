@@ -0,0 +1,62 @@
+"""Process-wide registry of pretrained models, shared by the file readers."""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+_models: Dict[Hashable, Any] = {}
+_lock = threading.Lock()
+
+
+def _class_name(cls: Any) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def get_or_load(key: Hashable, load: Callable[[], Any]) -> Any:
+    """Get the model stored under a key, calling `load` on first use.
+
+    Args:
+        key (Hashable): Identifies the model, e.g. its library and checkpoint.
+        load (Callable[[], Any]): Loads the model if the key is not cached.
+    """
+    with _lock:
+        if key not in _models:
+            _models[key] = load()
+        return _models[key]
+
+
+def get_pretrained(
+    processor_cls: Any, model_cls: Any, checkpoint: str, **model_kwargs: Any
+) -> Tuple[Any, Any]:
+    """Load a processor and model pair once per process.
+
+    Readers built with the same processor class, model class, checkpoint and
+    model kwargs (e.g. `torch_dtype`) share one copy of the weights.
+
+    Args:
+        processor_cls (Any): Processor class with a `from_pretrained` method.
+        model_cls (Any): Model class with a `from_pretrained` method.
+        checkpoint (str): Name or path of the pretrained checkpoint.
+        **model_kwargs: Keyword arguments passed to `model_cls.from_pretrained`.
+
+    Returns:
+        Tuple[Any, Any]: The processor and the model.
+    """
+    key = (
+        _class_name(processor_cls),
+        _class_name(model_cls),
+        checkpoint,
+        tuple(sorted((name, repr(value)) for name, value in model_kwargs.items())),
+    )
+    return get_or_load(
+        key,
+        lambda: (
+            processor_cls.from_pretrained(checkpoint),
+            model_cls.from_pretrained(checkpoint, **model_kwargs),
+        ),
+    )
+
+
+def clear_pretrained() -> None:
+    """Drop every loaded model so its memory can be reclaimed."""
+    with _lock:
+        _models.clear()
@@ -5,7 +5,7 @@ A parser for tabular data files.
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
@@ -19,33 +19,68 @@ class PagedCSVReader(BaseReader):
     Args:
         encoding (str): Encoding used to open the file.
             utf-8 by default.
+        rows_per_page (int): Number of rows grouped into each document.
+            Rows on the same page are separated by a blank line.
+            1 by default.
     """
 
-    def __init__(self, *args: Any, encoding: str = "utf-8", **kwargs: Any) -> None:
+    def __init__(
+        self, *args: Any, encoding: str = "utf-8", rows_per_page: int = 1, **kwargs: Any
+    ) -> None:
         """Init params."""
         super().__init__(*args, **kwargs)
+        if rows_per_page < 1:
+            raise ValueError("rows_per_page must be a positive integer.")
         self._encoding = encoding
+        self._rows_per_page = rows_per_page
 
-    def load_data(
+    def lazy_load_data(
         self,
         file: Path,
         extra_info: Optional[Dict] = None,
         delimiter: str = ",",
         quotechar: str = '"',
-    ) -> List[Document]:
-        """Parse file."""
+    ) -> Iterator[Document]:
+        """Parse file, yielding each page as soon as its rows are read."""
         import csv
 
-        docs = []
         with open(file, "r", encoding=self._encoding) as fp:
-            csv_reader = csv.DictReader(f=fp, delimiter=delimiter, quotechar=quotechar)  # type: ignore
+            csv_reader = csv.reader(fp, delimiter=delimiter, quotechar=quotechar)
+            header = next(csv_reader, None)
+            if header is None:
+                return
+
+            # format the column names once instead of building a dict per row
+            prefixes = [f"{k.strip()}: " for k in header]
+            num_columns = len(prefixes)
+
+            rows = []
             for row in csv_reader:
-                docs.append(
-                    Document(
-                        text="\n".join(
-                            f"{k.strip()}: {v.strip()}" for k, v in row.items()
-                        ),
-                        extra_info=extra_info or {},
-                    )
+                # skip blank lines, like csv.DictReader
+                if not row:
+                    continue
+                if len(row) < num_columns:
+                    row += [""] * (num_columns - len(row))
+                rows.append(
+                    "\n".join([prefix + v.strip() for prefix, v in zip(prefixes, row)])
                 )
-        return docs
+                if len(rows) == self._rows_per_page:
+                    yield Document(text="\n\n".join(rows), extra_info=extra_info or {})
+                    rows = []
+
+            if rows:
+                yield Document(text="\n\n".join(rows), extra_info=extra_info or {})
+
+    def load_data(
+        self,
+        file: Path,
+        extra_info: Optional[Dict] = None,
+        delimiter: str = ",",
+        quotechar: str = '"',
+    ) -> List[Document]:
+        """Parse file."""
+        return list(
+            self.lazy_load_data(
+                file, extra_info=extra_info, delimiter=delimiter, quotechar=quotechar
+            )
+        )
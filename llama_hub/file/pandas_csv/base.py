@@ -4,11 +4,14 @@ A parser for tabular data files using pandas.
 
 """
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class PandasCSVReader(BaseReader):
     r"""Pandas-based CSV parser.
@@ -34,6 +37,11 @@ class PandasCSVReader(BaseReader):
             Set to empty dict by default, this means pandas will try to figure
             out the separators, table head, etc. on its own.
 
+        chunksize (Optional[int]): Number of rows to read from the file at a
+            time. When set, the file is streamed and, if `concat_rows=True`,
+            one Document is created per chunk instead of per file.
+            Set to None by default.
+
     """
 
     def __init__(
@@ -43,6 +51,7 @@ class PandasCSVReader(BaseReader):
         col_joiner: str = ", ",
         row_joiner: str = "\n",
         pandas_config: dict = {},
+        chunksize: Optional[int] = None,
         **kwargs: Any
     ) -> None:
         """Init params."""
@@ -51,19 +60,30 @@ class PandasCSVReader(BaseReader):
         self._col_joiner = col_joiner
         self._row_joiner = row_joiner
         self._pandas_config = pandas_config
-
-    def load_data(
-        self, file: Path, extra_info: Optional[Dict] = None
-    ) -> List[Document]:
-        """Parse file."""
-        import pandas as pd
-
-        df = pd.read_csv(file, **self._pandas_config)
-
-        text_list = df.apply(
-            lambda row: (self._col_joiner).join(row.astype(str).tolist()), axis=1
+        self._chunksize = chunksize
+
+    def _rows_to_text(self, df: "pd.DataFrame") -> List[str]:
+        """Join the columns of every row, column by column."""
+        if len(df.columns) == 0:
+            return []
+
+        # cast to the dtype the rows of the frame share first, so values
+        # render as they did in a row-wise apply, e.g. ints as floats when
+        # every other column is a float column
+        row_dtype = df.iloc[:0].to_numpy().dtype
+        # pandas >= 3 keeps missing values missing in astype(str)
+        str_df = df.astype(row_dtype).astype(str).fillna("nan")
+        first, rest = str_df.iloc[:, 0], str_df.iloc[:, 1:]
+        if len(rest.columns) == 0:
+            return first.tolist()
+        return first.str.cat(
+            [rest.iloc[:, i] for i in range(len(rest.columns))],
+            sep=self._col_joiner,
         ).tolist()
 
+    def _text_to_documents(
+        self, text_list: List[str], extra_info: Optional[Dict]
+    ) -> List[Document]:
         if self._concat_rows:
             return [
                 Document(
@@ -74,3 +94,25 @@ class PandasCSVReader(BaseReader):
             return [
                 Document(text=text, extra_info=extra_info or {}) for text in text_list
             ]
+
+    def lazy_load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> Iterator[Document]:
+        """Parse file, streaming it in chunks if `chunksize` is set."""
+        import pandas as pd
+
+        if self._chunksize is None:
+            df = pd.read_csv(file, **self._pandas_config)
+            yield from self._text_to_documents(self._rows_to_text(df), extra_info)
+            return
+
+        pandas_config = {**self._pandas_config, "chunksize": self._chunksize}
+        with pd.read_csv(file, **pandas_config) as reader:
+            for df in reader:
+                yield from self._text_to_documents(self._rows_to_text(df), extra_info)
+
+    def load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> List[Document]:
+        """Parse file."""
+        return list(self.lazy_load_data(file, extra_info))
@@ -1,19 +1,93 @@
 """Read PDF files."""
 
+import multiprocessing
+from io import BytesIO
 from pathlib import Path
-from typing import IO, Dict, List, Optional, Union
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.file.extraction_cache import ExtractionCache
+
+# The PDF parsed once per worker process of the page extraction pool.
+_worker_pdf: Any = None
+
+
+def _init_worker(source: Union[str, bytes, BytesIO]) -> None:
+    """Parse the PDF once in a worker process of the page extraction pool."""
+    import pypdf
+
+    global _worker_pdf
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+    _worker_pdf = pypdf.PdfReader(source)
+
+
+def _extract_pages_in_worker(pages: List[int]) -> List[str]:
+    """Extract the text of a chunk of pages inside a worker process."""
+    return [_worker_pdf.pages[page].extract_text() for page in pages]
+
 
 class PDFReader(BaseReader):
-    """PDF reader."""
+    """PDF reader.
 
-    def load_data(
-        self, file: Union[IO[bytes], str, Path], extra_info: Optional[Dict] = None
-    ) -> List[Document]:
-        """Parse file."""
+    Args:
+        num_workers (Optional[int]): Number of worker processes to split page
+            extraction across. Pages are extracted serially when None or 1.
+            Default is None.
+        cache (Optional[ExtractionCache]): Cache of extracted pages, keyed by
+            file content. Default is None.
+    """
+
+    def __init__(
+        self,
+        num_workers: Optional[int] = None,
+        cache: Optional[ExtractionCache] = None,
+    ) -> None:
+        """Initialize with parameters."""
+        super().__init__()
+        self.num_workers = num_workers
+        self.cache = cache
+
+    def _iter_page_texts(
+        self, pdf: Any, source: Union[str, bytes], pages: range
+    ) -> Iterator[str]:
+        """Extract page texts in order, serially or in a worker pool."""
+        if self.num_workers is None or self.num_workers <= 1 or len(pages) <= 1:
+            for page in pages:
+                yield pdf.pages[page].extract_text()
+            return
+
+        # contiguous chunks keep the per-task overhead low while still
+        # balancing pages of very different complexity across workers
+        chunk_size = max(1, len(pages) // (self.num_workers * 4))
+        chunks = [
+            list(pages[i : i + chunk_size]) for i in range(0, len(pages), chunk_size)
+        ]
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(
+            processes=min(self.num_workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(source,),
+        ) as pool:
+            for chunk_texts in pool.imap(_extract_pages_in_worker, chunks):
+                yield from chunk_texts
+
+    def lazy_load_data(
+        self,
+        file: Union[IO[bytes], str, Path],
+        extra_info: Optional[Dict] = None,
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[Document]:
+        """Parse file, yielding one document per page.
+
+        Args:
+            file (Union[IO[bytes], str, Path]): Path or byte stream of the PDF.
+            extra_info (Optional[Dict]): Metadata added to every document.
+            page_range (Optional[Tuple[int, int]]): Zero-based, end-exclusive
+                range of pages to extract. Default is all pages.
+        """
         import pypdf
 
         # Check if the file is already a Path object, if not, create a Path object from the string
@@ -31,22 +105,67 @@ class PDFReader(BaseReader):
             context = file
 
         with context as fp:
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key(fp, "PDFReader")
+                cached_pages = self.cache.get(cache_key)
+                if cached_pages is not None:
+                    if page_range is not None:
+                        cached_pages = cached_pages[page_range[0] : page_range[1]]
+                    for cached_page in cached_pages:
+                        metadata = dict(cached_page["metadata"])
+                        if extra_info is not None:
+                            metadata.update(extra_info)
+                        yield Document(text=cached_page["text"], extra_info=metadata)
+                    return
+
             # Create a PDF object
             pdf = pypdf.PdfReader(fp)
 
             # Get the number of pages in the PDF document
             num_pages = len(pdf.pages)
+            pages = range(num_pages)
+            if page_range is not None:
+                pages = pages[page_range[0] : page_range[1]]
+
+            # page_labels is computed for the whole document on every access
+            page_labels = pdf.page_labels
+
+            source: Union[str, bytes] = ""
+            if self.num_workers is not None and self.num_workers > 1:
+                if isinstance(file, Path):
+                    source = str(file)
+                else:
+                    fp.seek(0)
+                    source = fp.read()
+
+            # only complete documents are cached
+            extracted_pages: Optional[List[Dict]] = None
+            if cache_key is not None and len(pages) == num_pages:
+                extracted_pages = []
 
             # Iterate over every page
-            docs = []
-            for page in range(num_pages):
-                # Extract the text from the page
-                page_text = pdf.pages[page].extract_text()
-                page_label = pdf.page_labels[page]
+            page_texts = self._iter_page_texts(pdf, source, pages)
+            for page, page_text in zip(pages, page_texts):
+                page_label = page_labels[page]
                 metadata = {"page_label": page_label}
+                if extracted_pages is not None:
+                    extracted_pages.append({"text": page_text, "metadata": metadata})
+                    metadata = dict(metadata)
 
                 if extra_info is not None:
                     metadata.update(extra_info)
 
-                docs.append(Document(text=page_text, extra_info=metadata))
-            return docs
+                yield Document(text=page_text, extra_info=metadata)
+
+            if cache_key is not None and extracted_pages is not None:
+                self.cache.put(cache_key, extracted_pages)
+
+    def load_data(
+        self,
+        file: Union[IO[bytes], str, Path],
+        extra_info: Optional[Dict] = None,
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> List[Document]:
+        """Parse file."""
+        return list(self.lazy_load_data(file, extra_info, page_range))
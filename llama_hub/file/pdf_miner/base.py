@@ -6,14 +6,53 @@ from typing import Dict, List, Optional
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.file.extraction_cache import ExtractionCache
+
 
 class PDFMinerReader(BaseReader):
-    """PDF parser based on pdfminer.six."""
+    """PDF parser based on pdfminer.six.
+
+    Args:
+        cache (Optional[ExtractionCache]): Cache of extracted pages, keyed by
+            file content. Default is None.
+    """
+
+    def __init__(self, cache: Optional[ExtractionCache] = None) -> None:
+        """Initialize with parameters."""
+        super().__init__()
+        self.cache = cache
 
     def load_data(
         self, file: Path, extra_info: Optional[Dict] = None
     ) -> List[Document]:
         """Parse file."""
+        page_texts = None
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(file, "PDFMinerReader")
+            cached_pages = self.cache.get(cache_key)
+            if cached_pages is not None:
+                page_texts = [cached_page["text"] for cached_page in cached_pages]
+
+        if page_texts is None:
+            page_texts = self._extract_page_texts(file)
+            if self.cache is not None and cache_key is not None:
+                self.cache.put(
+                    cache_key, [{"text": text, "metadata": {}} for text in page_texts]
+                )
+
+        # Iterate over every page
+        docs = []
+        for i, page_text in enumerate(page_texts):
+            metadata = {"page_label": i, "file_name": file.name}
+            if extra_info is not None:
+                metadata.update(extra_info)
+
+            docs.append(Document(text=page_text, extra_info=metadata))
+        return docs
+
+    def _extract_page_texts(self, file: Path) -> List[str]:
+        """Extract the text of every page."""
         try:
             from io import StringIO
 
@@ -43,16 +82,4 @@ class PDFMinerReader(BaseReader):
             )
         with open(file, "rb") as fp:
             reader = PDF_Page.get_pages(fp)
-
-            # Iterate over every page
-            docs = []
-            for i, page in enumerate(reader):
-                # Extract the text from the page
-                page_text = _extract_text_from_page(page)
-
-                metadata = {"page_label": i, "file_name": file.name}
-                if extra_info is not None:
-                    metadata.update(extra_info)
-
-                docs.append(Document(text=page_text, extra_info=metadata))
-            return docs
+            return [_extract_text_from_page(page) for page in reader]
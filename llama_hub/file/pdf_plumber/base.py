@@ -4,15 +4,40 @@ from typing import Dict, List, Optional
 from llama_index.readers.base import BaseReader
 from llama_index.schema import Document
 
+from llama_hub.file.extraction_cache import ExtractionCache
+
 
 class PDFPlumberReader(BaseReader):
-    """PDF parser."""
+    """PDF parser.
+
+    Args:
+        cache (Optional[ExtractionCache]): Cache of extracted pages, keyed by
+            file content. Default is None.
+    """
+
+    def __init__(self, cache: Optional[ExtractionCache] = None) -> None:
+        """Initialize with parameters."""
+        super().__init__()
+        self.cache = cache
 
     def load_data(self, file: str, extra_info: Optional[Dict] = None) -> List[Document]:
         """Parse file."""
 
         docs = []
 
+        if self.cache is not None:
+            cache_key = self.cache.make_key(file, "PDFPlumberReader")
+            cached_pages = self.cache.get(cache_key)
+            if cached_pages is not None:
+                text = "\n".join(cached_page["text"] for cached_page in cached_pages)
+                metadata = {"file_path": str(file)}
+
+                if extra_info is not None:
+                    metadata.update(extra_info)
+
+                docs.append(Document(text=text, metadata=metadata))
+                return docs
+
         try:
             import pdfplumber
         except ImportError:
@@ -21,6 +46,10 @@ class PDFPlumberReader(BaseReader):
             )
         with pdfplumber.open(file) as fp:
             text_list = [page.extract_text() for page in fp.pages]
+            if self.cache is not None:
+                self.cache.put(
+                    cache_key, [{"text": text, "metadata": {}} for text in text_list]
+                )
             text = "\n".join(text_list)
             metadata = {"file_path": fp.stream.name}
 
@@ -1,53 +1,105 @@
 """Read Microsoft PowerPoint files."""
 
-import os
+import multiprocessing
+from collections import deque
+from io import BytesIO
+from multiprocessing.pool import AsyncResult
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.file.extraction_cache import ExtractionCache
+from llama_hub.file.model_registry import get_or_load
+
+CAPTION_MODEL = "nlpconnect/vit-gpt2-image-captioning"
+
+
+def _load_caption_model() -> Dict[str, Any]:
+    """Load the image captioning model once per process."""
+    from transformers import (
+        AutoTokenizer,
+        VisionEncoderDecoderModel,
+        ViTFeatureExtractor,
+    )
+
+    return get_or_load(
+        ("pptx", CAPTION_MODEL),
+        lambda: {
+            "feature_extractor": ViTFeatureExtractor.from_pretrained(CAPTION_MODEL),
+            "model": VisionEncoderDecoderModel.from_pretrained(CAPTION_MODEL),
+            "tokenizer": AutoTokenizer.from_pretrained(CAPTION_MODEL),
+        },
+    )
+
+
+def _extract_deck(
+    task: Tuple[str, bool]
+) -> Tuple[List[Tuple[str, str]], Dict[str, bytes]]:
+    """Extract the text of a deck, in a worker process or not.
+
+    Returns:
+        Tuple[List[Tuple[str, str]], Dict[str, bytes]]: The parts of the deck
+            in order, each ("text", text) or ("image", sha1 of the image),
+            and the content of each distinct image to caption by sha1.
+    """
+    from pptx import Presentation
+
+    file, caption_images = task
+    presentation = Presentation(file)
+    parts: List[Tuple[str, str]] = []
+    images: Dict[str, bytes] = {}
+    for i, slide in enumerate(presentation.slides):
+        parts.append(("text", f"\n\nSlide #{i}: \n"))
+        for shape in slide.shapes:
+            if caption_images and hasattr(shape, "image"):
+                image = shape.image
+                # identical images are only captioned once
+                images.setdefault(image.sha1, image.blob)
+                parts.append(("image", image.sha1))
+            if hasattr(shape, "text"):
+                parts.append(("text", f"{shape.text}\n"))
+    return parts, images
+
 
 class PptxReader(BaseReader):
     """Powerpoint reader.
 
     Extract text, caption images, and specify slides.
 
+    Args:
+        caption_images (Optional[bool]): Whether to caption the images of
+            the slides. Default is False.
+        num_workers (Optional[int]): Number of worker processes extracting
+            the text of decks in `load_data_batch`. Decks are read serially
+            when None or 1.
+        batch_size (int): Number of images captioned per model call.
+            Default is 8.
+        cache (Optional[ExtractionCache]): Cache of image captions keyed by
+            image content, shared across decks and runs. Default is None.
     """
 
-    def __init__(self, caption_images: Optional[bool] = False) -> None:
+    def __init__(
+        self,
+        caption_images: Optional[bool] = False,
+        num_workers: Optional[int] = None,
+        batch_size: int = 8,
+        cache: Optional[ExtractionCache] = None,
+    ) -> None:
         """Init reader."""
         self.caption_images = caption_images
+        self.num_workers = num_workers
+        self.batch_size = batch_size
+        self.cache = cache
+        # captions of the images seen by this reader, by sha1
+        self._captions: Dict[str, str] = {}
         if caption_images:
-            from transformers import (
-                AutoTokenizer,
-                VisionEncoderDecoderModel,
-                ViTFeatureExtractor,
-            )
-
-            model = VisionEncoderDecoderModel.from_pretrained(
-                "nlpconnect/vit-gpt2-image-captioning"
-            )
-            feature_extractor = ViTFeatureExtractor.from_pretrained(
-                "nlpconnect/vit-gpt2-image-captioning"
-            )
-            tokenizer = AutoTokenizer.from_pretrained(
-                "nlpconnect/vit-gpt2-image-captioning"
-            )
-
-            self.parser_config = {
-                "feature_extractor": feature_extractor,
-                "model": model,
-                "tokenizer": tokenizer,
-            }
-
-    def generate_image_caption(self, tmp_image_file: str) -> str:
-        """Generate text caption of image."""
-        if not self.caption_images:
-            return ""
+            self.parser_config = _load_caption_model()
 
+    def _caption_images(self, images: List[Any]) -> List[str]:
+        """Generate the text captions of a batch of PIL images."""
         import torch
-        from PIL import Image
 
         model = self.parser_config["model"]
         feature_extractor = self.parser_config["feature_extractor"]
@@ -60,19 +112,137 @@ class PptxReader(BaseReader):
         num_beams = 4
         gen_kwargs = {"max_length": max_length, "num_beams": num_beams}
 
-        i_image = Image.open(tmp_image_file)
-        if i_image.mode != "RGB":
-            i_image = i_image.convert(mode="RGB")
+        rgb_images = []
+        for i_image in images:
+            if i_image.mode != "RGB":
+                i_image = i_image.convert(mode="RGB")
+            rgb_images.append(i_image)
 
         pixel_values = feature_extractor(
-            images=[i_image], return_tensors="pt"
+            images=rgb_images, return_tensors="pt"
         ).pixel_values
         pixel_values = pixel_values.to(device)
 
         output_ids = model.generate(pixel_values, **gen_kwargs)
 
         preds = tokenizer.batch_decode(output_ids, skip_special_tokens=True)
-        return preds[0].strip()
+        return [pred.strip() for pred in preds]
+
+    def generate_image_caption(self, tmp_image_file: Union[str, IO[bytes]]) -> str:
+        """Generate text caption of image."""
+        if not self.caption_images:
+            return ""
+
+        from PIL import Image
+
+        return self._caption_images([Image.open(tmp_image_file)])[0]
+
+    def _caption_blobs(self, blobs: Dict[str, bytes]) -> None:
+        """Caption images given by sha1, in batches, skipping known images."""
+        from PIL import Image
+
+        to_caption = []
+        for sha1, blob in blobs.items():
+            if sha1 in self._captions:
+                continue
+            if self.cache is not None:
+                # python-pptx already hashed the image, no need to do it again
+                cached = self.cache.get(self.cache.make_digest_key(sha1, "PptxReader"))
+                if cached is not None:
+                    self._captions[sha1] = cached[0]["text"]
+                    continue
+            to_caption.append((sha1, blob))
+
+        entries = []
+        for start in range(0, len(to_caption), self.batch_size):
+            batch = to_caption[start : start + self.batch_size]
+            captions = self._caption_images(
+                [Image.open(BytesIO(blob)) for _, blob in batch]
+            )
+            for (sha1, _), caption in zip(batch, captions):
+                self._captions[sha1] = caption
+                if self.cache is not None:
+                    entries.append(
+                        (
+                            self.cache.make_digest_key(sha1, "PptxReader"),
+                            [{"text": caption, "metadata": {}}],
+                        )
+                    )
+        if self.cache is not None and entries:
+            self.cache.put_many(entries)
+
+    def _iter_decks(
+        self, tasks: List[Tuple[str, bool]]
+    ) -> Iterator[Tuple[List[Tuple[str, str]], Dict[str, bytes]]]:
+        """Extract decks in order, keeping at most two per worker in memory."""
+        if self.num_workers is None or self.num_workers <= 1 or len(tasks) <= 1:
+            for task in tasks:
+                yield _extract_deck(task)
+            return
+
+        num_workers = min(self.num_workers, len(tasks))
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(processes=num_workers) as pool:
+            pending: Deque[AsyncResult] = deque()
+            for task in tasks:
+                if len(pending) >= 2 * num_workers:
+                    yield pending.popleft().get()
+                pending.append(pool.apply_async(_extract_deck, (task,)))
+            while pending:
+                yield pending.popleft().get()
+
+    def _render_deck(self, parts: List[Tuple[str, str]]) -> str:
+        """Join the parts of a deck, with the captions of its images."""
+        return "".join(
+            value if kind == "text" else f"\n Image: {self._captions[value]}\n\n"
+            for kind, value in parts
+        )
+
+    def load_data_batch(
+        self,
+        files: List[Path],
+        extra_infos: Optional[List[Optional[Dict]]] = None,
+    ) -> List[Document]:
+        """Parse many decks, captioning their distinct images in batches.
+
+        Decks are read one at a time; the images of the decks read so far are
+        captioned as soon as they fill a batch.
+
+        Args:
+            files (List[Path]): Decks to parse.
+            extra_infos (Optional[List[Optional[Dict]]]): Metadata of the
+                document of each deck. Default is no metadata.
+        """
+        if extra_infos is None:
+            extra_infos = [None] * len(files)
+
+        tasks = [(str(file), bool(self.caption_images)) for file in files]
+        documents = []
+        # decks waiting for the captions of their images, and those images
+        pending_decks: List[Tuple[List[Tuple[str, str]], Optional[Dict]]] = []
+        pending_blobs: Dict[str, bytes] = {}
+
+        def flush() -> None:
+            if pending_blobs:
+                self._caption_blobs(pending_blobs)
+            for parts, extra_info in pending_decks:
+                documents.append(
+                    Document(text=self._render_deck(parts), extra_info=extra_info or {})
+                )
+            pending_decks.clear()
+            pending_blobs.clear()
+
+        for (parts, images), extra_info in zip(self._iter_decks(tasks), extra_infos):
+            pending_decks.append((parts, extra_info))
+            pending_blobs.update(
+                (sha1, blob)
+                for sha1, blob in images.items()
+                if sha1 not in self._captions
+            )
+            if len(pending_blobs) >= self.batch_size or not pending_blobs:
+                flush()
+        flush()
+        return documents
 
     def load_data(
         self,
@@ -80,27 +250,4 @@ class PptxReader(BaseReader):
         extra_info: Optional[Dict] = None,
     ) -> List[Document]:
         """Parse file."""
-        from pptx import Presentation
-
-        presentation = Presentation(file)
-        result = ""
-        for i, slide in enumerate(presentation.slides):
-            result += f"\n\nSlide #{i}: \n"
-            for shape in slide.shapes:
-                if self.caption_images and hasattr(shape, "image"):
-                    image = shape.image
-                    # get image "file" contents
-                    image_bytes = image.blob
-                    # temporarily save the image to feed into model
-                    image_filename = f"tmp_image.{image.ext}"
-                    with open(image_filename, "wb") as f:
-                        f.write(image_bytes)
-                    result += (
-                        f"\n Image: {self.generate_image_caption(image_filename)}\n\n"
-                    )
-
-                    os.remove(image_filename)
-                if hasattr(shape, "text"):
-                    result += f"{shape.text}\n"
-
-        return [Document(text=result, extra_info=extra_info or {})]
+        return self.load_data_batch([file], [extra_info])
@@ -6,9 +6,42 @@ from typing import Dict, List, Optional, Union
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.file.extraction_cache import ExtractionCache
+
 
 class PyMuPDFReader(BaseReader):
-    """Read PDF files using PyMuPDF library."""
+    """Read PDF files using PyMuPDF library.
+
+    Args:
+        cache (Optional[ExtractionCache]): Cache of extracted pages, keyed by
+            file content. Default is None.
+    """
+
+    def __init__(self, cache: Optional[ExtractionCache] = None) -> None:
+        """Initialize with parameters."""
+        super().__init__()
+        self.cache = cache
+
+    def _extract_page_texts(self, file_path: Union[Path, str]) -> List[str]:
+        """Extract the text of every page, going through the cache if set."""
+        import fitz
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(file_path, "PyMuPDFReader")
+            cached_pages = self.cache.get(cache_key)
+            if cached_pages is not None:
+                return [cached_page["text"] for cached_page in cached_pages]
+
+        # open PDF file
+        doc = fitz.open(file_path)
+        page_texts = [page.get_text() for page in doc]
+
+        if self.cache is not None and cache_key is not None:
+            self.cache.put(
+                cache_key, [{"text": text, "metadata": {}} for text in page_texts]
+            )
+        return page_texts
 
     def load_data(
         self,
@@ -39,14 +72,11 @@ class PyMuPDFReader(BaseReader):
         Returns:
             List[Document]: list of documents.
         """
-        import fitz
-
         # check if file_path is a string or Path
         if not isinstance(file_path, str) and not isinstance(file_path, Path):
             raise TypeError("file_path must be a string or Path.")
 
-        # open PDF file
-        doc = fitz.open(file_path)
+        page_texts = self._extract_page_texts(file_path)
 
         # if extra_info is not None, check if it is a dictionary
         if extra_info:
@@ -57,27 +87,25 @@ class PyMuPDFReader(BaseReader):
         if metadata:
             if not extra_info:
                 extra_info = {}
-            extra_info["total_pages"] = len(doc)
+            extra_info["total_pages"] = len(page_texts)
             extra_info["file_path"] = str(file_path)
 
             # return list of documents
             return [
                 Document(
-                    text=page.get_text().encode("utf-8"),
+                    text=page_text.encode("utf-8"),
                     extra_info=dict(
                         extra_info,
                         **{
-                            "source": f"{page.number+1}",
+                            "source": f"{page_number+1}",
                         },
                     ),
                 )
-                for page in doc
+                for page_number, page_text in enumerate(page_texts)
             ]
 
         else:
             return [
-                Document(
-                    text=page.get_text().encode("utf-8"), extra_info=extra_info or {}
-                )
-                for page in doc
+                Document(text=page_text.encode("utf-8"), extra_info=extra_info or {})
+                for page_text in page_texts
             ]
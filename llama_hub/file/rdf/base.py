@@ -1,18 +1,67 @@
 """Read RDF files."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+# Offline copy of the RDF and RDFS vocabularies, see `_load_vocabularies`.
+VOCABULARIES_PATH = Path(__file__).parent / "vocabularies.ttl"
+
+# uri -> {language tag (None for plain literals) -> label}
+LabelIndex = Dict[Any, Dict[Optional[str], Any]]
+
+
+def _build_label_index(graph: Any) -> LabelIndex:
+    """Index the labels of a graph by URI and language in a single pass.
+
+    The first label found for each language of a URI is kept.
+    """
+    from rdflib import Literal
+    from rdflib.namespace import RDFS
+
+    index: LabelIndex = {}
+    for uri, _, label in graph.triples((None, RDFS.label, None)):
+        if not isinstance(label, Literal):
+            continue
+        index.setdefault(uri, {}).setdefault(label.language, label.value)
+    return index
+
+
+@lru_cache(maxsize=None)
+def _load_vocabularies(offline: bool) -> Tuple[Any, LabelIndex]:
+    """Parse the RDF and RDFS vocabularies once per process.
+
+    The bundled copy is used when `offline` is set and it is available,
+    otherwise the vocabularies are fetched from w3.org.
+    """
+    from rdflib import Graph
+    from rdflib.namespace import RDF, RDFS
+
+    graph = Graph()
+    if offline and VOCABULARIES_PATH.exists():
+        graph.parse(VOCABULARIES_PATH, format="turtle")
+    else:
+        graph.parse(str(RDF))
+        graph.parse(str(RDFS))
+    return graph, _build_label_index(graph)
+
 
 class RDFReader(BaseReader):
-    """RDF reader."""
+    """RDF reader.
+
+    Args:
+        offline (bool): Read the RDF and RDFS vocabularies from the copy
+            bundled with the loader instead of fetching them from w3.org.
+            Default is True.
+    """
 
     def __init__(
         self,
         *args: Any,
+        offline: bool = True,
         **kwargs: Any,
     ) -> None:
         """Initialize loader."""
@@ -24,6 +73,7 @@ class RDFReader(BaseReader):
         self.Graph = Graph
         self.RDF = RDF
         self.RDFS = RDFS
+        self.offline = offline
 
     def fetch_labels(self, uri: Any, graph: Any, lang: str):
         """Fetch all labels of a URI by language."""
@@ -36,15 +86,27 @@ class RDFReader(BaseReader):
         )
 
     def fetch_label_in_graphs(self, uri: Any, lang: str = "en"):
-        """Fetch one label of a URI by language from the local or global graph."""
-
-        labels = self.fetch_labels(uri, self.g_local, lang)
-        if len(labels) > 0:
-            return labels[0].value
-
-        labels = self.fetch_labels(uri, self.g_global, lang)
-        if len(labels) > 0:
-            return labels[0].value
+        """Fetch one label of a URI by language from the local or global graph.
+
+        Labels in the requested language are preferred over plain labels.
+        Lookups are memoized until the next call to `load_data`.
+        """
+        key = (uri, lang)
+        if key in self._label_cache:
+            return self._label_cache[key]
+
+        for index in (self._local_index, self._global_index):
+            labels = index.get(uri)
+            if labels is None:
+                continue
+            if lang in labels:
+                label = labels[lang]
+            elif None in labels:
+                label = labels[None]
+            else:
+                continue
+            self._label_cache[key] = label
+            return label
 
         raise Exception(f"Label not found for: {uri}")
 
@@ -57,10 +119,9 @@ class RDFReader(BaseReader):
 
         self.g_local = self.Graph()
         self.g_local.parse(file)
-
-        self.g_global = self.Graph()
-        self.g_global.parse(str(self.RDF))
-        self.g_global.parse(str(self.RDFS))
+        self.g_global, self._global_index = _load_vocabularies(self.offline)
+        self._local_index = _build_label_index(self.g_local)
+        self._label_cache: Dict[Tuple[Any, str], Any] = {}
 
         text_list = []
 
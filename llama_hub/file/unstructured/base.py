@@ -4,15 +4,100 @@ A parser for unstructured text files using Unstructured.io.
 Supports .txt, .docx, .pptx, .jpg, .png, .eml, .html, and .pdf documents.
 
 """
+import multiprocessing
+import weakref
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+# Element metadata fields never copied into documents. Coordinates do not
+# serialize, and parent_id might cause interference.
+SKIPPED_METADATA_FIELDS = {"_known_field_names", "coordinates", "parent_id"}
+
+
+def _partition(file: str, api: bool, api_key: str, server_url: str) -> List[Any]:
+    """Partition a file into elements, locally or through the API."""
+    if api:
+        from unstructured.partition.api import partition_via_api
+
+        return partition_via_api(
+            filename=file,
+            api_key=api_key,
+            api_url=server_url + "/general/v0/general",
+        )
+
+    from unstructured.partition.auto import partition
+
+    return partition(filename=file)
+
+
+def _element_metadata(
+    node: Any, metadata_fields: Optional[List[str]]
+) -> Dict[str, Any]:
+    """Get the metadata of an element, or only the selected fields of it."""
+    if not hasattr(node, "metadata"):
+        return {}
+
+    if metadata_fields is None:
+        return {
+            field: val
+            for field, val in vars(node.metadata).items()
+            if field not in SKIPPED_METADATA_FIELDS
+        }
+
+    metadata = {}
+    for field in metadata_fields:
+        val = getattr(node.metadata, field, None)
+        if val is not None:
+            metadata[field] = val
+    return metadata
+
+
+def _parse_elements(
+    elements: List[Any],
+    split_documents: bool,
+    metadata_fields: Optional[List[str]],
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """Turn elements into the text and metadata of each document."""
+    if split_documents:
+        return [
+            (node.text, _element_metadata(node, metadata_fields)) for node in elements
+        ]
+
+    # Create a single document by joining all the texts
+    text_chunks = [" ".join(str(el).split()) for el in elements]
+    return [("\n\n".join(text_chunks), {})]
+
+
+def _init_worker() -> None:
+    """Import the partitioners once per worker process of the pool."""
+    from unstructured.partition.auto import partition  # noqa: F401
+
+
+def _parse_file(
+    task: Tuple[str, bool, str, str, bool, Optional[List[str]]]
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """Partition a file and parse its elements, in a worker process or not."""
+    file, api, api_key, server_url, split_documents, metadata_fields = task
+    elements = _partition(file, api, api_key, server_url)
+    return _parse_elements(elements, split_documents, metadata_fields)
+
 
 class UnstructuredReader(BaseReader):
-    """General unstructured text reader for a variety of files."""
+    """General unstructured text reader for a variety of files.
+
+    Keyword Args:
+        url (str): URL of the Unstructured.io API, which is then used to
+            partition files.
+        api (bool): Whether to partition files through the API.
+        api_key (str): Key of the Unstructured.io API.
+        num_workers (int): Number of worker processes `load_data_batch`
+            partitions files in. The pool is started on first use and reused
+            until `close` is called, the reader is used as a context manager
+            and its block ends, or the reader is garbage collected.
+    """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Init params."""
@@ -32,20 +117,63 @@ class UnstructuredReader(BaseReader):
         if "api_key" in kwargs:
             self.api_key = kwargs["api_key"]
 
+        self.num_workers: Optional[int] = None
+        if "num_workers" in kwargs:
+            self.num_workers = kwargs["num_workers"]
+        self._pool: Any = None
+        self._pool_finalizer: Optional[weakref.finalize] = None
+
         # Prerequisite for Unstructured.io to work
         import nltk
 
         nltk.download("punkt")
         nltk.download("averaged_perceptron_tagger")
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # the worker pool cannot be pickled
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_pool_finalizer"] = None
+        return state
+
+    def __enter__(self) -> "UnstructuredReader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _get_pool(self) -> Any:
+        """Get the worker pool, starting it on first use."""
+        if self._pool is None:
+            ctx = multiprocessing.get_context("spawn")
+            self._pool = ctx.Pool(processes=self.num_workers, initializer=_init_worker)
+            # stop the workers if the reader is dropped without `close`
+            self._pool_finalizer = weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    def _to_documents(
+        self,
+        parsed: List[Tuple[str, Dict[str, Any]]],
+        file: Path,
+        extra_info: Optional[Dict],
+    ) -> List[Document]:
+        docs = []
+        for text, metadata in parsed:
+            if extra_info is not None:
+                metadata.update(extra_info)
+
+            metadata["filename"] = str(file)
+            docs.append(Document(text=text, extra_info=metadata))
+        return docs
+
     """ Loads data usin Unstructured.io py
-    
+
         Depending on the constructin if url is set or api = True
         it'll parse file using API call, else parse it locally
-        extra_info is extended by the returned metadata if 
+        extra_info is extended by the returned metadata if
         split_documents is True
-        
-        Returns list of documents  
+
+        Returns list of documents
     """
 
     def load_data(
@@ -53,57 +181,70 @@ class UnstructuredReader(BaseReader):
         file: Path,
         extra_info: Optional[Dict] = None,
         split_documents: Optional[bool] = False,
+        metadata_fields: Optional[List[str]] = None,
     ) -> List[Document]:
-        """If api is set, parse through api"""
-        if self.api:
-            from unstructured.partition.api import partition_via_api
-
-            elements = partition_via_api(
-                filename=str(file),
-                api_key=self.api_key,
-                api_url=self.server_url + "/general/v0/general",
-            )
-        else:
-            """Parse file locally"""
-            from unstructured.partition.auto import partition
+        """If api is set, parse through api
 
-            elements = partition(filename=str(file))
-
-        """ Process elements """
-        docs = []
-        if split_documents:
-            for node in elements:
-                metadata = {}
-                if hasattr(node, "metadata"):
-                    """Load metadata fields"""
-                    for field, val in vars(node.metadata).items():
-                        if field == "_known_field_names":
-                            continue
-                        # removing coordinates because it does not serialize
-                        # and dont want to bother with it
-                        if field == "coordinates":
-                            continue
-                        # removing bc it might cause interference
-                        if field == "parent_id":
-                            continue
-                        metadata[field] = val
-
-                if extra_info is not None:
-                    metadata.update(extra_info)
-
-                metadata["filename"] = str(file)
-                docs.append(Document(text=node.text, extra_info=metadata))
+        metadata_fields selects the element metadata fields copied into each
+        document when split_documents is True. All fields are copied if None.
+        """
+        elements = _partition(str(file), self.api, self.api_key, self.server_url)
+        parsed = _parse_elements(elements, bool(split_documents), metadata_fields)
+        return self._to_documents(parsed, file, extra_info)
 
+    def load_data_batch(
+        self,
+        files: List[Path],
+        extra_infos: Optional[List[Optional[Dict]]] = None,
+        split_documents: Optional[bool] = False,
+        metadata_fields: Optional[List[str]] = None,
+    ) -> List[Document]:
+        """Parse many files, in the worker pool if num_workers is set.
+
+        Each worker imports the partitioners and loads the NLTK data once, and
+        only sends back the text and selected metadata of the elements.
+
+        Args:
+            files (List[Path]): Files to parse.
+            extra_infos (Optional[List[Optional[Dict]]]): Metadata of the
+                documents of each file. Default is no metadata.
+            split_documents (Optional[bool]): Whether to create one document per
+                element instead of one per file. Default is False.
+            metadata_fields (Optional[List[str]]): Element metadata fields
+                copied into the documents when split_documents is True. All
+                fields are copied if None.
+        """
+        if extra_infos is None:
+            extra_infos = [None] * len(files)
+
+        tasks = [
+            (
+                str(file),
+                self.api,
+                self.api_key,
+                self.server_url,
+                bool(split_documents),
+                metadata_fields,
+            )
+            for file in files
+        ]
+        if self.num_workers is None or self.num_workers <= 1:
+            results = map(_parse_file, tasks)
         else:
-            text_chunks = [" ".join(str(el).split()) for el in elements]
-
-            metadata = {}
-
-            if extra_info is not None:
-                metadata.update(extra_info)
-
-            metadata["filename"] = str(file)
-            # Create a single document by joining all the texts
-            docs.append(Document(text="\n\n".join(text_chunks), extra_info=metadata))
+            chunksize = max(1, len(tasks) // (self.num_workers * 4))
+            results = self._get_pool().imap(_parse_file, tasks, chunksize)
 
+        docs = []
+        for file, extra_info, parsed in zip(files, extra_infos, results):
+            docs.extend(self._to_documents(parsed, file, extra_info))
         return docs
+
+    def close(self) -> None:
+        """Stop the worker pool of `load_data_batch`."""
+        if self._pool is not None:
+            if self._pool_finalizer is not None:
+                self._pool_finalizer.detach()
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pool_finalizer = None
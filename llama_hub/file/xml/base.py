@@ -2,7 +2,7 @@
 
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
@@ -65,13 +65,71 @@ class XMLReader(BaseReader):
         nodes = _get_leaf_nodes_up_to_level(root, self.tree_level_split)
         documents = []
         for node in nodes:
-            content = ET.tostring(node, encoding="utf8").decode("utf-8")
-            content = re.sub(r"^<\?xml.*", "", content)
-            content = content.strip()
-            documents.append(Document(text=content, extra_info=extra_info or {}))
+            documents.append(self._parse_node_to_document(node, extra_info))
 
         return documents
 
+    def _parse_node_to_document(
+        self, node: ET.Element, extra_info: Optional[Dict] = None
+    ) -> Document:
+        """Serialize a single XML node into a Document."""
+        content = ET.tostring(node, encoding="utf8").decode("utf-8")
+        content = re.sub(r"^<\?xml.*", "", content)
+        content = content.strip()
+        return Document(text=content, extra_info=extra_info or {})
+
+    def lazy_load_data(
+        self,
+        file: Path,
+        extra_info: Optional[Dict] = None,
+    ) -> Iterator[Document]:
+        """Load data from the input file with an incremental parser.
+
+        Produces the same documents as `load_data`, but each one is yielded as
+        soon as its node has been parsed, and processed nodes are then removed
+        from the tree. Memory stays roughly constant for files made of many
+        nodes at `tree_level_split`.
+
+        Args:
+            file (Path): Path to the input file.
+            extra_info (Optional[Dict]): Additional information. Default is None.
+
+        Returns:
+            Iterator[Document]: Iterator over the documents.
+        """
+        if not isinstance(file, Path):
+            file = Path(file)
+
+        # open elements, with whether any child has been seen, since emitted
+        # children are removed from their parent
+        stack: List[List[Any]] = []
+        # a node is serialized on the next event, once its tail has been parsed
+        pending = None
+        for event, elem in ET.iterparse(str(file), events=("start", "end")):
+            if pending is not None:
+                node, parent = pending
+                yield self._parse_node_to_document(node, extra_info)
+                node.clear()
+                if parent is not None:
+                    parent.remove(node)
+                pending = None
+
+            if event == "start":
+                if stack:
+                    stack[-1][1] = True
+                stack.append([elem, False])
+                continue
+
+            _, has_children = stack.pop()
+            level = len(stack)
+            if level == self.tree_level_split or (
+                level < self.tree_level_split and not has_children
+            ):
+                pending = (elem, stack[-1][0] if stack else None)
+
+        if pending is not None:
+            yield self._parse_node_to_document(pending[0], extra_info)
+
     def load_data(
         self,
         file: Path,
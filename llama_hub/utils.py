@@ -2,24 +2,142 @@
 
 import importlib
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Type
+from typing import Any, Dict, Optional, Type, Union
 
 from llama_index.readers.base import BaseReader
 
 LIBRARY_JSON_PATH = Path(__file__).parent / "library.json"
+TOOLS_LIBRARY_JSON_PATH = Path(__file__).parent / "tools" / "library.json"
+LLAMA_PACKS_LIBRARY_JSON_PATH = Path(__file__).parent / "llama_packs" / "library.json"
+LLAMA_DATASETS_LIBRARY_JSON_PATH = (
+    Path(__file__).parent / "llama_datasets" / "library.json"
+)
 
+# catalog name -> library json file
+CATALOG_PATHS: Dict[str, Path] = {
+    "loaders": LIBRARY_JSON_PATH,
+    "tools": TOOLS_LIBRARY_JSON_PATH,
+    "llama_packs": LLAMA_PACKS_LIBRARY_JSON_PATH,
+    "llama_datasets": LLAMA_DATASETS_LIBRARY_JSON_PATH,
+}
 
-def import_loader(reader_str: str) -> Type[BaseReader]:
-    """Import or download loader."""
+# Optional precompiled index of all catalogs, see `build_registry_index`.
+# Can be overridden with the LLAMA_HUB_REGISTRY_INDEX environment variable.
+REGISTRY_INDEX_PATH = Path(__file__).parent / "registry_index.json"
+REGISTRY_INDEX_VERSION = 1
+
+
+def _catalog_fingerprint() -> Dict[str, Any]:
+    """Size and mtime of every catalog, used to detect a stale index."""
+    fingerprint = {}
+    for catalog, path in CATALOG_PATHS.items():
+        stat = path.stat()
+        fingerprint[catalog] = [stat.st_size, stat.st_mtime]
+    return fingerprint
+
+
+class LoaderRegistry:
+    """Index of every entry in the LlamaHub catalogs.
+
+    Maps the name of each loader, tool, llama pack and llama dataset to its
+    directory id. Modules are only imported when an entry is loaded, and the
+    loaded classes are memoized.
+
+    Args:
+        catalogs (Dict[str, Dict[str, str]]): A mapping of catalog name
+            (see CATALOG_PATHS) to a mapping of entry name to directory id.
+    """
+
+    def __init__(self, catalogs: Dict[str, Dict[str, str]]) -> None:
+        """Initialize with the catalog entries."""
+        self.catalogs = catalogs
+        self._classes: Dict[str, Dict[str, Type]] = {
+            catalog: {} for catalog in catalogs
+        }
+
+    @classmethod
+    def from_catalogs(cls) -> "LoaderRegistry":
+        """Build the registry by reading every library json file."""
+        catalogs = {}
+        for catalog, path in CATALOG_PATHS.items():
+            with open(path, "r") as json_file:
+                json_dict = json.load(json_file)
+            catalogs[catalog] = {
+                name: str(entry["id"]) for name, entry in json_dict.items()
+            }
+        return cls(catalogs)
+
+    @classmethod
+    def from_index(cls, index_path: Union[str, Path]) -> Optional["LoaderRegistry"]:
+        """Build the registry from a precompiled index.
+
+        Returns None if the index was built from different catalog files.
+        """
+        with open(index_path, "r") as index_file:
+            index = json.load(index_file)
+        if (
+            index.get("version") != REGISTRY_INDEX_VERSION
+            or index.get("fingerprint") != _catalog_fingerprint()
+        ):
+            return None
+        return cls(index["catalogs"])
 
-    # read library json file
-    with open(LIBRARY_JSON_PATH, "r") as json_file:
-        json_dict = json.load(json_file)
+    def save_index(self, index_path: Union[str, Path]) -> None:
+        """Write the registry to a precompiled index file."""
+        index = {
+            "version": REGISTRY_INDEX_VERSION,
+            "fingerprint": _catalog_fingerprint(),
+            "catalogs": self.catalogs,
+        }
+        with open(index_path, "w") as index_file:
+            json.dump(index, index_file)
 
-    dir_name = str(json_dict[reader_str]["id"])
+    def get_id(self, name: str, catalog: str = "loaders") -> str:
+        """Get the directory id of an entry, e.g. `file/pdf`."""
+        return self.catalogs[catalog][name]
 
-    fmt_dir_name = dir_name.replace("/", ".")
-    module = importlib.import_module("llama_hub." + fmt_dir_name + ".base")
-    reader_cls = getattr(module, reader_str)
-    return reader_cls
+    def get_module_path(self, name: str, catalog: str = "loaders") -> str:
+        """Get the dotted path of the module that defines an entry."""
+        module_path = "llama_hub." + self.get_id(name, catalog).replace("/", ".")
+        if catalog == "llama_datasets":
+            # datasets are data directories without a base module
+            return module_path
+        return module_path + ".base"
+
+    def load(self, name: str, catalog: str = "loaders") -> Type:
+        """Import and return the class of an entry."""
+        if catalog == "llama_datasets":
+            raise ValueError(f"Dataset {name} does not define a class to load.")
+
+        classes = self._classes.setdefault(catalog, {})
+        if name not in classes:
+            module = importlib.import_module(self.get_module_path(name, catalog))
+            classes[name] = getattr(module, name)
+        return classes[name]
+
+
+@lru_cache(maxsize=None)
+def get_registry() -> LoaderRegistry:
+    """Get the process-wide registry, building it on first use.
+
+    A precompiled index is used if one exists and matches the catalogs.
+    """
+    index_path = Path(os.environ.get("LLAMA_HUB_REGISTRY_INDEX", REGISTRY_INDEX_PATH))
+    if index_path.exists():
+        registry = LoaderRegistry.from_index(index_path)
+        if registry is not None:
+            return registry
+    return LoaderRegistry.from_catalogs()
+
+
+def build_registry_index(index_path: Union[str, Path] = REGISTRY_INDEX_PATH) -> None:
+    """Precompile the catalogs into an index file for faster cold starts."""
+    LoaderRegistry.from_catalogs().save_index(index_path)
+
+
+def import_loader(reader_str: str) -> Type[BaseReader]:
+    """Import or download loader."""
+    return get_registry().load(reader_str, "loaders")
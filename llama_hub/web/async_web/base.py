@@ -1,12 +1,51 @@
 import asyncio
 import logging
-from typing import List
+import multiprocessing
+from collections import defaultdict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlsplit
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.web.http_cache import HTTPCache, HTTPResponse
+
 logger = logging.getLogger(__name__)
 
+# Statuses of transient errors that are retried.
+RETRY_STATUSES = {429, 503}
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header, in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
 
 class AsyncWebPageReader(BaseReader):
     """Asynchronous web page reader.
@@ -19,6 +58,24 @@ class AsyncWebPageReader(BaseReader):
         limit (int): Maximum number of concurrent requests.
         dedupe (bool): to deduplicate urls if there is exact-match within given list
         fail_on_error (bool): if requested url does not return status code 200 the routine will raise an ValueError
+        num_workers (Optional[int]): Number of worker processes converting HTML
+            to text while pages are fetched. HTML is converted in the event
+            loop thread when None.
+        limit_per_host (int): Maximum number of concurrent requests to the
+            same host. URLs of other hosts are fetched while a host is at its
+            limit. 0 means no limit.
+        max_retries (int): Number of times a request is retried after a 429
+            or 503 response, a connection error or a timeout.
+        backoff_factor (float): Retries wait backoff_factor * 2 ** attempt
+            seconds, or as long as the Retry-After header asks.
+        max_backoff (float): Maximum number of seconds to wait before a retry.
+        timeout (Optional[float]): Timeout of each request in seconds.
+            Default is aiohttp's, 5 minutes with 30 seconds to connect.
+        connector_limit (int): Maximum number of open connections.
+        keepalive_timeout (float): Seconds idle connections are kept open.
+        cache (Optional[HTTPCache]): Cache of the pages, revalidated with
+            conditional requests so unchanged pages are not downloaded again.
+            Default is None.
     """
 
     def __init__(
@@ -27,6 +84,15 @@ class AsyncWebPageReader(BaseReader):
         limit: int = 10,
         dedupe: bool = True,
         fail_on_error: bool = False,
+        num_workers: Optional[int] = None,
+        limit_per_host: int = 0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        timeout: Optional[float] = None,
+        connector_limit: int = 100,
+        keepalive_timeout: float = 15.0,
+        cache: Optional[HTTPCache] = None,
     ) -> None:
         """Initialize with parameters."""
 
@@ -46,71 +112,300 @@ class AsyncWebPageReader(BaseReader):
         self._html_to_text = html_to_text
         self._dedupe = dedupe
         self._fail_on_error = fail_on_error
+        self._num_workers = num_workers
+        self._limit_per_host = limit_per_host
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._max_backoff = max_backoff
+        self._timeout = timeout
+        self._connector_limit = connector_limit
+        self._keepalive_timeout = keepalive_timeout
+        self._cache = cache
 
-    def load_data(self, urls: List[str]) -> List[Document]:
-        """Load data from the input urls.
+    async def _aget(self, url: str, session: Any) -> HTTPResponse:
+        """Get a page, retrying transient errors with exponential backoff."""
+        import aiohttp
+
+        attempt = 0
+        while True:
+            delay = min(self._max_backoff, self._backoff_factor * 2**attempt)
+            try:
+                if self._cache is not None:
+                    response = await self._cache.afetch(url, session)
+                else:
+                    async with session.get(url) as client_response:
+                        response = await HTTPResponse.from_aiohttp(client_response)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self._max_retries:
+                    raise
+            else:
+                if (
+                    response.status not in RETRY_STATUSES
+                    or attempt >= self._max_retries
+                ):
+                    return response
+                retry_after = _retry_after(response.headers.get("retry-after"))
+                if retry_after is not None:
+                    delay = min(self._max_backoff, retry_after)
+
+            logger.info(f"retrying {url} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _aload_url(
+        self, url: str, session: Any, executor: Optional[Executor]
+    ) -> Optional[Document]:
+        """Fetch a page and convert it to a document, or None on error."""
+        try:
+            response = await self._aget(url, session)
+        except Exception as e:
+            raise ValueError(f"One of the inputs is not a valid url: {url}") from e
+
+        if response.status != 200:
+            logger.warning(f"error fetching page from {url}")
+            logger.info(response.headers)
+
+            if self._fail_on_error:
+                raise ValueError(
+                    f"error fetching page from {url}. server returned status:"
+                    f" {response.status} and response {response.text}"
+                )
+
+            return None
+
+        raw_page = response.text
+        if self._html_to_text:
+            import html2text
+
+            if executor is not None:
+                loop = asyncio.get_running_loop()
+                response_text = await loop.run_in_executor(
+                    executor, html2text.html2text, raw_page
+                )
+            else:
+                response_text = html2text.html2text(raw_page)
+        else:
+            response_text = raw_page
+
+        return Document(text=response_text, extra_info={"Source": response.url})
+
+    async def alazy_load_indexed_data(
+        self, urls: Union[List[str], AsyncIterable[str]]
+    ) -> AsyncIterator[Tuple[int, Document]]:
+        """Yield the index and document of each url as soon as it is loaded.
+
+        At most `limit` pages are fetched or converted at the same time, so
+        memory stays bounded however many urls are given. Hosts take turns,
+        and a host at `limit_per_host` does not hold up the others.
+
+        Urls may also come from an async iterable, e.g. while a sitemap is
+        parsed. They are then taken as pages finish, keeping at most `limit`
+        of them queued, and indexed in the order they come.
 
         Args:
-            urls (List[str]): List of URLs to scrape.
+            urls (Union[List[str], AsyncIterable[str]]): URLs to scrape, or
+                an async iterable of them.
 
         Returns:
-            List[Document]: List of documents.
+            AsyncIterator[Tuple[int, Document]]: The index of the url of each
+                page that loaded, and its document, in the order pages
+                finished loading.
 
         """
-        if self._dedupe:
-            urls = list(dict.fromkeys(urls))
+        url_iterator: Optional[AsyncIterator[str]] = None
+        if isinstance(urls, list):
+            if self._dedupe:
+                urls = list(dict.fromkeys(urls))
+        elif hasattr(urls, "__aiter__"):
+            url_iterator = urls.__aiter__()
+            urls = []
+        else:
+            raise ValueError("urls must be a list of strings.")
 
         import aiohttp
 
-        def chunked_http_client(limit: int):
-            semaphore = asyncio.Semaphore(limit)
-
-            async def http_get(url: str, session: aiohttp.ClientSession):
-                async with semaphore:
-                    async with session.get(url) as response:
-                        return response, await response.text()
+        executor = None
+        if self._html_to_text and self._num_workers is not None:
+            executor = ProcessPoolExecutor(
+                max_workers=self._num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
 
-            return http_get
+        # queued urls and number of requests in flight of each host
+        queues: Dict[str, Deque[Tuple[int, str]]] = defaultdict(deque)
+        for i, url in enumerate(urls):
+            queues[urlsplit(url).netloc].append((i, url))
+        num_queued = len(urls)
+        active: Dict[str, int] = defaultdict(int)
+        # hosts with queued urls that are below their limit, in turn order
+        ready: Deque[str] = deque(queues)
+        is_ready = set(ready)
 
-        async def fetch_urls(urls: List[str]):
-            http_client = chunked_http_client(self._limit)
-            async with aiohttp.ClientSession() as session:
-                tasks = [http_client(url, session) for url in urls]
-                return await asyncio.gather(*tasks, return_exceptions=True)
+        def host_can_start(host: str) -> bool:
+            return bool(queues[host]) and (
+                self._limit_per_host <= 0 or active[host] < self._limit_per_host
+            )
 
-        if not isinstance(urls, list):
-            raise ValueError("urls must be a list of strings.")
+        # urls taken from url_iterator so far, and the ones not to load again
+        num_received = 0
+        seen = set()
+        next_url: Optional[asyncio.Future] = None
 
-        documents = []
-        responses = asyncio.run(fetch_urls(urls))
+        def receive() -> None:
+            nonlocal next_url
+            if url_iterator is not None and next_url is None:
+                if num_queued < self._limit:
+                    next_url = asyncio.ensure_future(url_iterator.__anext__())
 
-        for i, response_tuple in enumerate(responses):
-            if not isinstance(response_tuple, tuple):
-                raise ValueError(f"One of the inputs is not a valid url: {urls[i]}")
+        def enqueue(url: str) -> None:
+            nonlocal num_queued, num_received
+            i = num_received
+            num_received += 1
+            if self._dedupe:
+                if url in seen:
+                    return
+                seen.add(url)
+            host = urlsplit(url).netloc
+            queues[host].append((i, url))
+            num_queued += 1
+            if host not in is_ready and host_can_start(host):
+                ready.append(host)
+                is_ready.add(host)
 
-            response, raw_page = response_tuple
+        # pending task -> index and host of its url
+        pending: Dict[asyncio.Future, Tuple[int, str]] = {}
+        connector = aiohttp.TCPConnector(
+            limit=self._connector_limit,
+            limit_per_host=max(0, self._limit_per_host),
+            keepalive_timeout=self._keepalive_timeout,
+        )
+        session_kwargs: Dict[str, Any] = {}
+        if self._timeout is not None:
+            session_kwargs["timeout"] = aiohttp.ClientTimeout(total=self._timeout)
+        try:
+            async with aiohttp.ClientSession(
+                connector=connector, **session_kwargs
+            ) as session:
 
-            if response.status != 200:
-                logger.warning(f"error fetching page from {urls[i]}")
-                logger.info(response)
+                def schedule() -> None:
+                    nonlocal num_queued
+                    # keep at most `limit` urls in flight
+                    while len(pending) < self._limit and ready:
+                        host = ready.popleft()
+                        i, url = queues[host].popleft()
+                        num_queued -= 1
+                        active[host] += 1
+                        task = asyncio.ensure_future(
+                            self._aload_url(url, session, executor)
+                        )
+                        pending[task] = (i, host)
+                        if host_can_start(host):
+                            ready.append(host)
+                        else:
+                            is_ready.discard(host)
 
-                if self._fail_on_error:
-                    raise ValueError(
-                        f"error fetching page from {urls[i]}. server returned status:"
-                        f" {response.status} and response {raw_page}"
+                schedule()
+                receive()
+                while pending or next_url is not None:
+                    waiting = set(pending)
+                    if next_url is not None:
+                        waiting.add(next_url)
+                    done, _ = await asyncio.wait(
+                        waiting, return_when=asyncio.FIRST_COMPLETED
                     )
+                    if next_url in done:
+                        done.discard(next_url)
+                        try:
+                            enqueue(next_url.result())
+                        except StopAsyncIteration:
+                            url_iterator = None
+                        next_url = None
+                    indexes = []
+                    for task in done:
+                        i, host = pending.pop(task)
+                        indexes.append(i)
+                        active[host] -= 1
+                        if host not in is_ready and host_can_start(host):
+                            ready.append(host)
+                            is_ready.add(host)
+                    schedule()
+                    receive()
+                    for task, i in zip(done, indexes):
+                        document = task.result()
+                        if document is not None:
+                            yield i, document
+        finally:
+            tasks = list(pending)
+            if next_url is not None:
+                tasks.append(next_url)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if executor is not None:
+                executor.shutdown()
 
-                continue
+    async def alazy_load_data(
+        self, urls: Union[List[str], AsyncIterable[str]]
+    ) -> AsyncIterator[Document]:
+        """Load data from the input urls, yielding documents as pages finish.
 
-            if self._html_to_text:
-                import html2text
+        Args:
+            urls (Union[List[str], AsyncIterable[str]]): URLs to scrape, or
+                an async iterable of them, consumed as pages finish.
 
-                response_text = html2text.html2text(raw_page)
-            else:
-                response_text = raw_page
+        Returns:
+            AsyncIterator[Document]: Documents, in the order their pages
+                finished loading.
 
-            documents.append(
-                Document(text=response_text, extra_info={"Source": str(response.url)})
-            )
+        """
+        indexed_documents = self.alazy_load_indexed_data(urls)
+        try:
+            async for _, document in indexed_documents:
+                yield document
+        finally:
+            await indexed_documents.aclose()
+
+    def lazy_load_data(self, urls: List[str]) -> Iterator[Document]:
+        """Load data from the input urls, yielding documents as pages finish.
+
+        Runs `alazy_load_data` on a new event loop.
+
+        Args:
+            urls (List[str]): List of URLs to scrape.
+
+        Returns:
+            Iterator[Document]: Documents, in the order their pages finished
+                loading.
+
+        """
+        loop = asyncio.new_event_loop()
+        documents = self.alazy_load_data(urls)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(documents.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(documents.aclose())
+            loop.close()
+
+    def load_data(self, urls: List[str]) -> List[Document]:
+        """Load data from the input urls.
+
+        Args:
+            urls (List[str]): List of URLs to scrape.
+
+        Returns:
+            List[Document]: List of documents.
+
+        """
+
+        async def load_indexed() -> List[Tuple[int, Document]]:
+            return [indexed async for indexed in self.alazy_load_indexed_data(urls)]
+
+        indexed_documents = asyncio.run(load_indexed())
 
-        return documents
+        # keep the order of the input urls
+        indexed_documents.sort(key=lambda indexed: indexed[0])
+        return [document for _, document in indexed_documents]
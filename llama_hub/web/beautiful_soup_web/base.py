@@ -7,6 +7,8 @@ from urllib.parse import urljoin
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.web.http_cache import HTTPCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -141,14 +143,19 @@ class BeautifulSoupWebReader(BaseReader):
         website_extractor (Optional[Dict[str, Callable]]): A mapping of website
             hostname (e.g. google.com) to a function that specifies how to
             extract text from the BeautifulSoup obj. See DEFAULT_WEBSITE_EXTRACTOR.
+        cache (Optional[HTTPCache]): Cache of the pages, revalidated with
+            conditional requests so unchanged pages are not downloaded again.
+            Default is None.
     """
 
     def __init__(
         self,
         website_extractor: Optional[Dict[str, Callable]] = None,
+        cache: Optional[HTTPCache] = None,
     ) -> None:
         """Initialize with parameters."""
         self.website_extractor = website_extractor or DEFAULT_WEBSITE_EXTRACTOR
+        self.cache = cache
 
     def load_data(
         self,
@@ -173,10 +180,11 @@ class BeautifulSoupWebReader(BaseReader):
         import requests
         from bs4 import BeautifulSoup
 
+        get = self.cache.fetch if self.cache is not None else requests.get
         documents = []
         for url in urls:
             try:
-                page = requests.get(url)
+                page = get(url)
             except Exception:
                 raise ValueError(f"One of the inputs is not a valid url: {url}")
 
@@ -0,0 +1,243 @@
+"""On-disk HTTP cache with conditional requests, shared by the web readers."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+CACHE_VERSION = 1
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+
+class HTTPResponse(NamedTuple):
+    """Body and headers of a response, fetched or served from the cache.
+
+    Header names are lowercase.
+    """
+
+    url: str
+    status: int
+    content: bytes
+    encoding: Optional[str]
+    headers: Dict[str, str]
+
+    @property
+    def text(self) -> str:
+        """Body of the response decoded to text."""
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    @classmethod
+    def from_requests(cls, response: Any) -> "HTTPResponse":
+        """Build from a `requests` response."""
+        return cls(
+            url=response.url,
+            status=response.status_code,
+            content=response.content,
+            encoding=response.encoding or response.apparent_encoding,
+            headers={name.lower(): value for name, value in response.headers.items()},
+        )
+
+    @classmethod
+    async def from_aiohttp(cls, response: Any) -> "HTTPResponse":
+        """Build from an `aiohttp` response, reading its body."""
+        content = await response.read()
+        return cls(
+            url=str(response.url),
+            status=response.status,
+            content=content,
+            encoding=response.get_encoding(),
+            headers={name.lower(): value for name, value in response.headers.items()},
+        )
+
+
+class HTTPCache:
+    """Cache of page bodies revalidated with conditional requests.
+
+    Bodies of successful responses carrying an `ETag` or `Last-Modified`
+    header are stored with those validators, keyed by URL. Later requests of
+    the same URL send `If-None-Match` and `If-Modified-Since`, and a 304 Not
+    Modified response is served from disk, so unchanged pages are never
+    downloaded twice. Responses without validators are not stored.
+
+    Each entry is one file holding a line of JSON metadata followed by the
+    body. When the total size exceeds `max_size`, the least recently used
+    entries are evicted until the cache fills 90% of it.
+
+    Args:
+        cache_dir (Union[str, Path]): Directory to store the cache entries in.
+        max_size (int): Maximum total size of the cache in bytes.
+            Default is 1 GiB.
+    """
+
+    def __init__(
+        self, cache_dir: Union[str, Path], max_size: int = DEFAULT_MAX_SIZE
+    ) -> None:
+        """Initialize with parameters."""
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        # total size of the entries, counted on first write
+        self._size: Optional[int] = None
+
+    def _entry_path(self, url: str) -> Path:
+        key = hashlib.sha256(f"{CACHE_VERSION} {url}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.http"
+
+    def _read_metadata(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._entry_path(url), "rb") as f:
+                metadata = json.loads(f.readline())
+        except (FileNotFoundError, ValueError):
+            return None
+        return metadata if metadata.get("request_url") == url else None
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """Get the conditional request headers revalidating a cached URL."""
+        metadata = self._read_metadata(url)
+        if metadata is None:
+            return {}
+
+        headers = {}
+        if "etag" in metadata["headers"]:
+            headers["If-None-Match"] = metadata["headers"]["etag"]
+        if "last-modified" in metadata["headers"]:
+            headers["If-Modified-Since"] = metadata["headers"]["last-modified"]
+        return headers
+
+    def get(self, url: str) -> Optional[HTTPResponse]:
+        """Get the cached response of a URL, or None on a cache miss."""
+        entry_path = self._entry_path(url)
+        try:
+            with open(entry_path, "rb") as f:
+                metadata = json.loads(f.readline())
+                content = f.read()
+        except (FileNotFoundError, ValueError):
+            return None
+        if metadata.get("request_url") != url:
+            return None
+
+        # mark the entry as recently used
+        try:
+            os.utime(entry_path)
+        except FileNotFoundError:
+            pass
+        return HTTPResponse(
+            url=metadata["url"],
+            status=metadata["status"],
+            content=content,
+            encoding=metadata["encoding"],
+            headers=metadata["headers"],
+        )
+
+    def put(self, url: str, response: HTTPResponse) -> None:
+        """Store the response of a URL if it can be revalidated later."""
+        if response.status != 200 or not (
+            "etag" in response.headers or "last-modified" in response.headers
+        ):
+            return
+
+        metadata = {
+            "request_url": url,
+            "url": response.url,
+            "status": response.status,
+            "encoding": response.encoding,
+            "headers": response.headers,
+        }
+        entry_path = self._entry_path(url)
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(metadata).encode("utf-8") + b"\n")
+            f.write(response.content)
+
+        if self._size is None:
+            self._size = self._scan()[0]
+        try:
+            self._size -= entry_path.stat().st_size
+        except FileNotFoundError:
+            pass
+        self._size += tmp_path.stat().st_size
+        os.replace(tmp_path, entry_path)
+
+        if self._size > self.max_size:
+            self._evict()
+
+    def _scan(self) -> Tuple[int, List[Tuple[float, int, str]]]:
+        """Get the total size and the (mtime, size, path) of every entry."""
+        entries = []
+        total_size = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".http"):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+        return total_size, entries
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits."""
+        total_size, entries = self._scan()
+        # leave some room, so the next writes do not evict again right away
+        target_size = self.max_size * 0.9
+        for _, size, path in sorted(entries):
+            if total_size <= target_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+        self._size = total_size
+
+    def fetch(self, url: str, session: Any = None, **kwargs: Any) -> HTTPResponse:
+        """Get a URL with `requests`, revalidating its cached response.
+
+        Args:
+            url (str): URL to get.
+            session (Any): `requests` session to use. Uses `requests.get`
+                when None.
+            **kwargs: Extra arguments of the `get` call.
+        """
+        import requests
+
+        get = session.get if session is not None else requests.get
+        headers = dict(kwargs.pop("headers", None) or {})
+        response = get(url, headers={**headers, **self.request_headers(url)}, **kwargs)
+        if response.status_code == 304:
+            cached = self.get(url)
+            if cached is not None:
+                return cached
+            # evicted in the meantime
+            response = get(url, headers=headers, **kwargs)
+
+        fetched = HTTPResponse.from_requests(response)
+        self.put(url, fetched)
+        return fetched
+
+    async def afetch(self, url: str, session: Any, **kwargs: Any) -> HTTPResponse:
+        """Get a URL with an `aiohttp` session, revalidating its cached response.
+
+        Args:
+            url (str): URL to get.
+            session (Any): `aiohttp` client session to use.
+            **kwargs: Extra arguments of the `get` call.
+        """
+        headers = dict(kwargs.pop("headers", None) or {})
+        async with session.get(
+            url, headers={**headers, **self.request_headers(url)}, **kwargs
+        ) as response:
+            fetched = None
+            if response.status != 304:
+                fetched = await HTTPResponse.from_aiohttp(response)
+
+        if fetched is None:
+            cached = self.get(url)
+            if cached is not None:
+                return cached
+            # evicted in the meantime
+            async with session.get(url, headers=headers, **kwargs) as response:
+                fetched = await HTTPResponse.from_aiohttp(response)
+
+        self.put(url, fetched)
+        return fetched
@@ -1,10 +1,12 @@
 """Rss reader."""
 
-from typing import List
+from typing import List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.web.http_cache import HTTPCache
+
 
 class RssReader(BaseReader):
     """RSS reader.
@@ -13,12 +15,17 @@ class RssReader(BaseReader):
 
     """
 
-    def __init__(self, html_to_text: bool = False) -> None:
+    def __init__(
+        self, html_to_text: bool = False, cache: Optional[HTTPCache] = None
+    ) -> None:
         """Initialize with parameters.
 
         Args:
             html_to_text (bool): Whether to convert HTML to text.
                 Requires `html2text` package.
+            cache (Optional[HTTPCache]): Cache of the feeds, revalidated with
+                conditional requests so unchanged feeds are not downloaded
+                again. Default is None.
 
         """
         try:
@@ -36,6 +43,7 @@ class RssReader(BaseReader):
                     "`html2text` package not found, please run `pip install html2text`"
                 )
         self._html_to_text = html_to_text
+        self._cache = cache
 
     def load_data(self, urls: List[str]) -> List[Document]:
         """Load data from RSS feeds.
@@ -55,7 +63,17 @@ class RssReader(BaseReader):
         documents = []
 
         for url in urls:
-            parsed = feedparser.parse(url)
+            if self._cache is not None:
+                response = self._cache.fetch(url)
+                parsed = feedparser.parse(
+                    response.content,
+                    response_headers={
+                        "content-location": response.url,
+                        "content-type": response.headers.get("content-type", ""),
+                    },
+                )
+            else:
+                parsed = feedparser.parse(url)
             for entry in parsed.entries:
                 if "content" in entry:
                     data = entry.content[0].value
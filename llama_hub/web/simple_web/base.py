@@ -1,10 +1,12 @@
 """Simple Web scraper."""
-from typing import List
+from typing import List, Optional
 
 import requests
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.web.http_cache import HTTPCache
+
 
 class SimpleWebPageReader(BaseReader):
     """Simple web page reader.
@@ -14,12 +16,18 @@ class SimpleWebPageReader(BaseReader):
     Args:
         html_to_text (bool): Whether to convert HTML to text.
             Requires `html2text` package.
+        cache (Optional[HTTPCache]): Cache of the pages, revalidated with
+            conditional requests so unchanged pages are not downloaded again.
+            Default is None.
 
     """
 
-    def __init__(self, html_to_text: bool = False) -> None:
+    def __init__(
+        self, html_to_text: bool = False, cache: Optional[HTTPCache] = None
+    ) -> None:
         """Initialize with parameters."""
         self._html_to_text = html_to_text
+        self._cache = cache
 
     def load_data(self, urls: List[str]) -> List[Document]:
         """Load data from the input directory.
@@ -34,9 +42,10 @@ class SimpleWebPageReader(BaseReader):
         if not isinstance(urls, list):
             raise ValueError("urls must be a list of strings.")
 
+        get = self._cache.fetch if self._cache is not None else requests.get
         documents = []
         for url in urls:
-            response = requests.get(url).text
+            response = get(url).text
             if self._html_to_text:
                 import html2text
 
@@ -1,60 +1,347 @@
-import urllib.request
+import asyncio
+import logging
+import re
 import xml.etree.ElementTree as ET
-from typing import List
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple, Union
 
-from llama_index import download_loader
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+from llama_hub.web.async_web.base import AsyncWebPageReader
+from llama_hub.web.http_cache import HTTPCache
+
+logger = logging.getLogger(__name__)
+
+# Maximum depth of nested sitemap indexes that are followed.
+MAX_DEPTH = 5
+# Size of the chunks sitemaps are decompressed and parsed in.
+CHUNK_SIZE = 64 * 1024
+# Number of page locations parsed ahead of the pages being loaded.
+LOCATION_QUEUE_SIZE = 1000
+
+# Short W3C datetime forms, and the fraction of a second of a time.
+_YEAR = re.compile(r"\d{4}")
+_YEAR_MONTH = re.compile(r"\d{4}-\d{2}")
+_FRACTION = re.compile(r"\.(\d+)")
+
+# A <url> or <sitemap> entry: its tag, location and last modification.
+SitemapEntry = Tuple[str, str, Optional[datetime]]
+
+
+def _parse_lastmod(value: Optional[str]) -> Optional[datetime]:
+    """Parse a W3C datetime of a <lastmod>, assuming UTC if it has no zone.
+
+    The forms `datetime.fromisoformat` rejects before Python 3.11 are
+    normalized first: a "Z" zone, a year or a year and month without a day,
+    and fractions of a second without exactly 3 or 6 digits.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value[-1:] in ("Z", "z"):
+        value = value[:-1] + "+00:00"
+    if _YEAR.fullmatch(value):
+        value += "-01-01"
+    elif _YEAR_MONTH.fullmatch(value):
+        value += "-01"
+    value = _FRACTION.sub(
+        lambda match: "." + match.group(1)[:6].ljust(6, "0"), value, count=1
+    )
+    try:
+        lastmod = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if lastmod.tzinfo is None:
+        lastmod = lastmod.replace(tzinfo=timezone.utc)
+    return lastmod
+
+
+class _SitemapParser:
+    """Incremental parser of sitemaps and sitemap indexes, gzipped or not.
+
+    Entries are returned as soon as their element is complete and then
+    dropped from the tree, so memory does not grow with the sitemap.
+    """
+
+    def __init__(self) -> None:
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._decompressor: Any = None
+        self._started = False
+        self._root: Optional[ET.Element] = None
+        # local name of each tag, without its namespace
+        self._local_names: Dict[str, str] = {}
+
+    def feed(self, chunk: bytes) -> List[SitemapEntry]:
+        if not self._started and chunk:
+            self._started = True
+            # gzip magic number, whether the url ends with .gz or not
+            if chunk[:2] == b"\x1f\x8b":
+                self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self._decompressor is not None:
+            chunk = self._decompressor.decompress(chunk)
+        self._parser.feed(chunk)
+        return self._read_entries()
+
+    def close(self) -> List[SitemapEntry]:
+        if self._decompressor is not None:
+            self._parser.feed(self._decompressor.flush())
+        self._parser.close()
+        return self._read_entries()
+
+    def _local_name(self, tag: str) -> str:
+        local_name = self._local_names.get(tag)
+        if local_name is None:
+            local_name = self._local_names[tag] = tag.rsplit("}", 1)[-1]
+        return local_name
+
+    def _read_entries(self) -> List[SitemapEntry]:
+        entries = []
+        for event, element in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                continue
+
+            tag = self._local_name(element.tag)
+            if tag != "url" and tag != "sitemap":
+                continue
+            loc, lastmod = None, None
+            for child in element:
+                child_tag = self._local_name(child.tag)
+                if child_tag == "loc":
+                    loc = (child.text or "").strip()
+                elif child_tag == "lastmod":
+                    lastmod = _parse_lastmod(child.text)
+            if loc:
+                entries.append((tag, loc, lastmod))
+
+        # drop the entries read so far from the tree
+        if self._root is not None:
+            self._root.clear()
+        return entries
+
 
 class SitemapReader(BaseReader):
     """Asynchronous sitemap reader for web.
 
-    Reads pages from the web based on their sitemap.xml.
+    Reads pages from the web based on their sitemap.xml. Sitemap indexes are
+    followed, fetching their sitemaps concurrently, and gzipped sitemaps are
+    decompressed and parsed as they download.
+
+    Pages are loaded while the sitemaps are parsed. After each `load_data`,
+    `watermark` holds the latest <lastmod> of the pages that loaded, kept
+    before the <lastmod> of any page or sitemap that failed. Passing it as
+    `since` to the next run only loads the pages modified in the meantime,
+    and the ones that failed.
 
     Args:
         sitemap_url (string): Path to the sitemap.xml. e.g. https://gpt-index.readthedocs.io/sitemap.xml
         html_to_text (bool): Whether to convert HTML to text.
             Requires `html2text` package.
         limit (int): Maximum number of concurrent requests.
+        cache (Optional[HTTPCache]): Cache of the sitemap and pages,
+            revalidated with conditional requests so unchanged pages are not
+            downloaded again. Default is None.
 
     """
 
     xml_schema_sitemap = "http://www.sitemaps.org/schemas/sitemap/0.9"
 
-    def __init__(self, html_to_text: bool = False, limit: int = 10) -> None:
+    def __init__(
+        self,
+        html_to_text: bool = False,
+        limit: int = 10,
+        cache: Optional[HTTPCache] = None,
+    ) -> None:
         """Initialize with parameters."""
 
-        try:
-            from llama_hub.utils import import_loader
-
-            AsyncWebPageReader = import_loader("AsyncWebPageReader")
-        except ImportError:
-            AsyncWebPageReader = download_loader("AsyncWebPageReader")
-
-        self._async_loader = AsyncWebPageReader(html_to_text=html_to_text, limit=limit)
+        # locations are deduplicated while the sitemap is parsed
+        self._async_loader = AsyncWebPageReader(
+            html_to_text=html_to_text, limit=limit, dedupe=False, cache=cache
+        )
         self._html_to_text = html_to_text
         self._limit = limit
+        self._cache = cache
+        self.watermark: Optional[datetime] = None
+
+    async def _afetch_entries(self, url: str, session: Any) -> List[SitemapEntry]:
+        """Fetch a sitemap and parse its entries while it downloads."""
+        parser = _SitemapParser()
+        entries = []
+        if self._cache is not None:
+            response = await self._cache.afetch(url, session)
+            if response.status != 200:
+                raise ValueError(
+                    f"error fetching sitemap {url}: status {response.status}"
+                )
+            for start in range(0, len(response.content), CHUNK_SIZE):
+                entries.extend(
+                    parser.feed(response.content[start : start + CHUNK_SIZE])
+                )
+        else:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    raise ValueError(
+                        f"error fetching sitemap {url}: status {response.status}"
+                    )
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    entries.extend(parser.feed(chunk))
+        entries.extend(parser.close())
+        return entries
+
+    async def _aiter_locations(
+        self,
+        sitemap_url: str,
+        since: Optional[datetime],
+        failed_sitemaps: List[Optional[datetime]],
+    ) -> AsyncIterator[Tuple[str, Optional[datetime]]]:
+        """Yield the page locations of a sitemap as its sitemaps are parsed.
+
+        Sitemap indexes are followed, and their sitemaps last modified before
+        `since` are not fetched. The <lastmod> of the sitemaps of an index
+        that could not be fetched is appended to `failed_sitemaps`.
+        """
+        import aiohttp
+
+        semaphore = asyncio.Semaphore(self._limit)
+        seen = {sitemap_url}
+        # locations parsed and not taken yet, waited for when full
+        queue: asyncio.Queue = asyncio.Queue(maxsize=LOCATION_QUEUE_SIZE)
+        tasks: Set[asyncio.Future] = set()
+
+        async def visit(
+            url: str, depth: int, lastmod: Optional[datetime], session: Any
+        ) -> None:
+            try:
+                async with semaphore:
+                    entries = await self._afetch_entries(url, session)
+            except Exception:
+                if depth == 0:
+                    raise
+                logger.warning(f"error fetching sitemap {url}", exc_info=True)
+                failed_sitemaps.append(lastmod)
+                return
+
+            for tag, loc, entry_lastmod in entries:
+                if tag == "url":
+                    await queue.put((loc, entry_lastmod))
+                elif depth >= MAX_DEPTH or loc in seen:
+                    logger.warning(f"skipping nested sitemap {loc}")
+                elif since is None or entry_lastmod is None or entry_lastmod > since:
+                    seen.add(loc)
+                    tasks.add(
+                        asyncio.ensure_future(
+                            visit(loc, depth + 1, entry_lastmod, session)
+                        )
+                    )
+
+        async with aiohttp.ClientSession() as session:
+            tasks.add(asyncio.ensure_future(visit(sitemap_url, 0, None, session)))
+            try:
+                while tasks or not queue.empty():
+                    if not queue.empty():
+                        yield queue.get_nowait()
+                        continue
+                    get = asyncio.ensure_future(queue.get())
+                    done, _ = await asyncio.wait(
+                        {get, *tasks}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if get not in done:
+                        get.cancel()
+                    for task in done:
+                        if task is not get:
+                            tasks.discard(task)
+                            # raises if the sitemap itself could not be fetched
+                            task.result()
+                    if get in done:
+                        yield get.result()
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _aload_indexed(
+        self,
+        sitemap_url: str,
+        filter: Optional[str],
+        since: Optional[datetime],
+    ) -> List[Tuple[int, Document]]:
+        """Load the pages of a sitemap while it is parsed.
 
-    def _load_sitemap(self, sitemap_url: str) -> str:
-        sitemap_url_request = urllib.request.urlopen(sitemap_url)
+        Returns the index of each loaded page in the sitemap, and advances
+        `watermark` over the pages that loaded only.
+        """
+        failed_sitemaps: List[Optional[datetime]] = []
+        # <lastmod> of the pages handed to the page loader and not loaded yet
+        unloaded: Dict[int, Optional[datetime]] = {}
+        seen: Set[str] = set()
 
-        return sitemap_url_request.read()
+        async def urls() -> AsyncIterator[str]:
+            locations = self._aiter_locations(sitemap_url, since, failed_sitemaps)
+            try:
+                async for loc, lastmod in locations:
+                    if loc in seen or (filter is not None and filter not in loc):
+                        continue
+                    if since is not None and lastmod is not None and lastmod <= since:
+                        continue
+                    unloaded[len(seen)] = lastmod
+                    seen.add(loc)
+                    yield loc
+            finally:
+                await locations.aclose()
 
-    def _parse_sitemap(self, raw_sitemap: str, filter_locs: str = None) -> list:
-        sitemap = ET.fromstring(raw_sitemap)
-        sitemap_urls = []
+        indexed_documents = []
+        watermark = since
+        async for i, document in self._async_loader.alazy_load_indexed_data(urls()):
+            lastmod = unloaded.pop(i)
+            if lastmod is not None and (watermark is None or lastmod > watermark):
+                watermark = lastmod
+            indexed_documents.append((i, document))
 
-        for url in sitemap.findall(f"{{{self.xml_schema_sitemap}}}url"):
-            location = url.find(f"{{{self.xml_schema_sitemap}}}loc").text
+        # the pages that did not load, and those of the sitemaps that could
+        # not be fetched, must be loaded again by a run from the watermark
+        if None in failed_sitemaps:
+            watermark = since
+        else:
+            retry_lastmods = [
+                lastmod
+                for lastmod in [*unloaded.values(), *failed_sitemaps]
+                if lastmod is not None
+            ]
+            if retry_lastmods and watermark is not None:
+                watermark = min(
+                    watermark, min(retry_lastmods) - timedelta(microseconds=1)
+                )
+        self.watermark = watermark
+        return indexed_documents
 
-            if filter_locs is None or filter_locs in location:
-                sitemap_urls.append(location)
+    def load_data(
+        self,
+        sitemap_url: str,
+        filter: str = None,
+        since: Optional[Union[datetime, str]] = None,
+    ) -> List[Document]:
+        """Load the pages of a sitemap.
 
-        return sitemap_urls
+        Args:
+            sitemap_url (str): URL of the sitemap or sitemap index.
+            filter (str): Only load the pages whose URL contains this string.
+            since (Optional[Union[datetime, str]]): Only load the pages whose
+                <lastmod> is later than this datetime, e.g. the `watermark`
+                of a previous run. Pages without <lastmod> are always loaded.
+        """
+        if isinstance(since, str):
+            since = _parse_lastmod(since)
+            if since is None:
+                raise ValueError("since must be a W3C datetime")
+        elif since is not None and since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
 
-    def load_data(self, sitemap_url: str, filter: str = None) -> List[Document]:
-        sitemap = self._load_sitemap(sitemap_url=sitemap_url)
-        sitemap_urls = self._parse_sitemap(sitemap, filter)
+        self.watermark = since
+        indexed_documents = asyncio.run(self._aload_indexed(sitemap_url, filter, since))
 
-        return self._async_loader.load_data(urls=sitemap_urls)
+        # keep the order the locations were parsed in
+        indexed_documents.sort(key=lambda indexed: indexed[0])
+        return [document for _, document in indexed_documents]
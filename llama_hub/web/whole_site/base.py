@@ -1,14 +1,109 @@
-from typing import List
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from html.parser import HTMLParser
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.schema.base import Document
 
+DEFAULT_PORTS = {"http": 80, "https": 443}
+# Tags whose content is not displayed as page text.
+HIDDEN_TAGS = {"head", "script", "style", "noscript", "template", "svg"}
+# Tags that start a new line of page text.
+BLOCK_TAGS = set(
+    "address article aside blockquote br dd div dl dt figcaption figure footer"
+    " form h1 h2 h3 h4 h5 h6 header hr li main nav ol p pre section table td th"
+    " tr ul".split()
+)
+# Timeout in seconds of the plain HTTP requests.
+HTTP_TIMEOUT = 30
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL, so different spellings of the same page are only crawled once.
+
+    Drops the fragment and the default port, lowercases the scheme and host and
+    turns an empty path into "/".
+    """
+    parts = urlsplit(url.strip())
+    try:
+        port = parts.port
+    except ValueError:
+        return url.split("#")[0]
+
+    scheme = parts.scheme.lower()
+    host = parts.hostname or ""
+    if ":" in host:
+        host = f"[{host}]"
+    if port is not None and port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    if "@" in parts.netloc:
+        host = parts.netloc.rsplit("@", 1)[0] + "@" + host
+    return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+
+
+def normalize_prefix(prefix: str) -> str:
+    """
+    Normalize the scheme and host of a URL prefix like `normalize_url`.
+
+    The rest of the prefix is kept as given, so a partial prefix such as
+    "https://example.com/guide" still matches "https://example.com/guides/".
+    """
+    parts = urlsplit(prefix)
+    if not parts.scheme or not parts.netloc:
+        return prefix
+    origin = normalize_url(f"{parts.scheme}://{parts.netloc}").rstrip("/")
+    return origin + prefix[prefix.index(parts.netloc) + len(parts.netloc) :]
+
+
+class _PageParser(HTMLParser):
+    """Extracts the visible text and the links of a static HTML page."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.links: List[str] = []
+        self.base_url: Optional[str] = None
+        self._hidden_depth = 0
+        self._chunks: List[str] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        if tag in HIDDEN_TAGS:
+            self._hidden_depth += 1
+        elif tag in BLOCK_TAGS:
+            self._chunks.append("\n")
+
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href:
+                self.links.append(href.strip())
+        elif tag == "base" and self.base_url is None:
+            self.base_url = dict(attrs).get("href")
+
+    def handle_endtag(self, tag: str):
+        if tag in HIDDEN_TAGS:
+            self._hidden_depth = max(0, self._hidden_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self._chunks.append("\n")
+
+    def handle_data(self, data: str):
+        if not self._hidden_depth:
+            self._chunks.append(data)
+
+    @property
+    def text(self) -> str:
+        lines = (" ".join(line.split()) for line in "".join(self._chunks).split("\n"))
+        return "\n".join(line for line in lines if line)
+
 
 class WholeSiteReader(BaseReader):
     """
@@ -17,6 +112,10 @@ class WholeSiteReader(BaseReader):
     This class provides functionality to scrape entire websites using a breadth-first search algorithm.
     It navigates web pages from a given base URL, following links that match a specified prefix.
 
+    Pages are crawled in parallel by a pool of Chrome drivers. With `use_http`, each
+    page is first fetched with a plain HTTP request, and only pages whose static HTML
+    has too little text, like those rendered by JavaScript, are loaded in a browser.
+
     Attributes:
         prefix (str): URL prefix to focus the scraping.
         max_depth (int): Maximum depth for BFS algorithm.
@@ -24,15 +123,59 @@ class WholeSiteReader(BaseReader):
     Args:
         prefix (str): URL prefix for scraping.
         max_depth (int, optional): Maximum depth for BFS. Defaults to 10.
+        num_drivers (int, optional): Number of Chrome drivers crawling in parallel.
+            Drivers are started when first needed. Defaults to 1.
+        use_http (bool, optional): Whether to try a plain HTTP request before the
+            browser. Defaults to False.
+        min_text_length (int, optional): Minimum length of the text of a page fetched
+            over plain HTTP to be used without the browser. Defaults to 200.
+        num_workers (Optional[int], optional): Number of pages loaded at the same
+            time. Defaults to `num_drivers`.
+        delay (float, optional): Seconds each worker waits after loading a page.
+            Defaults to 1.
     """
 
-    def __init__(self, prefix: str, max_depth: int = 10) -> None:
+    def __init__(
+        self,
+        prefix: str,
+        max_depth: int = 10,
+        num_drivers: int = 1,
+        use_http: bool = False,
+        min_text_length: int = 200,
+        num_workers: Optional[int] = None,
+        delay: float = 1.0,
+    ) -> None:
         """
         Initialize the WholeSiteReader with the provided prefix and maximum depth.
         """
+        if num_drivers < 1:
+            raise ValueError("num_drivers must be at least 1")
         self.prefix = prefix
         self.max_depth = max_depth
-        self.driver = self.setup_driver()
+        self.num_drivers = num_drivers
+        self.use_http = use_http
+        self.min_text_length = min_text_length
+        self.num_workers = num_workers
+        self.delay = delay
+        self._driver: Any = None
+        # started drivers of the pool, and those not loading a page
+        self._drivers: List[Any] = []
+        self._idle_drivers: List[Any] = []
+        self._num_starting_drivers = 0
+        self._drivers_changed = threading.Condition()
+        # requests session of each worker thread
+        self._local = threading.local()
+
+    @property
+    def driver(self):
+        """The Chrome driver of the reader, started when first used."""
+        if self._driver is None:
+            self._driver = self.setup_driver()
+        return self._driver
+
+    @driver.setter
+    def driver(self, driver):
+        self._driver = driver
 
     def setup_driver(self):
         """
@@ -58,14 +201,16 @@ class WholeSiteReader(BaseReader):
         self.driver.quit()
         self.driver = self.setup_driver()
 
-    def extract_content(self):
-        WebDriverWait(self.driver, 10).until(
+    def extract_content(self, driver=None):
+        driver = driver or self.driver
+        WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
-        body_element = self.driver.find_element(By.TAG_NAME, "body")
+        body_element = driver.find_element(By.TAG_NAME, "body")
         return body_element.text.strip()
 
-    def extract_links(self):
+    def extract_links(self, driver=None):
+        driver = driver or self.driver
         js_script = """
             var links = [];
             var elements = document.getElementsByTagName('a');
@@ -77,56 +222,178 @@ class WholeSiteReader(BaseReader):
             }
             return links;
             """
-        return self.driver.execute_script(js_script)
+        return driver.execute_script(js_script)
+
+    def _acquire_driver(self):
+        """Take an idle driver of the pool, starting one if the pool is not full."""
+        with self._drivers_changed:
+            while (
+                not self._idle_drivers
+                and len(self._drivers) + self._num_starting_drivers >= self.num_drivers
+            ):
+                self._drivers_changed.wait()
+            if self._idle_drivers:
+                return self._idle_drivers.pop()
+            self._num_starting_drivers += 1
+
+        driver = None
+        try:
+            driver = self.setup_driver()
+        finally:
+            with self._drivers_changed:
+                self._num_starting_drivers -= 1
+                if driver is not None:
+                    self._drivers.append(driver)
+                self._drivers_changed.notify()
+        return driver
+
+    def _release_driver(self, driver, broken: bool = False):
+        """Give a driver back to the pool, or quit it if it stopped working."""
+        with self._drivers_changed:
+            if broken:
+                # a new driver is started the next time one is needed
+                self._drivers.remove(driver)
+            else:
+                self._idle_drivers.append(driver)
+            self._drivers_changed.notify()
+        if broken:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def _quit_drivers(self):
+        """Quit every driver of the pool, and the one of `driver` if started."""
+        with self._drivers_changed:
+            drivers, self._drivers, self._idle_drivers = self._drivers, [], []
+        if self._driver is not None:
+            drivers.append(self._driver)
+            self._driver = None
+        for driver in drivers:
+            driver.quit()
+
+    def _fetch_http(self, url: str) -> Optional[Tuple[str, List[str]]]:
+        """
+        Load a page with a plain HTTP request.
+
+        Returns:
+            Optional[Tuple[str, List[str]]]: The text and links of the page, or None
+                if it is not an HTML page with enough text and needs the browser.
+        """
+        import requests
+
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+
+        try:
+            response = session.get(url, timeout=HTTP_TIMEOUT)
+        except requests.RequestException:
+            return None
+        if response.status_code != 200 or "html" not in response.headers.get(
+            "Content-Type", ""
+        ):
+            return None
+
+        parser = _PageParser()
+        parser.feed(response.text)
+        parser.close()
+        text = parser.text
+        if len(text) < self.min_text_length:
+            return None
+
+        base_url = urljoin(response.url, parser.base_url or "")
+        return text, [urljoin(base_url, link) for link in parser.links]
+
+    def _load_page(self, url: str) -> Tuple[str, List[str]]:
+        """Load a page over plain HTTP if possible, otherwise in a pool driver."""
+        page = self._fetch_http(url) if self.use_http else None
+        if page is None:
+            driver = self._acquire_driver()
+            try:
+                driver.get(url)
+                page = (self.extract_content(driver), self.extract_links(driver))
+            except WebDriverException:
+                self._release_driver(driver, broken=True)
+                raise
+            except Exception:
+                self._release_driver(driver)
+                raise
+            self._release_driver(driver)
+
+        time.sleep(self.delay)
+        return page
 
     def load_data(self, base_url: str) -> List[Document]:
         """Load data from the base URL using BFS algorithm.
         Args:
             base_url (str): Base URL to start scraping.
         Returns:
-            List[Document]: List of scraped documents.
+            List[Document]: List of scraped documents, in the order the pages were
+                visited.
         """
-        added_urls = set()
-        urls_to_visit = [(base_url, 0)]
-        documents = []
+        prefix = normalize_prefix(self.prefix)
+        added_urls = {normalize_url(base_url)}
+        urls_to_visit: Deque[Tuple[str, int]] = deque([(self.clean_url(base_url), 0)])
+        documents: List[Tuple[int, Document]] = []
+        num_workers = self.num_workers or self.num_drivers
+        # page being loaded -> its visit number, URL and depth
+        loading: Dict[Future, Tuple[int, str, int]] = {}
+        num_visited = 0
 
-        while urls_to_visit:
-            current_url, depth = urls_to_visit.pop(0)
+        try:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                while urls_to_visit or loading:
+                    while urls_to_visit and len(loading) < num_workers:
+                        current_url, depth = urls_to_visit.popleft()
+                        print(f"Visiting: {current_url}, {len(urls_to_visit)} left")
+                        future = executor.submit(self._load_page, current_url)
+                        loading[future] = (num_visited, current_url, depth)
+                        num_visited += 1
 
-            print(f"Visiting: {current_url}, {len(urls_to_visit)} left")
+                    done, _ = wait(loading, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        visit_number, current_url, depth = loading.pop(future)
+                        try:
+                            page_content, links = future.result()
+                        except WebDriverException:
+                            print(
+                                "WebDriverException encountered, restarting driver..."
+                            )
+                            continue
+                        except Exception as e:
+                            print(
+                                f"An unexpected exception occurred: {e}, skipping URL..."
+                            )
+                            continue
 
-            if depth > self.max_depth:
-                continue
-            try:
-                self.driver.get(current_url)
-                page_content = self.extract_content()
-
-                # links = self.driver.find_elements(By.TAG_NAME, 'a')
-                links = self.extract_links()
-                # clean all urls
-                links = [self.clean_url(link) for link in links]
-                # extract new links
-                links = [link for link in links if link not in added_urls]
-                print(f"Found {len(links)} new potential links")
-                for href in links:
-                    try:
-                        if href.startswith(self.prefix) and href not in added_urls:
-                            urls_to_visit.append((href, depth + 1))
-                            added_urls.add(href)
-                    except Exception:
-                        continue
-
-                documents.append(
-                    Document(text=page_content, extra_info={"URL": current_url})
-                )
-                time.sleep(1)
+                        # clean all urls and extract new links
+                        new_links = 0
+                        if depth < self.max_depth:
+                            for href in links:
+                                href = self.clean_url(href)
+                                normalized_url = normalize_url(href)
+                                if not (
+                                    normalized_url.startswith(prefix)
+                                    or href.startswith(self.prefix)
+                                ):
+                                    continue
+                                if normalized_url not in added_urls:
+                                    added_urls.add(normalized_url)
+                                    urls_to_visit.append((href, depth + 1))
+                                    new_links += 1
+                        print(f"Found {new_links} new potential links")
 
-            except WebDriverException:
-                print("WebDriverException encountered, restarting driver...")
-                self.restart_driver()
-            except Exception as e:
-                print(f"An unexpected exception occurred: {e}, skipping URL...")
-                continue
+                        documents.append(
+                            (
+                                visit_number,
+                                Document(
+                                    text=page_content, extra_info={"URL": current_url}
+                                ),
+                            )
+                        )
+        finally:
+            self._quit_drivers()
 
-        self.driver.quit()
-        return documents
+        documents.sort(key=lambda visited: visited[0])
+        return [document for _, document in documents]
@@ -1,4 +1,6 @@
+import json
 import os
+import sys
 from contextlib import contextmanager
 from pathlib import Path
 from urllib.request import Request, urlopen
@@ -7,7 +9,13 @@ import pytest
 
 from importlib.util import find_spec
 
-from llama_hub.file.audio.base import AudioTranscriber
+from llama_hub.file.audio.base import (
+    FRAME_LENGTH,
+    SAMPLE_RATE,
+    AudioTranscriber,
+    _find_split_points,
+)
+from llama_hub.file.model_registry import clear_pretrained
 
 REMOTE_AUDIO_SAMPLE_URL = (
     "https://audio-samples.github.io/samples/mp3/"
@@ -44,3 +52,127 @@ def load_remote_audio_sample():
     with open(filepath, "wb") as output:
         output.write(remote_audio_sample.read())
         yield filepath
+
+
+def test_find_split_points_at_silence() -> None:
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    audio = rng.uniform(-1, 1, 25 * SAMPLE_RATE).astype(np.float32)
+    # one second of silence starting at 8.5s and at 17s
+    audio[int(8.5 * SAMPLE_RATE) : int(9.5 * SAMPLE_RATE)] = 0
+    audio[17 * SAMPLE_RATE : 18 * SAMPLE_RATE] = 0
+
+    splits = _find_split_points(audio, chunk_length=10, search_length=2)
+
+    assert splits[0] == 0
+    assert splits[-1] == len(audio)
+    assert 8.5 * SAMPLE_RATE <= splits[1] <= 9.5 * SAMPLE_RATE
+    assert 17 * SAMPLE_RATE <= splits[2] <= 18 * SAMPLE_RATE
+    assert len(splits) == 4
+
+
+def test_find_split_points_shorter_than_a_frame() -> None:
+    import numpy as np
+
+    for num_samples in [0, 1, int(FRAME_LENGTH * SAMPLE_RATE) - 1]:
+        audio = np.zeros(num_samples, dtype=np.float32)
+        assert _find_split_points(audio, chunk_length=10) == [0, num_samples]
+
+
+class DummyWhisperModel:
+    def transcribe(self, audio):
+        seconds = len(audio) / SAMPLE_RATE
+        return {
+            "text": f" {seconds:.0f}s.",
+            "segments": [{"start": 0.0, "end": seconds, "text": f" {seconds:.0f}s."}],
+        }
+
+
+def mock_whisper(loads):
+    import numpy as np
+
+    def load_model(name):
+        loads.append(name)
+        return DummyWhisperModel()
+
+    whisper_mock = type(sys)("whisper")
+    whisper_mock.Whisper = DummyWhisperModel
+    whisper_mock.load_model = load_model
+    whisper_mock.load_audio = lambda file: np.ones(25 * SAMPLE_RATE, np.float32)
+    sys.modules["whisper"] = whisper_mock
+
+
+def test_chunked_transcription_stitches_segments(tmp_path: Path) -> None:
+    mock_whisper([])
+
+    transcriber = AudioTranscriber(
+        model_version="dummy", chunk_length=10, return_segments=True
+    )
+    documents = transcriber.load_data(tmp_path / "audio.mp3", {"source": "test"})
+
+    assert documents[0].text == " 10s. 10s. 5s."
+    assert documents[0].extra_info["source"] == "test"
+    assert json.loads(documents[0].extra_info["segments"]) == [
+        {"start": 0.0, "end": 10.0, "text": " 10s."},
+        {"start": 10.0, "end": 20.0, "text": " 10s."},
+        {"start": 20.0, "end": 25.0, "text": " 5s."},
+    ]
+
+
+def test_segments_are_opt_in(tmp_path: Path) -> None:
+    mock_whisper([])
+
+    transcriber = AudioTranscriber(model_version="dummy", chunk_length=10)
+    documents = transcriber.load_data(tmp_path / "audio.mp3", {"source": "test"})
+
+    assert documents[0].extra_info == {"source": "test"}
+
+
+class InlinePool:
+    """Runs the tasks of a pool in the current process."""
+
+    def __init__(self, processes, initializer, initargs):
+        initializer(*initargs)
+        self.closed = False
+
+    def map(self, func, iterable, chunksize=None):
+        return [func(item) for item in iterable]
+
+    def close(self):
+        self.closed = True
+
+    def join(self):
+        pass
+
+    def terminate(self):
+        self.closed = True
+
+
+def test_worker_pool_is_reused(tmp_path: Path, monkeypatch) -> None:
+    from llama_hub.file.audio import base as audio_base
+
+    clear_pretrained()
+    loads = []
+    mock_whisper(loads)
+    pools = []
+
+    class Context:
+        def Pool(self, **kwargs):
+            pools.append(InlinePool(**kwargs))
+            return pools[-1]
+
+    monkeypatch.setattr(audio_base.multiprocessing, "get_context", lambda _: Context())
+
+    with AudioTranscriber(
+        model_version="dummy", num_workers=2, chunk_length=10
+    ) as transcriber:
+        # the model is only loaded where the chunks are transcribed
+        assert loads == []
+        for _ in range(2):
+            documents = transcriber.load_data(tmp_path / "audio.mp3")
+            assert documents[0].text == " 10s. 10s. 5s."
+
+    assert len(pools) == 1
+    assert pools[0].closed
+    assert loads == ["dummy"]
@@ -0,0 +1,101 @@
+from importlib.util import find_spec
+from pathlib import Path
+from typing import List
+
+import pytest
+from llama_index.readers.base import BaseReader
+from llama_index.readers.schema.base import Document
+
+pytestmark = pytest.mark.skipif(
+    find_spec("fitz") is None, reason="PyMuPDF is not installed"
+)
+
+NUM_PAGES = 3
+
+
+@pytest.fixture
+def pdf_file(tmp_path: Path) -> Path:
+    import fitz
+
+    file = tmp_path / "flat.pdf"
+    with fitz.open() as pdf:
+        for i in range(NUM_PAGES):
+            # pages of different widths, to tell their images apart
+            page = pdf.new_page(width=100 + 10 * i, height=100)
+            page.insert_text((10, 50), f"Page {i}")
+        pdf.save(file)
+    return file
+
+
+class PathImageLoader(BaseReader):
+    """Image loader that only reads files from disk."""
+
+    def __init__(self) -> None:
+        self.files: List[Path] = []
+
+    def load_data(self, file: Path) -> List[Document]:
+        assert isinstance(file, Path)
+        assert file.suffix == ".png"
+        self.files.append(file)
+        with open(file, "rb") as f:
+            assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+        return [Document(text=f"{file.name};")]
+
+
+def test_image_loader_is_given_png_paths(pdf_file: Path) -> None:
+    from llama_hub.file.flat_pdf.base import FlatPdfReader
+
+    image_loader = PathImageLoader()
+    documents = list(FlatPdfReader(image_loader).lazy_load_data(pdf_file))
+
+    assert [(d.text, d.extra_info) for d in documents] == [
+        (f"page-{i}.png;", {"page_label": str(i + 1)}) for i in range(NUM_PAGES)
+    ]
+    # the pages are removed once parsed
+    assert not any(file.exists() for file in image_loader.files)
+    assert not image_loader.files[0].parent.exists()
+
+
+def test_parallel_matches_serial(pdf_file: Path) -> None:
+    from llama_hub.file.flat_pdf.base import FlatPdfReader
+
+    serial = list(FlatPdfReader(PathImageLoader()).lazy_load_data(pdf_file))
+    reader = FlatPdfReader(PathImageLoader(), num_workers=2)
+    parallel = list(reader.lazy_load_data(pdf_file, extra_info={"source": "test"}))
+
+    assert [d.text for d in parallel] == [d.text for d in serial]
+    assert [d.extra_info for d in parallel] == [
+        {"page_label": str(i + 1), "source": "test"} for i in range(NUM_PAGES)
+    ]
+
+
+def test_load_data_joins_pages(pdf_file: Path) -> None:
+    from llama_hub.file.flat_pdf.base import FlatPdfReader
+
+    document = FlatPdfReader(PathImageLoader()).load_data(pdf_file)
+
+    assert document.text == "page-0.png;page-1.png;page-2.png;"
+
+
+@pytest.mark.skipif(find_spec("PIL") is None, reason="Pillow is not installed")
+def test_batch_image_reader_is_given_pages_in_memory(pdf_file: Path) -> None:
+    from llama_hub.file.flat_pdf.base import ZOOM, FlatPdfReader
+    from llama_hub.file.image_batch import BatchImageReader
+
+    class SizeReader(BatchImageReader):
+        files: List[object] = []
+
+        def _load_image(self, file):
+            self.files.append(file)
+            return super()._load_image(file)
+
+        def _parse_images(self, images):
+            return [f"{image.size[0]}x{image.size[1]}" for image in images]
+
+    image_loader = SizeReader()
+    documents = list(FlatPdfReader(image_loader).lazy_load_data(pdf_file))
+
+    assert [d.text for d in documents] == [
+        f"{int((100 + 10 * i) * ZOOM)}x{int(100 * ZOOM)}" for i in range(NUM_PAGES)
+    ]
+    assert not any(isinstance(file, Path) for file in image_loader.files)
@@ -3,6 +3,8 @@ import os
 import sys
 import tempfile
 
+import pytest
+
 
 BLACK_PIXEL_PNG = b64decode(
     "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNk+A8AAQUBAScY42YAAAAASUVORK5CYII="
@@ -27,16 +29,16 @@ class DummyModel:
         return ""
 
 
-def test_model_kwargs_with_pytesseract():
+def test_model_kwargs_with_pytesseract(monkeypatch):
     from llama_hub.file.image.base import ImageReader
 
     # Mock subdependencies to just test the kwargs passing
     pil_mock = type(sys)("PIL")
     pil_mock.Image = ImageMock
-    sys.modules["PIL"] = pil_mock
+    monkeypatch.setitem(sys.modules, "PIL", pil_mock)
 
     pytesseract_mock = type(sys)("pytesseract")
-    sys.modules["pytesseract"] = pytesseract_mock
+    monkeypatch.setitem(sys.modules, "pytesseract", pytesseract_mock)
 
     dummy_model = DummyModel()
 
@@ -57,3 +59,89 @@ def test_model_kwargs_with_pytesseract():
         dummy_model.received_kwargs[model_key] == model_val
         for model_key, model_val in model_kwargs.items()
     )
+
+
+def test_load_data_batch_with_pytesseract(monkeypatch):
+    from llama_hub.file.image.base import ImageReader
+
+    pil_mock = type(sys)("PIL")
+    pil_mock.Image = ImageMock
+    monkeypatch.setitem(sys.modules, "PIL", pil_mock)
+
+    pytesseract_mock = type(sys)("pytesseract")
+    monkeypatch.setitem(sys.modules, "pytesseract", pytesseract_mock)
+
+    parser_config = dict(model=DummyModel(), processor=None)
+    loader = ImageReader(parser_config=parser_config)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        files = []
+        for i in range(5):
+            test_file_path = os.path.join(tmpdir, f"test_{i}.png")
+            with open(test_file_path, "wb") as f:
+                f.write(BLACK_PIXEL_PNG)
+            files.append(test_file_path)
+
+        documents = loader.load_data_batch(
+            files, [{"index": i} for i in range(5)], batch_size=2
+        )
+
+    assert [document.extra_info for document in documents] == [
+        {"index": i} for i in range(5)
+    ]
+
+
+class DummyInputs(dict):
+    def to(self, *args):
+        return self
+
+
+class DummyCaptionProcessor:
+    def __call__(self, images, prompts=None, return_tensors=None):
+        return DummyInputs(count=len(images))
+
+    def batch_decode(self, out, skip_special_tokens=False):
+        return [f"caption {i}" for i in range(out)]
+
+
+class DummyCaptionModel:
+    def to(self, device):
+        pass
+
+    def generate(self, count):
+        return count
+
+
+def test_caption_readers_load_data_returns_list(monkeypatch):
+    from llama_hub.file.image_blip.base import ImageCaptionReader
+    from llama_hub.file.image_blip2.base import ImageVisionLLMReader
+
+    pil_mock = type(sys)("PIL")
+    pil_mock.Image = ImageMock
+    monkeypatch.setitem(sys.modules, "PIL", pil_mock)
+
+    parser_config = dict(
+        processor=DummyCaptionProcessor(),
+        model=DummyCaptionModel(),
+        device="cpu",
+        dtype=None,
+    )
+    for reader_cls in [ImageCaptionReader, ImageVisionLLMReader]:
+        loader = reader_cls(parser_config=parser_config)
+
+        documents = loader.load_data("test.png", extra_info={"index": 0})
+
+        assert isinstance(documents, list)
+        assert [(d.text, d.extra_info) for d in documents] == [
+            ("caption 0", {"index": 0})
+        ]
+
+
+def test_batch_image_reader_requires_parse_images():
+    from llama_hub.file.image_batch import BatchImageReader
+
+    class NoParseReader(BatchImageReader):
+        pass
+
+    with pytest.raises(TypeError):
+        NoParseReader()
@@ -1,4 +1,6 @@
 import json
+import re
+
 import pytest
 
 from llama_hub.file.json import JSONReader
@@ -57,3 +59,75 @@ def test_load_data_jsonl(jsonl_file):
     assert len(documents) == 2
     assert "Jane Doe" in documents[1].text
     assert "25" in documents[1].text
+
+
+def baseline_text(json_data):
+    """Text of the original formatting, which regex-filtered the dump."""
+    lines = json.dumps(json_data, indent=0).split("\n")
+    return "\n".join(line for line in lines if not re.match(r"^[{}\\[\\],]*$", line))
+
+
+BASELINE_CASES = [
+    SAMPLE_JSON,
+    {"a": [], "b": {}, "c": [{}, [], {"d": [1, 2.5, None]}], "e": True},
+    {"nested": [[1, [2, [3]]], {"x": {"y": {"z": '\u00e9\n"q"'}}}]},
+    {1: "int key", 2.5: "float key", None: "null key", False: "bool key"},
+    [{"a": 1}, {"b": [{"c": 2}, {"d": 3}]}],
+    [[], {}, "s", 1e100, -0.0, float("inf")],
+    "scalar",
+    {},
+]
+
+
+@pytest.mark.parametrize("json_data", BASELINE_CASES)
+def test_parse_jsonobj_to_document_matches_baseline(json_data):
+    reader = JSONReader()
+    document = reader._parse_jsonobj_to_document(json_data)
+    assert document.text == baseline_text(json_data)
+
+
+def test_parse_jsonobj_to_document_keeps_lone_brackets():
+    reader = JSONReader()
+    document = reader._parse_jsonobj_to_document(SAMPLE_JSON)
+    assert document.text == (
+        "{\n"
+        '"name": "John Doe",\n'
+        '"age": 30,\n'
+        '"address": {\n'
+        '"street": "123 Main St",\n'
+        '"city": "Anytown",\n'
+        '"state": "CA"\n'
+        "}\n"
+        "}"
+    )
+
+
+def test_load_data_top_level_values(tmp_path):
+    file = tmp_path / "test.json"
+    reader = JSONReader()
+
+    file.write_text(json.dumps(["a", {"b": 1}]))
+    assert [d.text for d in reader.load_data(file)] == ['"a"', '{\n"b": 1\n}']
+
+    # like the original load_data, a top-level string is iterated
+    file.write_text(json.dumps("ab"))
+    assert [d.text for d in reader.load_data(file)] == ['"a"', '"b"']
+
+
+def test_lazy_load_data_json_array(tmp_path):
+    file = tmp_path / "test.json"
+    with open(file, "w") as f:
+        json.dump([SAMPLE_JSON, {"name": "Jane Doe", "age": 25}, [1, 2]], f)
+
+    reader = JSONReader()
+    documents = list(reader.lazy_load_data(file))
+    assert [d.text for d in documents] == [d.text for d in reader.load_data(file)]
+    assert len(documents) == 3
+    assert "Jane Doe" in documents[1].text
+
+
+def test_lazy_load_data_jsonl(jsonl_file):
+    reader = JSONReader()
+    documents = list(reader.lazy_load_data(jsonl_file, is_jsonl=True))
+    assert len(documents) == 2
+    assert "Jane Doe" in documents[1].text
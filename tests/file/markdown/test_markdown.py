@@ -0,0 +1,156 @@
+import os
+import random
+import re
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple, cast
+
+import pytest
+
+from llama_hub.file.markdown import MarkdownReader
+
+
+def baseline_markdown_to_tups(markdown_text: str) -> List[Tuple[Optional[str], str]]:
+    """The original line-by-line implementation of `markdown_to_tups`."""
+    markdown_tups: List[Tuple[Optional[str], str]] = []
+    lines = markdown_text.split("\n")
+
+    current_header = None
+    current_text = ""
+
+    for line in lines:
+        header_match = re.match(r"^#+\s", line)
+        if header_match:
+            if current_header is not None:
+                if current_text == "" or None:
+                    continue
+                markdown_tups.append((current_header, current_text))
+
+            current_header = line
+            current_text = ""
+        else:
+            current_text += line + "\n"
+    markdown_tups.append((current_header, current_text))
+
+    if current_header is not None:
+        markdown_tups = [
+            (re.sub(r"#", "", cast(str, key)).strip(), re.sub(r"<.*?>", "", value))
+            for key, value in markdown_tups
+        ]
+    else:
+        markdown_tups = [
+            (key, re.sub("<.*?>", "", value)) for key, value in markdown_tups
+        ]
+
+    return markdown_tups
+
+
+CASES = {
+    "no_headers": "Just some text\nover two lines",
+    "empty": "",
+    "leading_text": "Leading text\nis dropped\n# Title\nBody\n",
+    "header_without_body": "# First\n# Second\nBody of second\n## Third\n",
+    "only_headers": "# First\n## Second\n",
+    "trailing_header": "# Title\nBody\n# Last",
+    "crlf": "Intro\r\n# Title\r\nBody line\r\n\r\n## Sub\r\nMore <b>text</b>\r\n",
+    "crlf_empty_header": "#\r\n# Title\r\nBody\r\n",
+    "not_headers": "#hashtag\n####\n # indented\n#\tTab header\nText\n",
+    "blank_lines": "\n\n# Title\n\n\nBody\n\n",
+}
+
+
+@pytest.mark.parametrize("markdown_text", CASES.values(), ids=CASES.keys())
+def test_markdown_to_tups_matches_baseline(markdown_text: str) -> None:
+    reader = MarkdownReader()
+    assert reader.markdown_to_tups(markdown_text) == baseline_markdown_to_tups(
+        markdown_text
+    )
+
+
+def test_markdown_to_tups_quirks() -> None:
+    reader = MarkdownReader()
+
+    # text before the first header is dropped
+    assert reader.markdown_to_tups(CASES["leading_text"]) == [("Title", "Body\n\n")]
+    # a header directly followed by another one swallows it
+    assert reader.markdown_to_tups(CASES["header_without_body"]) == [
+        ("First", "Body of second\n"),
+        ("Third", "\n"),
+    ]
+    # carriage returns stay in the text
+    assert reader.markdown_to_tups(CASES["crlf"]) == [
+        ("Title", "Body line\r\n\r\n"),
+        ("Sub", "More text\r\n\n"),
+    ]
+
+
+def test_markdown_to_tups_matches_baseline_on_random_documents() -> None:
+    pieces = ["# H", "## Sub", "#", "#x", "text", "<i>tag</i>", "", "\r", " ", "\f"]
+    rng = random.Random(0)
+    reader = MarkdownReader()
+    for _ in range(2000):
+        markdown_text = "".join(
+            rng.choice(pieces) + rng.choice(["\n", "\r\n", " "])
+            for _ in range(rng.randint(0, 12))
+        )
+        assert reader.markdown_to_tups(markdown_text) == baseline_markdown_to_tups(
+            markdown_text
+        ), repr(markdown_text)
+
+
+def make_vault(vault_dir: Path, size: int) -> List[Path]:
+    """Write an Obsidian-style vault of about `size` bytes, with one large note."""
+    rng = random.Random(0)
+    paragraph = (
+        "Some [[linked note]] text with a [link](https://example.com) and"
+        " <span>inline html</span>. ![[image.png]]\n"
+    )
+    files = []
+    written = 0
+    while written < size:
+        # a quarter of the vault is a single large note with long sections
+        if not files:
+            num_sections, section_lines = 200, size // 4 // 200 // len(paragraph)
+        else:
+            num_sections, section_lines = rng.randint(1, 20), rng.randint(1, 30)
+        sections = [
+            f"{'#' * rng.randint(1, 3)} Section {i}\n" + paragraph * section_lines
+            for i in range(num_sections)
+        ]
+        note = f"Front matter of note {len(files)}\n" + "".join(sections)
+        file = vault_dir / f"note_{len(files)}.md"
+        file.write_text(note)
+        files.append(file)
+        written += len(note)
+    return files
+
+
+@pytest.mark.skipif(
+    not os.environ.get("LLAMA_HUB_BENCHMARK"),
+    reason="set LLAMA_HUB_BENCHMARK=1 to run benchmarks",
+)
+def test_benchmark_vault(tmp_path: Path) -> None:
+    size = int(float(os.environ.get("MARKDOWN_VAULT_MB", "100")) * 1024 * 1024)
+    files = make_vault(tmp_path, size)
+    reader = MarkdownReader()
+    contents = [file.read_text() for file in files]
+
+    start = time.perf_counter()
+    baseline = [baseline_markdown_to_tups(content) for content in contents]
+    baseline_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = [reader.markdown_to_tups(content) for content in contents]
+    new_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reader.markdown_to_tups(contents[0])
+    large_note_time = time.perf_counter() - start
+
+    print(
+        f"\n{len(files)} notes, {size / 1024 / 1024:.0f} MB:"
+        f" baseline {baseline_time:.2f}s, single pass {new_time:.2f}s;"
+        f" largest note ({len(contents[0]) / 1024 / 1024:.0f} MB)"
+        f" {large_note_time:.2f}s"
+    )
+    assert new == baseline
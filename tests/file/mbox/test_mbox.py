@@ -0,0 +1,96 @@
+import mailbox
+from pathlib import Path
+
+import pytest
+
+from llama_hub.file.mbox import MboxReader
+from llama_hub.file.mbox import base as mbox_base
+
+MESSAGE = """From sender{i}@example.com Mon Jan  1 00:00:00 2024
+Date: Mon, 1 Jan 2024 00:00:{i:02d} +0000
+From: sender{i}@example.com
+To: receiver@example.com
+Subject: Message {i}
+Content-Type: text/plain; charset="utf-8"
+
+Body of message {i}.
+>From the archive, a quoted line.
+Said From here, not a separator.
+
+"""
+
+
+@pytest.fixture
+def mbox_file(tmp_path: Path) -> Path:
+    file = tmp_path / "test.mbox"
+    # the last message ends with a blank line, like the others
+    file.write_text("".join(MESSAGE.format(i=i) for i in range(6)))
+    return file
+
+
+def mailbox_messages(file: Path):
+    mbox = mailbox.mbox(file)
+    return [mbox.get_file(key).read() for key in mbox.keys()]
+
+
+@pytest.mark.parametrize("range_size", [1, 50, 200, 10_000])
+def test_ranges_match_mailbox(mbox_file: Path, range_size: int) -> None:
+    ranges = mbox_base._split_mbox(mbox_file, range_size)
+    # "From " lines straddle the boundaries of the tiny ranges
+    assert len(ranges) > 1 or range_size == 10_000
+
+    messages = [
+        message
+        for start, end in ranges
+        for message in mbox_base._iter_range_messages(mbox_file, start, end)
+    ]
+    assert messages == mailbox_messages(mbox_file)
+
+
+def test_last_message_without_trailing_blank_line(tmp_path: Path) -> None:
+    file = tmp_path / "test.mbox"
+    file.write_text(MESSAGE.format(i=0) + MESSAGE.format(i=1).rstrip("\n"))
+
+    ranges = mbox_base._split_mbox(file, 1)
+    messages = [
+        message
+        for start, end in ranges
+        for message in mbox_base._iter_range_messages(file, start, end)
+    ]
+    assert messages == mailbox_messages(file)
+
+
+def test_load_data(mbox_file: Path) -> None:
+    documents = MboxReader().load_data(mbox_file)
+
+    assert len(documents) == 6
+    assert documents[0].text == (
+        "Date: Mon, 01 Jan 2024 00:00:00 +0000\n"
+        "From: sender0@example.com\n"
+        "To: receiver@example.com\n"
+        "Subject: Message 0\n"
+        "Content: Body of message 0. >From the archive, a quoted line."
+        " Said From here, not a separator."
+    )
+
+
+@pytest.mark.parametrize("range_size", [1, 200])
+def test_parallel_matches_serial(
+    mbox_file: Path, range_size: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(mbox_base, "DEFAULT_RANGE_SIZE", range_size)
+
+    serial = MboxReader().load_data(mbox_file)
+    parallel = MboxReader(num_workers=2).load_data(mbox_file)
+
+    assert [d.text for d in parallel] == [d.text for d in serial]
+
+
+def test_parallel_max_count(mbox_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(mbox_base, "DEFAULT_RANGE_SIZE", 1)
+
+    documents = MboxReader(num_workers=2, max_count=4).load_data(mbox_file)
+
+    assert [d.text.split("\n")[3] for d in documents] == [
+        f"Subject: Message {i}" for i in range(4)
+    ]
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from llama_hub.file.paged_csv import PagedCSVReader
+
+SAMPLE_CSV = """First Name, Last Name ,Age
+Bruce,Wayne, 28
+
+Clark,Kent,35
+Diana,Prince
+"""
+
+
+def test_one_row_per_document(tmp_path: Path) -> None:
+    file = tmp_path / "test.csv"
+    file.write_text(SAMPLE_CSV)
+
+    documents = PagedCSVReader().load_data(file, extra_info={"source": "test"})
+    assert [d.text for d in documents] == [
+        "First Name: Bruce\nLast Name: Wayne\nAge: 28",
+        "First Name: Clark\nLast Name: Kent\nAge: 35",
+        "First Name: Diana\nLast Name: Prince\nAge: ",
+    ]
+    assert documents[0].extra_info == {"source": "test"}
+
+
+def test_rows_per_page(tmp_path: Path) -> None:
+    file = tmp_path / "test.csv"
+    file.write_text(SAMPLE_CSV)
+
+    documents = list(PagedCSVReader(rows_per_page=2).lazy_load_data(file))
+    assert [d.text for d in documents] == [
+        "First Name: Bruce\nLast Name: Wayne\nAge: 28\n\n"
+        "First Name: Clark\nLast Name: Kent\nAge: 35",
+        "First Name: Diana\nLast Name: Prince\nAge: ",
+    ]
@@ -0,0 +1,97 @@
+from importlib.util import find_spec
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    find_spec("pandas") is None, reason="pandas is not installed"
+)
+
+MIXED_CSV = """name,count,price,in_stock
+apple,3,1.5,True
+banana,,0.25,False
+cherry,7,,True
+"""
+
+NUMERIC_CSV = """count,price
+3,1.5
+4,
+"""
+
+
+def baseline_rows(file: Path, chunksize=None):
+    """Rows rendered as the original row-wise apply did, chunk by chunk."""
+    import pandas as pd
+
+    if chunksize is None:
+        chunks = [pd.read_csv(file)]
+    else:
+        chunks = pd.read_csv(file, chunksize=chunksize)
+    rows = []
+    for df in chunks:
+        # fillna only matters on pandas >= 3, where the original code raised
+        # on NaN
+        rows.extend(
+            df.apply(
+                lambda row: ", ".join(row.astype(str).fillna("nan").tolist()), axis=1
+            ).tolist()
+        )
+    return rows
+
+
+@pytest.fixture
+def mixed_csv(tmp_path: Path) -> Path:
+    file = tmp_path / "mixed.csv"
+    file.write_text(MIXED_CSV)
+    return file
+
+
+@pytest.fixture
+def numeric_csv(tmp_path: Path) -> Path:
+    file = tmp_path / "numeric.csv"
+    file.write_text(NUMERIC_CSV)
+    return file
+
+
+def test_mixed_dtypes(mixed_csv: Path) -> None:
+    from llama_hub.file.pandas_csv import PandasCSVReader
+
+    documents = PandasCSVReader(concat_rows=False).load_data(mixed_csv)
+
+    assert [d.text for d in documents] == [
+        "apple, 3.0, 1.5, True",
+        "banana, nan, 0.25, False",
+        "cherry, 7.0, nan, True",
+    ]
+    assert [d.text for d in documents] == baseline_rows(mixed_csv)
+
+
+def test_numeric_columns_render_like_rows(numeric_csv: Path) -> None:
+    from llama_hub.file.pandas_csv import PandasCSVReader
+
+    documents = PandasCSVReader().load_data(numeric_csv)
+
+    # ints share the float dtype of the rows of an all-numeric frame
+    assert [d.text for d in documents] == ["3.0, 1.5\n4.0, nan"]
+    assert documents[0].text == "\n".join(baseline_rows(numeric_csv))
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 2, 10])
+def test_concat_rows_with_chunksize(mixed_csv: Path, chunksize) -> None:
+    from llama_hub.file.pandas_csv import PandasCSVReader
+
+    # dtypes are inferred per chunk, so a chunk without NaN keeps its ints
+    rows = baseline_rows(mixed_csv, chunksize)
+
+    reader = PandasCSVReader(concat_rows=False, chunksize=chunksize)
+    documents = reader.load_data(mixed_csv, extra_info={"source": "test"})
+    assert [d.text for d in documents] == rows
+    assert all(d.extra_info == {"source": "test"} for d in documents)
+
+    # with concat_rows, one document per chunk
+    reader = PandasCSVReader(concat_rows=True, chunksize=chunksize)
+    documents = list(reader.lazy_load_data(mixed_csv))
+    step = chunksize or len(rows)
+    assert [d.text for d in documents] == [
+        "\n".join(rows[i : i + step]) for i in range(0, len(rows), step)
+    ]
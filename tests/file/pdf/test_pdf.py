@@ -0,0 +1,86 @@
+from importlib.util import find_spec
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    find_spec("pypdf") is None, reason="pypdf is not installed"
+)
+
+# Five pages labeled i, ii, 1, 2, 3.
+PDF_PATH = Path(__file__).parent / "multipage.pdf"
+
+
+def as_tuples(documents):
+    return [(document.text, document.extra_info) for document in documents]
+
+
+def test_load_data():
+    from llama_hub.file.pdf.base import PDFReader
+
+    documents = PDFReader().load_data(PDF_PATH)
+
+    assert [document.text for document in documents] == [
+        "First page",
+        "Second page",
+        "Third page",
+        "Fourth page",
+        "Fifth page",
+    ]
+    assert [document.extra_info["page_label"] for document in documents] == [
+        "i",
+        "ii",
+        "1",
+        "2",
+        "3",
+    ]
+    assert all(
+        document.extra_info["file_name"] == "multipage.pdf" for document in documents
+    )
+
+
+def test_parallel_matches_serial():
+    from llama_hub.file.pdf.base import PDFReader
+
+    serial = PDFReader().load_data(PDF_PATH)
+    parallel = PDFReader(num_workers=2).load_data(PDF_PATH)
+
+    assert as_tuples(parallel) == as_tuples(serial)
+
+
+def test_parallel_matches_serial_from_stream():
+    from llama_hub.file.pdf.base import PDFReader
+
+    with open(PDF_PATH, "rb") as f:
+        serial = PDFReader().load_data(f)
+    with open(PDF_PATH, "rb") as f:
+        parallel = PDFReader(num_workers=2).load_data(f)
+
+    assert as_tuples(parallel) == as_tuples(serial)
+
+
+def test_page_range():
+    from llama_hub.file.pdf.base import PDFReader
+
+    serial = PDFReader().load_data(PDF_PATH)
+
+    documents = PDFReader().load_data(PDF_PATH, page_range=(1, 4))
+    assert as_tuples(documents) == as_tuples(serial[1:4])
+
+    documents = PDFReader(num_workers=2).load_data(PDF_PATH, page_range=(1, 4))
+    assert as_tuples(documents) == as_tuples(serial[1:4])
+
+
+def test_lazy_load_data_matches_load_data():
+    from llama_hub.file.pdf.base import PDFReader
+
+    reader = PDFReader()
+    lazy_documents = reader.lazy_load_data(PDF_PATH, page_range=(0, 2))
+
+    assert not isinstance(lazy_documents, list)
+    assert as_tuples(lazy_documents) == as_tuples(
+        reader.load_data(PDF_PATH, page_range=(0, 2))
+    )
+    assert as_tuples(reader.lazy_load_data(PDF_PATH)) == as_tuples(
+        reader.load_data(PDF_PATH)
+    )
@@ -0,0 +1,150 @@
+from importlib.util import find_spec
+from io import BytesIO
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from llama_hub.file.extraction_cache import ExtractionCache
+from llama_hub.file.pptx.base import PptxReader
+
+pptx_available = find_spec("pptx") is not None and find_spec("PIL") is not None
+
+
+def make_deck(path: Path, colors: List[str]) -> None:
+    from PIL import Image
+    from pptx import Presentation
+
+    presentation = Presentation()
+    for i, color in enumerate(colors):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[5])
+        slide.shapes.title.text = f"Slide {i}"
+        image = BytesIO()
+        Image.new("RGB", (8, 8), color).save(image, "PNG")
+        slide.shapes.add_picture(image, 0, 0)
+    presentation.save(path)
+
+
+class CaptionCounter:
+    def __init__(self) -> None:
+        self.captioned = 0
+
+    def __call__(self, images: List) -> List[str]:
+        self.captioned += len(images)
+        return [f"{image.getpixel((0, 0))}" for image in images]
+
+
+@pytest.mark.skipif(
+    not pptx_available, reason="Skipping test because python-pptx is not available"
+)
+def test_caption_images_deduplicated(tmp_path: Path) -> None:
+    make_deck(tmp_path / "a.pptx", ["red", "blue", "red"])
+    make_deck(tmp_path / "b.pptx", ["blue", "green"])
+
+    reader = PptxReader()
+    reader.caption_images = True
+    reader._caption_images = CaptionCounter()
+    documents = reader.load_data_batch([tmp_path / "a.pptx", tmp_path / "b.pptx"])
+
+    assert reader._caption_images.captioned == 3
+    assert "Image: (255, 0, 0)" in documents[0].text
+    assert documents[0].text.count("Image: (255, 0, 0)") == 2
+    assert "Slide 2" in documents[0].text
+    assert "Image: (0, 128, 0)" in documents[1].text
+
+
+@pytest.mark.skipif(
+    not pptx_available, reason="Skipping test because python-pptx is not available"
+)
+def test_caption_cache(tmp_path: Path) -> None:
+    make_deck(tmp_path / "a.pptx", ["red", "blue"])
+    cache = ExtractionCache(tmp_path / "cache")
+
+    reader = PptxReader(cache=cache)
+    reader.caption_images = True
+    reader._caption_images = CaptionCounter()
+    expected = reader.load_data(tmp_path / "a.pptx")
+
+    other_reader = PptxReader(cache=cache)
+    other_reader.caption_images = True
+    other_reader._caption_images = CaptionCounter()
+    assert other_reader.load_data(tmp_path / "a.pptx")[0].text == expected[0].text
+    assert other_reader._caption_images.captioned == 0
+
+
+@pytest.mark.skipif(
+    not pptx_available, reason="Skipping test because python-pptx is not available"
+)
+def test_captions_are_flushed_deck_by_deck(tmp_path: Path) -> None:
+    colors = [["red", "blue"], ["red"], ["green", "white"], ["black"]]
+    files = []
+    for i, deck_colors in enumerate(colors):
+        files.append(tmp_path / f"{i}.pptx")
+        make_deck(files[-1], deck_colors)
+
+    batches = []
+    counter = CaptionCounter()
+
+    def caption_images(images: List) -> List[str]:
+        batches.append(len(images))
+        return counter(images)
+
+    reader = PptxReader(batch_size=2)
+    reader.caption_images = True
+    reader._caption_images = caption_images
+    documents = reader.load_data_batch(files)
+
+    # the second deck only has a known image, the third one fills a batch
+    assert batches == [2, 2, 1]
+    assert [document.text.count("Image: ") for document in documents] == [2, 1, 2, 1]
+    assert "Image: (0, 0, 0)" in documents[3].text
+
+
+@pytest.mark.skipif(
+    not pptx_available, reason="Skipping test because python-pptx is not available"
+)
+def test_caption_cache_is_keyed_on_sha1(tmp_path: Path) -> None:
+    from pptx import Presentation
+
+    make_deck(tmp_path / "a.pptx", ["red", "blue"])
+    cache = ExtractionCache(tmp_path / "cache")
+    puts = []
+    put_many = cache.put_many
+    cache.put_many = lambda entries: puts.append(entries) or put_many(entries)
+
+    reader = PptxReader(cache=cache, batch_size=1)
+    reader.caption_images = True
+    reader._caption_images = CaptionCounter()
+    reader.load_data(tmp_path / "a.pptx")
+
+    # both captions are stored at once
+    assert len(puts) == 1
+    slides = Presentation(tmp_path / "a.pptx").slides
+    sha1s = [
+        shape.image.sha1
+        for slide in slides
+        for shape in slide.shapes
+        if hasattr(shape, "image")
+    ]
+    assert [key for key, _ in puts[0]] == [
+        cache.make_digest_key(sha1, "PptxReader") for sha1 in sha1s
+    ]
+
+
+@pytest.mark.skipif(
+    not pptx_available, reason="Skipping test because python-pptx is not available"
+)
+def test_parallel_matches_serial(tmp_path: Path) -> None:
+    files = []
+    for i in range(5):
+        files.append(tmp_path / f"{i}.pptx")
+        make_deck(files[-1], ["red"] * (i + 1))
+    extra_infos = [{"deck": i} for i in range(5)]
+
+    serial = PptxReader().load_data_batch(files, extra_infos)
+    parallel = PptxReader(num_workers=2).load_data_batch(files, extra_infos)
+
+    assert [(d.text, d.extra_info) for d in parallel] == [
+        (d.text, d.extra_info) for d in serial
+    ]
+    assert [d.text.count("Slide #") for d in serial] == [1, 2, 3, 4, 5]
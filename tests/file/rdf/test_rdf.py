@@ -0,0 +1,55 @@
+from importlib.util import find_spec
+from pathlib import Path
+
+import pytest
+
+from llama_hub.file.rdf.base import RDFReader
+
+rdflib_available = find_spec("rdflib") is not None
+
+TURTLE = """
+@prefix ex: <http://example.org/> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+
+ex:alice rdf:type ex:Person ;
+    rdfs:label "Alice" ;
+    ex:knows ex:bob .
+ex:bob rdfs:label "Bob" , "Robert"@en , "Roberto"@it .
+ex:Person rdfs:label "Person" .
+ex:knows rdfs:label "knows" .
+"""
+
+
+@pytest.mark.skipif(
+    not rdflib_available, reason="Skipping test because rdflib is not available"
+)
+def test_load_data(tmp_path: Path) -> None:
+    file = tmp_path / "graph.ttl"
+    file.write_text(TURTLE)
+
+    reader = RDFReader()
+    documents = reader.load_data(file)
+    assert sorted(documents[0].text.split("\n")) == [
+        "<Alice> <knows> <Robert>",
+        "<Alice> <type> <Person>",
+    ]
+
+    documents = reader.load_data(file, extra_info={"lang": "it"})
+    assert sorted(documents[0].text.split("\n")) == [
+        "<Alice> <knows> <Roberto>",
+        "<Alice> <type> <Person>",
+    ]
+
+
+@pytest.mark.skipif(
+    not rdflib_available, reason="Skipping test because rdflib is not available"
+)
+def test_missing_label(tmp_path: Path) -> None:
+    file = tmp_path / "graph.ttl"
+    file.write_text(
+        "<http://example.org/a> <http://example.org/b> <http://example.org/c> ."
+    )
+
+    with pytest.raises(Exception, match="Label not found"):
+        RDFReader().load_data(file)
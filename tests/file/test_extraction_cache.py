@@ -0,0 +1,106 @@
+"""Tests for the extraction cache shared by the file readers."""
+import os
+from importlib.util import find_spec
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from llama_hub.file.extraction_cache import ExtractionCache
+
+
+def test_key_is_content_addressed(tmp_path: Path) -> None:
+    cache = ExtractionCache(tmp_path / "cache")
+    (tmp_path / "a.pdf").write_bytes(b"same content")
+    (tmp_path / "b.pdf").write_bytes(b"same content")
+    (tmp_path / "c.pdf").write_bytes(b"other content")
+
+    key = cache.make_key(tmp_path / "a.pdf", "PDFReader")
+    assert cache.make_key(str(tmp_path / "b.pdf"), "PDFReader") == key
+    assert cache.make_key(tmp_path / "c.pdf", "PDFReader") != key
+    assert cache.make_key(tmp_path / "a.pdf", "PDFMinerReader") != key
+    assert cache.make_key(tmp_path / "a.pdf", "PDFReader", {"x": 1}) != key
+
+    with open(tmp_path / "a.pdf", "rb") as f:
+        assert cache.make_key(f, "PDFReader") == key
+        assert f.tell() == 0
+
+
+def test_get_put(tmp_path: Path) -> None:
+    cache = ExtractionCache(tmp_path)
+    pages = [{"text": "page 1", "metadata": {"page_label": "1"}}]
+    assert cache.get("key") is None
+    cache.put("key", pages)
+    assert cache.get("key") == pages
+
+
+def test_lru_eviction(tmp_path: Path) -> None:
+    page = [{"text": "x" * 100, "metadata": {}}]
+    cache = ExtractionCache(tmp_path, max_size=300)
+    cache.put("first", page)
+    cache.put("second", page)
+    os.utime(tmp_path / "first.json", (0, 0))
+    os.utime(tmp_path / "second.json", (1, 1))
+
+    # reading an entry marks it as recently used
+    assert cache.get("first") == page
+    cache.put("third", page)
+    assert cache.get("second") is None
+    assert cache.get("first") == page
+    assert cache.get("third") == page
+
+
+def test_put_scans_the_directory_once(tmp_path: Path) -> None:
+    cache = ExtractionCache(tmp_path)
+    scans = []
+    scan = cache._scan
+    cache._scan = lambda: scans.append(1) or scan()
+
+    for i in range(10):
+        cache.put(f"key{i}", [{"text": f"page {i}", "metadata": {}}])
+
+    assert len(scans) == 1
+    assert cache._size == sum(entry.stat().st_size for entry in tmp_path.iterdir())
+
+
+def test_put_many_evicts_once(tmp_path: Path) -> None:
+    page = [{"text": "x" * 100, "metadata": {}}]
+    cache = ExtractionCache(tmp_path, max_size=300)
+    evictions = []
+    evict = cache._evict
+    cache._evict = lambda: evictions.append(1) or evict()
+
+    cache.put_many([(f"key{i}", page) for i in range(10)])
+
+    assert len(evictions) == 1
+    assert cache._size <= 300 * 0.9
+    assert cache._size == sum(entry.stat().st_size for entry in tmp_path.iterdir())
+
+
+def test_digest_key(tmp_path: Path) -> None:
+    cache = ExtractionCache(tmp_path)
+    key = cache.make_digest_key("abc", "PptxReader")
+
+    assert cache.make_digest_key("abc", "PptxReader", {}) == key
+    assert cache.make_digest_key("abd", "PptxReader") != key
+    assert cache.make_digest_key("abc", "PDFReader") != key
+    assert cache.make_digest_key("abc", "PptxReader", {"x": 1}) != key
+
+
+@pytest.mark.skipif(find_spec("pypdf") is None, reason="pypdf is not installed")
+def test_pdf_reader_is_served_from_cache(tmp_path: Path) -> None:
+    import pypdf
+
+    from llama_hub.file.pdf.base import PDFReader
+
+    pdf_path = Path(__file__).parent / "pdf" / "multipage.pdf"
+    reader = PDFReader(cache=ExtractionCache(tmp_path))
+    documents = reader.load_data(pdf_path)
+
+    with patch.object(pypdf, "PdfReader", side_effect=AssertionError):
+        cached_documents = reader.load_data(pdf_path)
+
+    assert len(list(tmp_path.iterdir())) == 1
+    assert [(d.text, d.extra_info) for d in cached_documents] == [
+        (d.text, d.extra_info) for d in documents
+    ]
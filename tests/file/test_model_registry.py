@@ -0,0 +1,45 @@
+from llama_hub.file.model_registry import clear_pretrained, get_pretrained
+
+
+class DummyProcessor:
+    loads = 0
+
+    @classmethod
+    def from_pretrained(cls, checkpoint):
+        cls.loads += 1
+        return cls()
+
+
+class DummyModel:
+    loads = 0
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    @classmethod
+    def from_pretrained(cls, checkpoint, **kwargs):
+        cls.loads += 1
+        return cls(**kwargs)
+
+
+def test_get_pretrained_loads_once():
+    clear_pretrained()
+
+    processor, model = get_pretrained(DummyProcessor, DummyModel, "checkpoint")
+    assert get_pretrained(DummyProcessor, DummyModel, "checkpoint") == (
+        processor,
+        model,
+    )
+    assert DummyProcessor.loads == 1
+    assert DummyModel.loads == 1
+
+    # other model kwargs are another model
+    _, other_model = get_pretrained(
+        DummyProcessor, DummyModel, "checkpoint", torch_dtype="float16"
+    )
+    assert other_model is not model
+    assert other_model.kwargs == {"torch_dtype": "float16"}
+
+    clear_pretrained()
+    _, reloaded_model = get_pretrained(DummyProcessor, DummyModel, "checkpoint")
+    assert reloaded_model is not model
@@ -0,0 +1,116 @@
+import gc
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from llama_hub.file.unstructured.base import _parse_elements
+
+
+class Element(SimpleNamespace):
+    def __str__(self) -> str:
+        return self.text
+
+
+def make_elements():
+    return [
+        Element(
+            text=f"Element  {i}\n text",
+            metadata=SimpleNamespace(
+                filename="page.html",
+                page_number=i,
+                coordinates=object(),
+                parent_id="parent",
+                languages=None,
+            ),
+        )
+        for i in range(3)
+    ]
+
+
+def test_parse_elements_joined():
+    assert _parse_elements(make_elements(), False, None) == [
+        ("Element 0 text\n\nElement 1 text\n\nElement 2 text", {})
+    ]
+
+
+def test_parse_elements_split():
+    parsed = _parse_elements(make_elements(), True, None)
+    assert [metadata for _, metadata in parsed] == [
+        {"filename": "page.html", "page_number": i, "languages": None} for i in range(3)
+    ]
+
+
+def test_parse_elements_metadata_fields():
+    parsed = _parse_elements(
+        make_elements(), True, ["page_number", "languages", "missing"]
+    )
+    assert parsed == [(f"Element  {i}\n text", {"page_number": i}) for i in range(3)]
+
+
+class InlinePool:
+    """Runs the tasks of a pool in the current process."""
+
+    def __init__(self, processes, initializer):
+        self.state = "running"
+
+    def imap(self, func, iterable, chunksize=1):
+        return map(func, iterable)
+
+    def close(self):
+        self.state = "closed"
+
+    def join(self):
+        pass
+
+    def terminate(self):
+        self.state = "terminated"
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    from llama_hub.file.unstructured import base as unstructured_base
+
+    pools = []
+
+    class Context:
+        def Pool(self, **kwargs):
+            pools.append(InlinePool(**kwargs))
+            return pools[-1]
+
+    nltk_mock = type(sys)("nltk")
+    nltk_mock.download = lambda name: None
+    monkeypatch.setitem(sys.modules, "nltk", nltk_mock)
+    monkeypatch.setattr(
+        unstructured_base.multiprocessing, "get_context", lambda _: Context()
+    )
+    monkeypatch.setattr(
+        unstructured_base, "_partition", lambda file, *args: make_elements()
+    )
+    return pools
+
+
+def test_load_data_batch_reuses_pool(pools):
+    from llama_hub.file.unstructured.base import UnstructuredReader
+
+    with UnstructuredReader(num_workers=2) as reader:
+        for _ in range(2):
+            documents = reader.load_data_batch([Path("a.html"), Path("b.html")])
+            assert [d.extra_info["filename"] for d in documents] == [
+                "a.html",
+                "b.html",
+            ]
+
+    assert [pool.state for pool in pools] == ["closed"]
+
+
+def test_pool_is_stopped_when_reader_is_dropped(pools):
+    from llama_hub.file.unstructured.base import UnstructuredReader
+
+    reader = UnstructuredReader(num_workers=2)
+    reader.load_data_batch([Path("a.html")])
+    del reader
+    gc.collect()
+
+    assert [pool.state for pool in pools] == ["terminated"]
@@ -62,3 +62,21 @@ def test_load_data_xml(xml_file):
     assert len(documents) == 1
     assert "Apple" in documents[0].text
     assert "Garden City" in documents[0].text
+
+
+@pytest.mark.parametrize("tree_level_split", [0, 1, 2, 3])
+def test_lazy_load_data_matches_load_data(xml_file, tree_level_split):
+    reader = XMLReader(tree_level_split)
+    documents = list(reader.lazy_load_data(xml_file))
+    assert [d.text for d in documents] == [d.text for d in reader.load_data(xml_file)]
+
+
+def test_lazy_load_data_mixed_content(tmp_path):
+    file = tmp_path / "test.xml"
+    file.write_text(
+        '<root xmlns:x="urn:x"><p>one <b>bold</b> tail</p> text <x:q>two</x:q></root>'
+    )
+    reader = XMLReader(2)
+    documents = list(reader.lazy_load_data(file))
+    assert [d.text for d in documents] == [d.text for d in reader.load_data(file)]
+    assert documents[0].text == "<b>bold</b> tail"
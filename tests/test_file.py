@@ -1,8 +1,11 @@
 """Test file reader."""
+import os
 import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+from llama_index.readers.schema.base import Document
 
 from llama_hub.file.base import SimpleDirectoryReader
 
@@ -206,3 +209,178 @@ def test_file_metadata() -> None:
 
         for d in documents:
             assert d.extra_info is not None and d.extra_info["author"] == test_author
+
+
+def test_num_workers() -> None:
+    """Test parallel parsing keeps file order and reports failed files."""
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(1, 6):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+
+        reader = SimpleDirectoryReader(tmp_dir)
+        serial_documents = reader.load_data()
+        parallel_documents = reader.load_data(num_workers=2)
+        assert [d.text for d in parallel_documents] == [
+            d.text for d in serial_documents
+        ]
+        assert [d.text for d in parallel_documents] == [
+            "test1",
+            "test2",
+            "test3",
+            "test4",
+            "test5",
+        ]
+
+        # a file that disappears after discovery fails without stopping the batch
+        Path(f"{tmp_dir}/test3.txt").unlink()
+        documents = reader.load_data(num_workers=2)
+        assert [d.text for d in documents] == ["test1", "test2", "test4", "test5"]
+        assert list(reader.failed_files) == [str(Path(tmp_dir) / "test3.txt")]
+
+
+def test_manifest() -> None:
+    """Test that a manifest only lets new or modified files be parsed."""
+    with TemporaryDirectory() as tmp_dir, TemporaryDirectory() as manifest_dir:
+        data_dir = Path(tmp_dir)
+        manifest_path = f"{manifest_dir}/manifest.json"
+        for i in range(1, 4):
+            (data_dir / f"test{i}.txt").write_text(f"test{i}")
+
+        reader = SimpleDirectoryReader(tmp_dir, manifest_path=manifest_path)
+        documents = reader.load_data()
+        assert [d.text for d in documents] == ["test1", "test2", "test3"]
+        assert reader.deleted_files == []
+
+        # nothing changed
+        reader = SimpleDirectoryReader(tmp_dir, manifest_path=manifest_path)
+        assert reader.load_data() == []
+
+        # one modified, one deleted, one added
+        (data_dir / "test2.txt").write_text("test2 modified")
+        (data_dir / "test3.txt").unlink()
+        (data_dir / "test4.txt").write_text("test4")
+        reader = SimpleDirectoryReader(tmp_dir, manifest_path=manifest_path)
+        documents = reader.load_data()
+        assert [d.text for d in documents] == ["test2 modified", "test4"]
+        assert reader.deleted_files == [str(data_dir / "test3.txt")]
+
+        # with content hashes, touching a file does not trigger a re-parse
+        reader = SimpleDirectoryReader(
+            tmp_dir, manifest_path=manifest_path, manifest_hash=True
+        )
+        assert reader.load_data() == []
+        stat = (data_dir / "test1.txt").stat()
+        os.utime(data_dir / "test1.txt", (stat.st_atime, stat.st_mtime + 10))
+        reader = SimpleDirectoryReader(
+            tmp_dir, manifest_path=manifest_path, manifest_hash=True
+        )
+        assert reader.load_data() == []
+
+
+def test_iter_data() -> None:
+    """Test lazily loading documents file by file and in batches."""
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(1, 6):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+
+        reader = SimpleDirectoryReader(tmp_dir)
+        per_file = [[d.text for d in docs] for docs in reader.iter_data()]
+        assert per_file == [["test1"], ["test2"], ["test3"], ["test4"], ["test5"]]
+
+        batches = [[d.text for d in docs] for docs in reader.iter_data(batch_size=2)]
+        assert batches == [["test1", "test2"], ["test3", "test4"], ["test5"]]
+
+        batches = [
+            [d.text for d in docs]
+            for docs in reader.iter_data(num_workers=2, batch_size=3)
+        ]
+        assert batches == [["test1", "test2", "test3"], ["test4", "test5"]]
+
+
+def test_reader_cache(monkeypatch: Any) -> None:
+    """Test that readers given by name are only resolved once."""
+    import llama_hub.file.base as file_base
+
+    class TextReader:
+        def load_data(self, file: Path, extra_info: Any = None) -> List[Document]:
+            return [Document(text=file.read_text(), extra_info=extra_info or {})]
+
+    resolved = []
+
+    def resolve_reader(reader: str) -> TextReader:
+        resolved.append(reader)
+        return TextReader()
+
+    monkeypatch.setattr(file_base, "_resolve_reader", resolve_reader)
+
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(1, 4):
+            with open(f"{tmp_dir}/test{i}.md", "w") as f:
+                f.write(f"test{i}")
+            with open(f"{tmp_dir}/test{i}.markdown", "w") as f:
+                f.write(f"test{i}")
+
+        reader = SimpleDirectoryReader(
+            tmp_dir,
+            file_extractor={".md": "TextReader", ".markdown": "TextReader"},
+        )
+        assert len(reader.load_data()) == 6
+        assert len(reader.load_data()) == 6
+        assert resolved == ["TextReader"]
+
+
+def test_include_exclude() -> None:
+    """Test include and exclude glob patterns."""
+    with TemporaryDirectory() as tmp_dir:
+        data_dir = Path(tmp_dir)
+        (data_dir / "docs").mkdir()
+        (data_dir / "node_modules").mkdir()
+        for path in [
+            "test1.md",
+            "test2.txt",
+            "docs/test3.md",
+            "docs/test4.tmp",
+            "node_modules/test5.md",
+        ]:
+            (data_dir / path).write_text(path)
+
+        reader = SimpleDirectoryReader(
+            tmp_dir, recursive=True, exclude=["node_modules", "*.tmp"]
+        )
+        input_file_names = [f.name for f in reader.input_files]
+        assert input_file_names == ["test1.md", "test2.txt", "test3.md"]
+
+        reader = SimpleDirectoryReader(
+            tmp_dir, recursive=True, include=["*.md"], exclude=["node_modules"]
+        )
+        input_file_names = [f.name for f in reader.input_files]
+        assert input_file_names == ["test1.md", "test3.md"]
+
+        reader = SimpleDirectoryReader(tmp_dir, recursive=True, include=["docs/*"])
+        input_file_names = [f.name for f in reader.input_files]
+        assert input_file_names == ["test3.md", "test4.tmp"]
+
+
+def test_num_files_limit_stops_walk(monkeypatch: Any) -> None:
+    """Test that discovery stops descending once the limit is reached."""
+    with TemporaryDirectory() as tmp_dir:
+        data_dir = Path(tmp_dir)
+        (data_dir / "test1.txt").write_text("test1")
+        (data_dir / "test2.txt").write_text("test2")
+        (data_dir / "sub").mkdir()
+        (data_dir / "sub" / "test3.txt").write_text("test3")
+
+        scanned = []
+        scandir = os.scandir
+
+        def counting_scandir(path: Any) -> Any:
+            scanned.append(Path(path))
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        reader = SimpleDirectoryReader(tmp_dir, recursive=True, num_files_limit=2)
+        monkeypatch.undo()
+        assert [f.name for f in reader.input_files] == ["test1.txt", "test2.txt"]
+        assert scanned == [data_dir]
@@ -143,3 +143,24 @@ def test_llama_datasets_library_matches() -> None:
         # make sure that the README file exists
         readme_file = entry_dir / "README.md"
         assert readme_file.exists()
+
+
+def test_registry_matches_libraries(tmp_path: Path) -> None:
+    """Check that the registry indexes every catalog entry."""
+    from llama_hub.utils import CATALOG_PATHS, LoaderRegistry
+
+    registry = LoaderRegistry.from_catalogs()
+    for catalog, library_path in CATALOG_PATHS.items():
+        library_dict = json.load(open(library_path, "r"))
+        assert set(registry.catalogs[catalog]) == set(library_dict)
+        for k, entry in library_dict.items():
+            assert registry.get_id(k, catalog) == entry["id"]
+
+    assert registry.get_module_path("PDFReader") == "llama_hub.file.pdf.base"
+
+    # a precompiled index round-trips to the same registry
+    index_path = tmp_path / "registry_index.json"
+    registry.save_index(index_path)
+    indexed_registry = LoaderRegistry.from_index(index_path)
+    assert indexed_registry is not None
+    assert indexed_registry.catalogs == registry.catalogs
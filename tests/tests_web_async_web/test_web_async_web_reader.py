@@ -1,9 +1,14 @@
+import asyncio
+import socket
+import threading
+import time
 import unittest
+from unittest.mock import patch
 
 import pytest
 from werkzeug.wrappers import Request, Response
 
-from llama_hub.web.async_web.base import AsyncWebPageReader
+from llama_hub.web.async_web.base import AsyncWebPageReader, _retry_after
 
 
 @pytest.fixture(scope="session")
@@ -14,14 +19,26 @@ def httpserver_listen_address():
 TEST_URL = "http://localhost:8888/primary.xml"
 TEST_URL_OTHER = "http://localhost:8888/other.xml"
 TEST_URL_ERROR = "http://localhost:8888/failme"
+TEST_URL_BUSY = "http://localhost:8888/busy"
 
 
 class TestAsyncWebPageReader(unittest.TestCase):
     def failme_handler(self, response: Request):
         return Response("Boo!", status=500)
 
+    def busy_handler(self, response: Request):
+        # busy for the first request only
+        self.busy_requests += 1
+        if self.busy_requests == 1:
+            return Response("Busy", status=503, headers={"Retry-After": "0"})
+        return Response("Some big data chunk!")
+
     @pytest.fixture(autouse=True)
     def setup(self, httpserver):
+        self.busy_requests = 0
+        httpserver.expect_request("/busy", method="GET").respond_with_handler(
+            self.busy_handler
+        )
         httpserver.expect_request("/other.xml", method="GET").respond_with_data(
             "Some big data chunk!"
         )
@@ -86,3 +103,137 @@ class TestAsyncWebPageReader(unittest.TestCase):
         assert documents[0].extra_info["Source"] == "http://localhost:8888/primary.xml"
         assert documents[1].text == "Some big data chunk!"
         assert documents[1].extra_info["Source"] == "http://localhost:8888/other.xml"
+
+    def test_async_web_reader_lazy_load_data(self):
+        reader = AsyncWebPageReader(limit=1)
+
+        documents = list(
+            reader.lazy_load_data(urls=[TEST_URL, TEST_URL_ERROR, TEST_URL_OTHER])
+        )
+
+        assert [document.extra_info["Source"] for document in documents] == [
+            TEST_URL,
+            TEST_URL_OTHER,
+        ]
+
+    def test_async_web_reader_lazy_load_data_stop_early(self):
+        reader = AsyncWebPageReader()
+
+        documents = reader.lazy_load_data(urls=[TEST_URL, TEST_URL_OTHER])
+        assert next(documents).text == "Some big data chunk!"
+        documents.close()
+
+    def test_async_web_reader_alazy_load_data(self):
+        reader = AsyncWebPageReader(html_to_text=True, num_workers=1)
+
+        async def load():
+            return [
+                document
+                async for document in reader.alazy_load_data(
+                    urls=[TEST_URL, TEST_URL_OTHER]
+                )
+            ]
+
+        documents = asyncio.run(load())
+
+        assert sorted(document.extra_info["Source"] for document in documents) == [
+            TEST_URL_OTHER,
+            TEST_URL,
+        ]
+        assert documents[0].text == "Some big data chunk!\n\n"
+
+    def test_async_web_reader_alazy_load_data_from_async_iterable(self):
+        reader = AsyncWebPageReader(limit=1)
+        taken = []
+
+        async def urls():
+            for url in [TEST_URL, TEST_URL_ERROR, TEST_URL, TEST_URL_OTHER]:
+                taken.append(url)
+                yield url
+
+        async def load():
+            return [
+                (i, document.extra_info["Source"])
+                async for i, document in reader.alazy_load_indexed_data(urls())
+            ]
+
+        # urls are indexed in the order they come, duplicates included
+        assert asyncio.run(load()) == [(0, TEST_URL), (3, TEST_URL_OTHER)]
+        assert len(taken) == 4
+
+    def test_async_web_reader_retry(self):
+        reader = AsyncWebPageReader(limit_per_host=1, timeout=10)
+
+        documents = reader.load_data(urls=[TEST_URL_BUSY, TEST_URL])
+
+        assert self.busy_requests == 2
+        assert [document.text for document in documents] == [
+            "Some big data chunk!",
+            "Some big data chunk!",
+        ]
+
+    def test_async_web_reader_no_retry(self):
+        reader = AsyncWebPageReader(max_retries=0)
+
+        documents = reader.load_data(urls=[TEST_URL_BUSY, TEST_URL])
+
+        assert self.busy_requests == 1
+        assert len(documents) == 1
+
+
+@pytest.fixture
+def silent_url():
+    """Url of a server that accepts connections and never responds."""
+    server = socket.socket()
+    server.bind(("localhost", 0))
+    server.listen()
+    connections = []
+    stop = threading.Event()
+
+    def accept():
+        server.settimeout(0.1)
+        while not stop.is_set():
+            try:
+                connections.append(server.accept()[0])
+            except socket.timeout:
+                pass
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.getsockname()[1]}/"
+    stop.set()
+    thread.join()
+    for connection in connections:
+        connection.close()
+    server.close()
+
+
+def test_async_web_reader_timeout(silent_url):
+    reader = AsyncWebPageReader(timeout=0.2, max_retries=1, backoff_factor=0)
+
+    start = time.monotonic()
+    with pytest.raises(ValueError, match="not a valid url"):
+        reader.load_data(urls=[silent_url])
+    assert time.monotonic() - start < 5
+
+
+def test_async_web_reader_default_timeout(silent_url):
+    import aiohttp
+
+    # without a timeout, requests keep aiohttp's default one
+    with patch.object(
+        aiohttp.client, "DEFAULT_TIMEOUT", aiohttp.ClientTimeout(total=0.2)
+    ):
+        reader = AsyncWebPageReader(max_retries=0)
+
+        start = time.monotonic()
+        with pytest.raises(ValueError, match="not a valid url"):
+            reader.load_data(urls=[silent_url])
+        assert time.monotonic() - start < 5
+
+
+def test_retry_after():
+    assert _retry_after(None) is None
+    assert _retry_after("2") == 2.0
+    assert _retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert _retry_after("soon") is None
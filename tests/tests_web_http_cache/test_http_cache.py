@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from werkzeug.wrappers import Request, Response
+
+from llama_hub.web.http_cache import HTTPCache
+
+ETAG = '"v1"'
+
+
+@pytest.fixture(scope="session")
+def httpserver_listen_address():
+    return ("localhost", 8888)
+
+
+@pytest.fixture
+def pages(httpserver):
+    requests_seen = []
+
+    def etag_handler(request: Request):
+        requests_seen.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == ETAG:
+            return Response(status=304)
+        return Response("Some big data chunk!", headers={"ETag": ETAG})
+
+    httpserver.expect_request("/etag").respond_with_handler(etag_handler)
+    httpserver.expect_request("/plain").respond_with_data("No validators")
+    return requests_seen
+
+
+def test_fetch_revalidates(tmp_path, pages, httpserver):
+    cache = HTTPCache(tmp_path)
+    url = httpserver.url_for("/etag")
+
+    first = cache.fetch(url)
+    second = cache.fetch(url)
+
+    assert first.text == second.text == "Some big data chunk!"
+    assert "If-None-Match" not in pages[0]
+    assert pages[1]["If-None-Match"] == ETAG
+    assert second.url == url
+
+
+def test_afetch_revalidates(tmp_path, pages, httpserver):
+    import aiohttp
+
+    cache = HTTPCache(tmp_path)
+    url = httpserver.url_for("/etag")
+
+    async def fetch_twice():
+        async with aiohttp.ClientSession() as session:
+            return [await cache.afetch(url, session) for _ in range(2)]
+
+    first, second = asyncio.run(fetch_twice())
+
+    assert first.text == second.text == "Some big data chunk!"
+    assert pages[1]["If-None-Match"] == ETAG
+
+
+def test_fetch_refetches_evicted_entry(tmp_path, pages, httpserver):
+    cache = HTTPCache(tmp_path)
+    url = httpserver.url_for("/etag")
+
+    cache.fetch(url)
+    # the server answers 304 but the entry is gone
+    for entry in tmp_path.iterdir():
+        entry.unlink()
+    cache.request_headers = lambda url: {"If-None-Match": ETAG}
+
+    assert cache.fetch(url).text == "Some big data chunk!"
+    assert len(pages) == 3
+
+
+def test_responses_without_validators_are_not_stored(tmp_path, pages, httpserver):
+    cache = HTTPCache(tmp_path)
+
+    cache.fetch(httpserver.url_for("/plain"))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_evicts_least_recently_used(tmp_path, pages, httpserver):
+    cache = HTTPCache(tmp_path, max_size=1)
+    url = httpserver.url_for("/etag")
+
+    response = cache.fetch(url)
+
+    assert response.text == "Some big data chunk!"
+    assert cache.get(url) is None
@@ -1,12 +1,41 @@
+import gzip
+import threading
 import unittest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 import pytest
 from llama_index.readers.schema.base import Document
+from werkzeug.wrappers import Response
 
-from llama_hub.web.sitemap.base import SitemapReader
+from llama_hub.web.sitemap.base import SitemapReader, _parse_lastmod
 
-MOCK_URL = "https://gpt-index.readthedocs.io/sitemap.xml"
+MOCK_URL = "http://localhost:8888/sitemap.xml"
+MOCK_INDEX_URL = "http://localhost:8888/sitemap_index.xml"
+
+SITEMAP_INDEX = """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap>
+    <loc>http://localhost:8888/sitemap.xml.gz</loc>
+    <lastmod>2023-06-21T16:31:55+00:00</lastmod>
+  </sitemap>
+  <sitemap>
+    <loc>http://localhost:8888/old_sitemap.xml</loc>
+    <lastmod>2023-01-01</lastmod>
+  </sitemap>
+</sitemapindex>
+"""
+
+OLD_SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.com/old</loc></url>
+</urlset>
+"""
+
+
+@pytest.fixture(scope="session")
+def httpserver_listen_address():
+    return ("localhost", 8888)
 
 
 def get_sitemapdata():
@@ -14,15 +43,39 @@ def get_sitemapdata():
     return f.read()
 
 
-def dummy_load_pages(urls: str):
-    documents = []
-    for u in urls:
-        doc = Document(text="Bla", extra_info={"Source": u})
-        documents.append(doc)
-    return documents
+# urls given to the page loader, and the ones that fail to load
+loaded_urls = []
+failing_urls = set()
+
+
+async def dummy_alazy_load_indexed_data(self, urls):
+    i = 0
+    async for url in urls:
+        loaded_urls.append(url)
+        if url not in failing_urls:
+            yield i, Document(text="Bla", extra_info={"Source": url})
+        i += 1
+
+
+PATCH_LOADER = "llama_hub.web.async_web.base.AsyncWebPageReader.alazy_load_indexed_data"
 
 
 class TestSitemapReader(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def setup(self, httpserver):
+        loaded_urls.clear()
+        failing_urls.clear()
+        self.httpserver = httpserver
+        httpserver.expect_request("/sitemap.xml").respond_with_data(get_sitemapdata())
+        httpserver.expect_request("/sitemap.xml.gz").respond_with_data(
+            gzip.compress(get_sitemapdata().encode("utf-8"))
+        )
+        httpserver.expect_request("/sitemap_index.xml").respond_with_data(SITEMAP_INDEX)
+        httpserver.expect_request("/old_sitemap.xml").respond_with_data(OLD_SITEMAP)
+
+    def requested_paths(self):
+        return [request.path for request, _ in self.httpserver.log]
+
     def test_sitemap_reader_init(self):
         # test w/o args
         SitemapReader()
@@ -39,49 +92,195 @@ class TestSitemapReader(unittest.TestCase):
         ):
             sitemap_reader.load_data()
 
-    @patch("llama_hub.web.async_web.base.AsyncWebPageReader.load_data")
-    def test_sitemap_reader_load_data(self, mock_load_data):
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            sitemap_reader = SitemapReader()
-
-            # mock sitemap call
-            mock_response = mock_urlopen.return_value
-            mock_response.read.return_value = get_sitemapdata()
-
-            mock_load_data.side_effect = dummy_load_pages
-
-            documents = sitemap_reader.load_data(sitemap_url=MOCK_URL)
-
-            mock_urlopen.assert_called_once_with(
-                "https://gpt-index.readthedocs.io/sitemap.xml"
-            )
-            mock_response.read.assert_called_once()
-            assert mock_load_data.call_count == 1
-            assert len(documents) == 38
-
-    @patch("llama_hub.web.async_web.base.AsyncWebPageReader.load_data")
-    def test_sitemap_reader_load_data_with_filter(self, mock_load_data):
-        with patch("urllib.request.urlopen") as mock_urlopen:
-            sitemap_reader = SitemapReader()
-
-            # mock sitemap call
-            mock_response = mock_urlopen.return_value
-            mock_response.read.return_value = get_sitemapdata()
-
-            mock_load_data.side_effect = dummy_load_pages
-
-            documents = sitemap_reader.load_data(
-                sitemap_url=MOCK_URL,
-                filter="https://gpt-index.readthedocs.io/en/latest/",
-            )
-
-            mock_urlopen.assert_called_once_with(
-                "https://gpt-index.readthedocs.io/sitemap.xml"
-            )
-            mock_response.read.assert_called_once()
-            assert mock_load_data.call_count == 1
-            assert len(documents) == 1
-            assert (
-                documents[0].extra_info["Source"]
-                == "https://gpt-index.readthedocs.io/en/latest/"
-            )
+    @patch(PATCH_LOADER, new=dummy_alazy_load_indexed_data)
+    def test_sitemap_reader_load_data(self):
+        sitemap_reader = SitemapReader()
+
+        documents = sitemap_reader.load_data(sitemap_url=MOCK_URL)
+
+        assert self.requested_paths() == ["/sitemap.xml"]
+        assert len(loaded_urls) == 38
+        assert len(documents) == 38
+
+    @patch(PATCH_LOADER, new=dummy_alazy_load_indexed_data)
+    def test_sitemap_reader_load_data_with_filter(self):
+        sitemap_reader = SitemapReader()
+
+        documents = sitemap_reader.load_data(
+            sitemap_url=MOCK_URL,
+            filter="https://gpt-index.readthedocs.io/en/latest/",
+        )
+
+        assert self.requested_paths() == ["/sitemap.xml"]
+        assert loaded_urls == ["https://gpt-index.readthedocs.io/en/latest/"]
+        assert len(documents) == 1
+        assert (
+            documents[0].extra_info["Source"]
+            == "https://gpt-index.readthedocs.io/en/latest/"
+        )
+
+    @patch(PATCH_LOADER, new=dummy_alazy_load_indexed_data)
+    def test_sitemap_reader_load_data_from_index(self):
+        sitemap_reader = SitemapReader()
+
+        documents = sitemap_reader.load_data(sitemap_url=MOCK_INDEX_URL)
+
+        assert sorted(self.requested_paths()) == [
+            "/old_sitemap.xml",
+            "/sitemap.xml.gz",
+            "/sitemap_index.xml",
+        ]
+        assert len(documents) == 39
+        assert documents[-1].extra_info["Source"] == "https://example.com/old"
+        assert sitemap_reader.watermark == datetime(
+            2023, 6, 21, 16, 31, 55, 65748, tzinfo=timezone.utc
+        )
+
+    @patch(PATCH_LOADER, new=dummy_alazy_load_indexed_data)
+    def test_sitemap_reader_load_data_since(self):
+        sitemap_reader = SitemapReader()
+
+        documents = sitemap_reader.load_data(
+            sitemap_url=MOCK_INDEX_URL, since="2023-06-20T00:00:00Z"
+        )
+
+        # the old sitemap did not change since then
+        assert "/old_sitemap.xml" not in self.requested_paths()
+        assert len(documents) == 4
+
+        documents = sitemap_reader.load_data(
+            sitemap_url=MOCK_INDEX_URL, since=sitemap_reader.watermark
+        )
+
+        assert len(documents) == 0
+
+    @patch(PATCH_LOADER, new=dummy_alazy_load_indexed_data)
+    def test_sitemap_reader_watermark_stops_before_failed_pages(self):
+        sitemap_reader = SitemapReader()
+        failing_urls.add("https://gpt-index.readthedocs.io/en/v0.6.30/")
+
+        documents = sitemap_reader.load_data(sitemap_url=MOCK_URL)
+
+        assert len(documents) == 37
+        # the latest page loaded, but the next run must retry the failed one
+        assert sitemap_reader.watermark == datetime(
+            2023, 6, 21, 15, 16, 7, 478537, tzinfo=timezone.utc
+        )
+        failing_urls.clear()
+        documents = sitemap_reader.load_data(
+            sitemap_url=MOCK_URL, since=sitemap_reader.watermark
+        )
+        assert [document.extra_info["Source"] for document in documents] == [
+            "https://gpt-index.readthedocs.io/en/latest/",
+            "https://gpt-index.readthedocs.io/en/v0.6.30/",
+        ]
+
+    @patch(PATCH_LOADER, new=dummy_alazy_load_indexed_data)
+    def test_sitemap_reader_watermark_stops_before_failed_sitemaps(self):
+        self.httpserver.clear_all_handlers()
+        self.httpserver.expect_request("/sitemap_index.xml").respond_with_data(
+            SITEMAP_INDEX
+        )
+        self.httpserver.expect_request("/old_sitemap.xml").respond_with_data(
+            OLD_SITEMAP.replace("</loc>", "</loc><lastmod>2023-01-01</lastmod>")
+        )
+        self.httpserver.expect_request("/sitemap.xml.gz").respond_with_data(
+            "Unavailable", status=503
+        )
+        sitemap_reader = SitemapReader()
+
+        documents = sitemap_reader.load_data(
+            sitemap_url=MOCK_INDEX_URL, since="2022-01-01"
+        )
+
+        assert [document.extra_info["Source"] for document in documents] == [
+            "https://example.com/old"
+        ]
+        assert sitemap_reader.watermark == datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+    @patch(PATCH_LOADER, new=dummy_alazy_load_indexed_data)
+    def test_sitemap_reader_watermark_kept_when_sitemap_without_lastmod_fails(self):
+        self.httpserver.clear_all_handlers()
+        self.httpserver.expect_request("/sitemap_index.xml").respond_with_data(
+            SITEMAP_INDEX.replace("<lastmod>2023-06-21T16:31:55+00:00</lastmod>", "")
+        )
+        self.httpserver.expect_request("/sitemap.xml.gz").respond_with_data(
+            "Unavailable", status=503
+        )
+        self.httpserver.expect_request("/old_sitemap.xml").respond_with_data(
+            OLD_SITEMAP.replace("</loc>", "</loc><lastmod>2023-01-01</lastmod>")
+        )
+        sitemap_reader = SitemapReader()
+
+        documents = sitemap_reader.load_data(
+            sitemap_url=MOCK_INDEX_URL, since="2022-01-01"
+        )
+
+        # any page may be in the sitemap that failed
+        assert len(documents) == 1
+        assert sitemap_reader.watermark == datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+    def test_sitemap_reader_loads_pages_while_parsing(self):
+        # the second sitemap only answers once a page of the first one loads
+        page_loading = threading.Event()
+
+        def slow_sitemap(request):
+            if page_loading.wait(timeout=5):
+                return Response(OLD_SITEMAP)
+            return Response("Timed out", status=500)
+
+        async def alazy_load_indexed_data(self, urls):
+            i = 0
+            async for url in urls:
+                page_loading.set()
+                yield i, Document(text="Bla", extra_info={"Source": url})
+                i += 1
+
+        self.httpserver.clear_all_handlers()
+        self.httpserver.expect_request("/sitemap_index.xml").respond_with_data(
+            SITEMAP_INDEX
+        )
+        self.httpserver.expect_request("/sitemap.xml.gz").respond_with_data(
+            gzip.compress(get_sitemapdata().encode("utf-8"))
+        )
+        self.httpserver.expect_request("/old_sitemap.xml").respond_with_handler(
+            slow_sitemap
+        )
+        sitemap_reader = SitemapReader()
+
+        with patch(PATCH_LOADER, new=alazy_load_indexed_data):
+            documents = sitemap_reader.load_data(sitemap_url=MOCK_INDEX_URL)
+
+        assert len(documents) == 39
+
+
+UTC = timezone.utc
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2023", datetime(2023, 1, 1, tzinfo=UTC)),
+        ("2023-06", datetime(2023, 6, 1, tzinfo=UTC)),
+        ("2023-06-21", datetime(2023, 6, 21, tzinfo=UTC)),
+        ("2023-06-21T16:31Z", datetime(2023, 6, 21, 16, 31, tzinfo=UTC)),
+        ("2023-06-21T16:31:55Z", datetime(2023, 6, 21, 16, 31, 55, tzinfo=UTC)),
+        (
+            "2023-06-21T16:31:55.5+02:00",
+            datetime(
+                2023, 6, 21, 16, 31, 55, 500000, tzinfo=timezone(timedelta(hours=2))
+            ),
+        ),
+        (
+            "2023-06-21T16:31:55.06574812z",
+            datetime(2023, 6, 21, 16, 31, 55, 65748, tzinfo=UTC),
+        ),
+        (" 2023-06-21T16:31:55 ", datetime(2023, 6, 21, 16, 31, 55, tzinfo=UTC)),
+        ("", None),
+        (None, None),
+        ("yesterday", None),
+        ("2023-13", None),
+    ],
+)
+def test_parse_lastmod(value, expected):
+    assert _parse_lastmod(value) == expected
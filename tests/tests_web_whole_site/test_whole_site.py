@@ -0,0 +1,162 @@
+from importlib.util import find_spec
+
+import pytest
+
+selenium_available = find_spec("selenium") is not None
+requests_available = find_spec("requests") is not None
+
+pytestmark = pytest.mark.skipif(
+    not (selenium_available and requests_available),
+    reason="selenium and requests are not installed",
+)
+
+TEXT = "Some big data chunk! " * 20
+
+
+def page(body: str) -> str:
+    return f"<html><head><title>Site</title></head><body>{body}</body></html>"
+
+
+@pytest.fixture(scope="session")
+def httpserver_listen_address():
+    return ("localhost", 8888)
+
+
+@pytest.fixture
+def site(httpserver):
+    html = {"content_type": "text/html"}
+    httpserver.expect_request("/docs/").respond_with_data(
+        page(
+            f"<p>{TEXT}</p>"
+            '<a href="a.html">A</a>'
+            '<a href="/docs/a.html#section">A again</a>'
+            '<a href="HTTP://LOCALHOST:8888/docs/b.html">B</a>'
+            '<a href="/blog/">Out of prefix</a>'
+        ),
+        **html,
+    )
+    httpserver.expect_request("/docs/a.html").respond_with_data(
+        page(f"<p>{TEXT}</p><script>var x = 1;</script>"), **html
+    )
+    httpserver.expect_request("/docs/b.html").respond_with_data(
+        page('<div id="app"></div><a href="/docs/c.html">C</a>'), **html
+    )
+    httpserver.expect_request("/docs/c.html").respond_with_data(
+        page(f"<p>{TEXT}</p>"), **html
+    )
+    return httpserver.url_for("/docs/")
+
+
+class FakeDriver:
+    """Renders every page as the same text, without a browser."""
+
+    def __init__(self):
+        self.urls = []
+        self.quit_called = False
+
+    def get(self, url):
+        self.urls.append(url)
+
+    def find_element(self, by, value):
+        class Body:
+            text = "Rendered by JavaScript"
+
+        return Body()
+
+    def execute_script(self, script):
+        return []
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_normalize_url():
+    from llama_hub.web.whole_site.base import normalize_url
+
+    assert normalize_url("HTTPS://Example.com:443#top") == "https://example.com/"
+    assert (
+        normalize_url("http://example.com:8080/a?b=1#c")
+        == "http://example.com:8080/a?b=1"
+    )
+
+
+def test_normalize_prefix():
+    from llama_hub.web.whole_site.base import normalize_prefix
+
+    assert (
+        normalize_prefix("HTTPS://Docs.Example.com:443/Guide")
+        == "https://docs.example.com/Guide"
+    )
+    # no slash is added, so other hosts or paths sharing the prefix match
+    assert normalize_prefix("https://docs.example.com") == "https://docs.example.com"
+    assert normalize_prefix("docs") == "docs"
+
+
+def test_load_data_with_http(site):
+    from llama_hub.web.whole_site.base import WholeSiteReader
+
+    reader = WholeSiteReader(
+        prefix=site, use_http=True, num_drivers=2, num_workers=4, delay=0
+    )
+    drivers = []
+
+    def setup_driver():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    reader.setup_driver = setup_driver
+
+    documents = reader.load_data(base_url=site)
+
+    assert [document.extra_info["URL"] for document in documents] == [
+        site,
+        site + "a.html",
+        "http://LOCALHOST:8888/docs/b.html",
+    ]
+    # the title is not part of the text of the page
+    assert "Site" not in documents[0].text
+    assert documents[1].text == TEXT.strip()
+    # only the page rendered by JavaScript went through a browser
+    assert documents[2].text == "Rendered by JavaScript"
+    assert [url for driver in drivers for url in driver.urls] == [
+        "http://LOCALHOST:8888/docs/b.html"
+    ]
+    assert all(driver.quit_called for driver in drivers)
+
+
+def test_load_data_max_depth(site):
+    from llama_hub.web.whole_site.base import WholeSiteReader
+
+    reader = WholeSiteReader(prefix=site, max_depth=0, use_http=True, delay=0)
+
+    documents = reader.load_data(base_url=site)
+
+    assert len(documents) == 1
+
+
+def test_load_data_partial_prefix(site):
+    from llama_hub.web.whole_site.base import WholeSiteReader
+
+    reader = WholeSiteReader(
+        prefix="HTTP://localhost:8888/docs/a", use_http=True, delay=0
+    )
+
+    documents = reader.load_data(base_url=site)
+
+    assert [document.extra_info["URL"] for document in documents] == [
+        site,
+        site + "a.html",
+    ]
+
+
+def test_load_data_quits_lazily_started_driver(site):
+    from llama_hub.web.whole_site.base import WholeSiteReader
+
+    reader = WholeSiteReader(prefix=site, max_depth=0, use_http=True, delay=0)
+    reader.setup_driver = FakeDriver
+    driver = reader.driver
+
+    reader.load_data(base_url=site)
+
+    assert driver.quit_called
+    assert reader._driver is None